@@ -15,19 +15,38 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_TOKEN
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 
+from .cache import snapshot_store
 from .const import CONF_DEVICE_ID, DOMAIN, PLATFORMS
 from .coordinator import NetlinkDataUpdateCoordinator
 from .entity import _get_suggested_area
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the NetLink services."""
+    async_setup_services(hass)
+    return True
+
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options or config entry updates."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle options or config entry updates.
+
+    Tuning options are applied to the running coordinator; other changes
+    reload the entry.
+    """
+    coordinator: NetlinkDataUpdateCoordinator = entry.runtime_data
+    if coordinator.requires_reload():
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options()
 
 
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -76,8 +95,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     try:
-        # Setup WebSocket connection and fetch initial data
-        await coordinator.async_setup()
+        # Start from the cached snapshot when there is one; otherwise set up the
+        # WebSocket connection and fetch initial data before adding entities.
+        if not await coordinator.async_setup_from_cache():
+            await coordinator.async_setup()
     except NetlinkAuthenticationError as err:
         raise ConfigEntryAuthFailed(
             translation_domain=DOMAIN,
@@ -150,3 +171,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached snapshot of a deleted config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
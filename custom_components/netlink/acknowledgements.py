@@ -0,0 +1,143 @@
+"""Command acknowledgement latency for NetLink entities."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+from typing import Any
+
+from pynetlink import Desk, Display
+
+from .const import ACKNOWLEDGEMENT_BUCKETS, ACKNOWLEDGEMENT_SAMPLES
+
+
+def command_type(key: str, field: str) -> str:
+    """Return the command type of a state field, e.g. ``display_power``."""
+    return f"desk_{field}" if key == "desk" else f"display_{field}"
+
+
+def _reached(received: Any, requested: Any) -> bool:
+    """Return whether a received state value is the requested one.
+
+    Numbers match within one unit, because the desk reports whole
+    centimetres while its target height may have a fraction.
+    """
+    if isinstance(received, (int, float)) and isinstance(requested, (int, float)):
+        return abs(received - requested) < 1
+    return received == requested
+
+
+class LatencyHistogram:
+    """Command-to-confirmation latency of one command type.
+
+    Bucket counts cover every confirmation; percentiles are computed from the
+    most recent ``ACKNOWLEDGEMENT_SAMPLES`` latencies, so memory stays bounded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(ACKNOWLEDGEMENT_BUCKETS) + 1)
+        self._recent: deque[float] = deque(maxlen=ACKNOWLEDGEMENT_SAMPLES)
+
+    def add(self, latency: float) -> None:
+        """Record one confirmed command."""
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        self.buckets[bisect_left(ACKNOWLEDGEMENT_BUCKETS, latency)] += 1
+        self._recent.append(latency)
+
+    def quantile(self, fraction: float) -> float | None:
+        """Return a percentile of the recent latencies, if there are any."""
+        if not self._recent:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        bounds = [f"le_{bound:g}" for bound in ACKNOWLEDGEMENT_BUCKETS]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+            "buckets": dict(zip([*bounds, "inf"], self.buckets, strict=True)),
+        }
+
+
+@dataclass(slots=True)
+class _SentCommand:
+    """A command sent to the device that no received state confirmed yet."""
+
+    value: Any
+    sent_at: float
+
+
+class AcknowledgementTracker:
+    """Correlate sent commands with the received state that confirms them.
+
+    Commands are keyed like optimistic state, by keyed-listener key and state
+    field. A command that is not confirmed within ``timeout`` is dropped and
+    counted as expired the next time the tracker is used.
+    """
+
+    def __init__(self, statistics: Counter[str], timeout: timedelta) -> None:
+        """Initialize the acknowledgement tracker."""
+        self.statistics = statistics
+        self.timeout = timeout.total_seconds()
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self._sent: dict[str, dict[str, _SentCommand]] = {}
+
+    def sent(self, key: str, field: str, value: Any) -> None:
+        """Start timing a command that is being sent."""
+        self._expire()
+        self._sent.setdefault(key, {})[field] = _SentCommand(value, time.monotonic())
+
+    def discard(self, key: str, field: str) -> None:
+        """Stop timing a command that failed."""
+        if (fields := self._sent.get(key)) is not None:
+            fields.pop(field, None)
+            if not fields:
+                del self._sent[key]
+
+    def observe(self, key: str, model: Desk | Display) -> bool:
+        """Confirm the commands reached by received state; return if any were."""
+        self._expire()
+        if not (fields := self._sent.get(key)):
+            return False
+        now = time.monotonic()
+        confirmed = [
+            field
+            for field, command in fields.items()
+            if _reached(getattr(model.state, field), command.value)
+        ]
+        for field in confirmed:
+            latency = now - fields.pop(field).sent_at
+            self.histograms.setdefault(
+                command_type(key, field), LatencyHistogram()
+            ).add(latency)
+            self.statistics["acknowledgements_confirmed"] += 1
+        if not fields:
+            del self._sent[key]
+        return bool(confirmed)
+
+    def _expire(self) -> None:
+        """Drop commands that were not confirmed in time."""
+        deadline = time.monotonic() - self.timeout
+        for key in list(self._sent):
+            fields = self._sent[key]
+            for field in [
+                f for f, command in fields.items() if command.sent_at < deadline
+            ]:
+                del fields[field]
+                self.statistics["acknowledgements_expired"] += 1
+            if not fields:
+                del self._sent[key]
@@ -50,6 +50,7 @@ class NetlinkDeskBinarySensor(NetlinkControllerEntity, BinarySensorEntity):
     """Desk binary sensor."""
 
     _attr_has_entity_name = True
+    listener_key = "desk"
 
     def __init__(
         self,
@@ -63,7 +64,7 @@ class NetlinkDeskBinarySensor(NetlinkControllerEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        data = self.coordinator.data["desk"]
+        data = self.coordinator.data.desk
         return bool(self.entity_description.value_fn(data))
 
 
@@ -83,7 +84,7 @@ class NetlinkDisplayBinarySensor(NetlinkDisplayEntity, BinarySensorEntity):
 
     @property
     def is_on(self) -> bool | None:
-        data = self.coordinator.data["displays"].get(
+        data = self.coordinator.data.display(
             self.bus_id
         ) or self.coordinator.display_info.get(self.bus_id)
         if data is None:
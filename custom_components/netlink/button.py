@@ -16,6 +16,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .commands import CommandPriority
 from .coordinator import NetlinkDataUpdateCoordinator
 from .entity import NetlinkControllerEntity
 
@@ -26,6 +27,7 @@ class NetlinkButtonEntityDescription(ButtonEntityDescription):
 
     command: str
     press_fn: Callable
+    priority: CommandPriority = CommandPriority.NORMAL
 
 
 DESK_BUTTONS: list[NetlinkButtonEntityDescription] = [
@@ -33,12 +35,14 @@ DESK_BUTTONS: list[NetlinkButtonEntityDescription] = [
         key="desk_stop",
         translation_key="desk_stop",
         command="command.desk.stop",
+        priority=CommandPriority.SAFETY,
         press_fn=lambda client: client.stop_desk(),
     ),
     NetlinkButtonEntityDescription(
         key="desk_reset",
         translation_key="desk_reset",
         command="command.desk.reset",
+        priority=CommandPriority.SAFETY,
         press_fn=lambda client: client.reset_desk(),
     ),
     NetlinkButtonEntityDescription(
@@ -100,6 +104,7 @@ class NetlinkDeskButton(NetlinkControllerEntity, ButtonEntity):
     """Desk button entity."""
 
     _attr_has_entity_name = True
+    command_target = "desk"
 
     def __init__(
         self,
@@ -114,7 +119,13 @@ class NetlinkDeskButton(NetlinkControllerEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         try:
-            await self.entity_description.press_fn(self.coordinator.client)
+            await self.coordinator.commands.async_send(
+                self.command_target,
+                self.entity_description.key,
+                None,
+                lambda _: self.entity_description.press_fn(self.coordinator.client),
+                priority=self.entity_description.priority,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -127,6 +138,7 @@ class NetlinkBrowserButton(NetlinkControllerEntity, ButtonEntity):
     """Main controller button entity."""
 
     _attr_has_entity_name = True
+    command_target = "browser"
 
     def __init__(
         self,
@@ -141,7 +153,13 @@ class NetlinkBrowserButton(NetlinkControllerEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         try:
-            await self.entity_description.press_fn(self.coordinator.client)
+            await self.coordinator.commands.async_send(
+                self.command_target,
+                self.entity_description.key,
+                None,
+                lambda _: self.entity_description.press_fn(self.coordinator.client),
+                priority=self.entity_description.priority,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -154,6 +172,7 @@ class NetlinkSystemButton(NetlinkControllerEntity, ButtonEntity):
     """Main controller system button entity."""
 
     _attr_has_entity_name = True
+    command_target = "system"
 
     def __init__(
         self,
@@ -168,7 +187,13 @@ class NetlinkSystemButton(NetlinkControllerEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         try:
-            await self.entity_description.press_fn(self.coordinator.client)
+            await self.coordinator.commands.async_send(
+                self.command_target,
+                self.entity_description.key,
+                None,
+                lambda _: self.entity_description.press_fn(self.coordinator.client),
+                priority=self.entity_description.priority,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -0,0 +1,85 @@
+"""Persistent cache of the last known NetLink snapshot."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from pynetlink import (
+    BrowserState,
+    Desk,
+    DeviceInfo,
+    Display,
+    DisplaySummary,
+    NetlinkDataError,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .snapshot import NetlinkSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+@dataclass(frozen=True, kw_only=True)
+class CachedSnapshot:
+    """Last known device state restored from storage."""
+
+    device_info: DeviceInfo
+    inventory: list[DisplaySummary]
+    snapshot: NetlinkSnapshot
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the cached snapshot of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
+
+def dump_snapshot(
+    device_info: DeviceInfo,
+    inventory: Iterable[DisplaySummary],
+    snapshot: NetlinkSnapshot,
+) -> dict[str, Any]:
+    """Serialize the state needed to set up entities without the device.
+
+    Access codes and the authorization policy are never persisted.
+    """
+    return {
+        "device_info": device_info.to_dict(),
+        "inventory": [display.to_dict() for display in inventory],
+        "desk": snapshot.desk.to_dict() if snapshot.desk else None,
+        "browser": snapshot.browser.to_dict() if snapshot.browser else None,
+        "displays": {
+            bus_id: display.to_dict() for bus_id, display in snapshot.displays.items()
+        },
+    }
+
+
+def load_snapshot(data: dict[str, Any] | None) -> CachedSnapshot | None:
+    """Deserialize a cached snapshot, or return None if it is missing or invalid."""
+    if not data:
+        return None
+    try:
+        return CachedSnapshot(
+            device_info=DeviceInfo.from_dict(data["device_info"]),
+            inventory=[DisplaySummary.from_dict(item) for item in data["inventory"]],
+            snapshot=NetlinkSnapshot(
+                desk=Desk.from_dict(data["desk"]) if data["desk"] else None,
+                browser=(
+                    BrowserState.from_dict(data["browser"]) if data["browser"] else None
+                ),
+                displays={
+                    bus_id: Display.from_dict(display)
+                    for bus_id, display in data["displays"].items()
+                },
+            ),
+        )
+    except (LookupError, TypeError, ValueError, NetlinkDataError) as err:
+        _LOGGER.debug("Ignoring invalid cached NetLink snapshot: %s", err)
+        return None
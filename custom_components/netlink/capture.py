@@ -0,0 +1,184 @@
+"""Capture and replay of NetLink WebSocket event streams."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .const import CAPTURE_BACKUPS, CAPTURE_FLUSH_DELAY, CAPTURE_MAX_BYTES
+
+if TYPE_CHECKING:
+    from .coordinator import NetlinkDataUpdateCoordinator
+
+# Payload fields never written to a capture file, like the access codes
+CAPTURE_REDACT = {"code"}
+
+
+class CapturedEvent(NamedTuple):
+    """A received WebSocket event and its monotonic receive time."""
+
+    timestamp: float
+    event: str
+    data: Any
+
+
+def _append(path: Path, lines: bytes, max_bytes: int, backups: int) -> None:
+    """Append lines to a capture file, rotating it when it grows too large."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists() and path.stat().st_size + len(lines) > max_bytes:
+        if backups:
+            for index in range(backups - 1, 0, -1):
+                backup = path.with_suffix(f"{path.suffix}.{index}")
+                if backup.exists():
+                    backup.replace(path.with_suffix(f"{path.suffix}.{index + 1}"))
+            path.replace(path.with_suffix(f"{path.suffix}.1"))
+        else:
+            path.unlink()
+    with path.open("ab") as file:
+        file.write(lines)
+
+
+def read_capture(path: Path) -> list[CapturedEvent]:
+    """Read the events of a capture file; does blocking I/O."""
+    with path.open("rb") as file:
+        return [CapturedEvent(*json_loads(line)) for line in file if line.strip()]
+
+
+class EventCapture:
+    """Append received WebSocket events to a rotating capture file.
+
+    Every event is written as one compact JSON line holding its monotonic
+    receive time, name and payload, with the fields in ``CAPTURE_REDACT``
+    redacted. Lines are buffered and written from the executor at most once
+    per ``CAPTURE_FLUSH_DELAY``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        *,
+        max_bytes: int = CAPTURE_MAX_BYTES,
+        backups: int = CAPTURE_BACKUPS,
+    ) -> None:
+        """Initialize the event capture."""
+        self.hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.events = 0
+        self._pending: list[bytes] = []
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._write_lock = asyncio.Lock()
+
+    @callback
+    def record(self, event: str, data: Any) -> None:
+        """Buffer one received event."""
+        self._pending.append(
+            json_bytes(
+                [
+                    round(time.monotonic(), 4),
+                    event,
+                    async_redact_data(data, CAPTURE_REDACT),
+                ]
+            )
+            + b"\n"
+        )
+        self.events += 1
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, CAPTURE_FLUSH_DELAY, self._async_flush_later
+            )
+
+    async def _async_flush_later(self, _: datetime) -> None:
+        """Write the buffered events after the flush delay."""
+        self._cancel_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the buffered events."""
+        async with self._write_lock:
+            lines, self._pending = b"".join(self._pending), []
+            if lines:
+                await self.hass.async_add_executor_job(
+                    _append, self.path, lines, self.max_bytes, self.backups
+                )
+
+    async def async_close(self) -> None:
+        """Stop the flush timer and write the remaining events."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        await self.async_flush()
+
+
+@dataclass(frozen=True, kw_only=True)
+class ReplayReport:
+    """Outcome of replaying a captured event stream."""
+
+    events: int
+    skipped: int
+    duration: float
+    handler_seconds: float
+    entity_writes: int
+    suppressed_entity_writes: int
+    suppressed_updates: int
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the handler throughput."""
+        if not self.handler_seconds:
+            return float("inf")
+        return self.events / self.handler_seconds
+
+
+async def async_replay(
+    coordinator: NetlinkDataUpdateCoordinator,
+    events: Iterable[CapturedEvent],
+    *,
+    speed: float | None = 1.0,
+) -> ReplayReport:
+    """Feed captured events into a coordinator as if they were received.
+
+    With a ``speed`` the original spacing between events is kept, divided by
+    it; ``None`` replays as fast as the handlers allow.
+    """
+    before = coordinator.statistics.copy()
+    started = time.monotonic()
+    handler_seconds = 0.0
+    first: float | None = None
+    handled = skipped = 0
+    for captured in events:
+        if speed is not None:
+            if first is None:
+                first = captured.timestamp
+            delay = (captured.timestamp - first) / speed - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        handler_started = time.perf_counter()
+        if await coordinator.async_replay_event(captured.event, captured.data):
+            handled += 1
+        else:
+            skipped += 1
+        handler_seconds += time.perf_counter() - handler_started
+    delta = coordinator.statistics - before
+    return ReplayReport(
+        events=handled,
+        skipped=skipped,
+        duration=time.monotonic() - started,
+        handler_seconds=handler_seconds,
+        entity_writes=delta["entity_writes"],
+        suppressed_entity_writes=delta["suppressed_entity_writes"],
+        suppressed_updates=delta["suppressed_updates"],
+    )
@@ -0,0 +1,210 @@
+"""Per-target command scheduling for NetLink entities."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import IntEnum
+import time
+from typing import Any
+
+from pynetlink import NetlinkCommandError, NetlinkTimeoutError
+
+from .const import COMMAND_DEADLINE
+
+type CommandSender = Callable[[Any], Awaitable[None]]
+
+
+class CommandPriority(IntEnum):
+    """Priority class of an entity command."""
+
+    SAFETY = 0
+    NORMAL = 1
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    """A command waiting for its target to become idle."""
+
+    value: Any
+    send: CommandSender
+    queued_at: float
+    done: asyncio.Future[BaseException | None]
+
+
+class _Lane:
+    """Serial lane of one command target."""
+
+    __slots__ = ("busy", "waiters")
+
+    def __init__(self) -> None:
+        """Initialize an idle lane."""
+        self.busy = False
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        """Wait until every earlier command of this lane has finished."""
+        if not self.busy and not self.waiters:
+            self.busy = True
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled() and not waiter.exception():
+                # Woken up and cancelled at the same time: pass the turn on.
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+    def release(self) -> None:
+        """Hand the lane to the next waiting command."""
+        while self.waiters:
+            if not (waiter := self.waiters.popleft()).done():
+                waiter.set_result(None)
+                return
+        self.busy = False
+
+    def preempt(self, command: str) -> int:
+        """Fail every waiting command and return how many there were."""
+        preempted = 0
+        while self.waiters:
+            if not (waiter := self.waiters.popleft()).done():
+                waiter.set_exception(NetlinkCommandError("preempted", command))
+                preempted += 1
+        return preempted
+
+
+class CommandQueue:
+    """Schedule entity commands on one serial lane per target.
+
+    A target is the keyed-listener key of the desk or a display, whose bus
+    processes commands serially, or another controller subsystem. Normal
+    commands are sent one at a time per target. While one is in flight, later
+    requests for the same command are collapsed into one write of the latest
+    value; every collapsed caller waits for that write and sees its outcome.
+
+    Safety commands, such as stopping the desk, do not wait for the lane:
+    they are sent at once and fail the commands still queued for their
+    target, so queued motion cannot undo them. Every command must be sent
+    and acknowledged before its deadline or it fails with a timeout.
+    """
+
+    def __init__(self, statistics: Counter[str]) -> None:
+        """Initialize the command queue."""
+        self.statistics = statistics
+        self.peak_depth = 0
+        self.wait_max = 0.0
+        self._wait_total = 0.0
+        self._queued: dict[tuple[str, str], _QueuedCommand] = {}
+        self._lanes: dict[str, _Lane] = {}
+
+    @property
+    def depth(self) -> int:
+        """Return the number of commands waiting for their target."""
+        return len(self._queued)
+
+    @property
+    def wait_mean(self) -> float:
+        """Return the mean time sent commands waited for their target."""
+        if not (sent := self.statistics["commands_sent"]):
+            return 0.0
+        return self._wait_total / sent
+
+    async def async_send(
+        self,
+        target: str,
+        command: str,
+        value: Any,
+        send: CommandSender,
+        *,
+        priority: CommandPriority = CommandPriority.NORMAL,
+        deadline: timedelta = COMMAND_DEADLINE,
+    ) -> None:
+        """Send ``value`` with ``send`` according to ``priority``."""
+        self.statistics["commands_requested"] += 1
+        if priority is CommandPriority.SAFETY:
+            self._preempt(target, command)
+            self._record_sent(0.0)
+            await self._async_run(command, send, value, deadline)
+            return
+
+        key = (target, command)
+        if (queued := self._queued.get(key)) is not None:
+            queued.value = value
+            queued.send = send
+            self.statistics["commands_superseded"] += 1
+            if (err := await asyncio.shield(queued.done)) is not None:
+                raise err
+            return
+
+        queued = self._queued[key] = _QueuedCommand(
+            value,
+            send,
+            time.monotonic(),
+            asyncio.get_running_loop().create_future(),
+        )
+        self.peak_depth = max(self.peak_depth, len(self._queued))
+        try:
+            await self._async_run_queued(target, command, queued, deadline)
+        except BaseException as err:
+            queued.done.set_result(err)
+            raise
+        else:
+            queued.done.set_result(None)
+        finally:
+            if self._queued.get(key) is queued:
+                del self._queued[key]
+
+    async def _async_run_queued(
+        self, target: str, command: str, queued: _QueuedCommand, deadline: timedelta
+    ) -> None:
+        """Wait for the lane of ``target`` and send the latest queued value."""
+        lane = self._lanes.setdefault(target, _Lane())
+        try:
+            async with asyncio.timeout(deadline.total_seconds()):
+                await lane.acquire()
+        except TimeoutError as err:
+            self.statistics["commands_expired"] += 1
+            raise NetlinkTimeoutError(f"{command} was not sent in time") from err
+        try:
+            # Once sent, the value can no longer be replaced.
+            if self._queued.get((target, command)) is queued:
+                del self._queued[(target, command)]
+            self._record_sent(time.monotonic() - queued.queued_at)
+            remaining = deadline.total_seconds() - (time.monotonic() - queued.queued_at)
+            await self._async_run(
+                command, queued.send, queued.value, timedelta(seconds=remaining)
+            )
+        finally:
+            lane.release()
+
+    async def _async_run(
+        self, command: str, send: CommandSender, value: Any, deadline: timedelta
+    ) -> None:
+        """Send a command and fail it when it is not acknowledged in time."""
+        try:
+            async with asyncio.timeout(deadline.total_seconds()):
+                await send(value)
+        except TimeoutError as err:
+            self.statistics["commands_expired"] += 1
+            raise NetlinkTimeoutError(f"{command} was not acknowledged") from err
+
+    def _record_sent(self, waited: float) -> None:
+        """Count a sent command and the time it waited for its target."""
+        self.statistics["commands_sent"] += 1
+        self._wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def _preempt(self, target: str, command: str) -> None:
+        """Fail the commands waiting for ``target`` in favour of ``command``."""
+        for key in [key for key in self._queued if key[0] == target]:
+            del self._queued[key]
+        if (lane := self._lanes.get(target)) is not None:
+            self.statistics["commands_preempted"] += lane.preempt(command)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Mapping
+from datetime import timedelta
 from typing import Any
 
 from aiohttp import ClientSession
@@ -19,15 +20,32 @@ import voluptuous as vol
 from homeassistant.config_entries import (
     SOURCE_REAUTH,
     SOURCE_RECONFIGURE,
+    ConfigEntry,
     ConfigFlowResult,
+    OptionsFlow,
 )
 from homeassistant.const import CONF_HOST, CONF_TOKEN
+from homeassistant.core import callback
 from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import CONF_AUTH_IMPLEMENTATION, CONF_DEVICE_ID, DOMAIN
+from .const import (
+    CONF_AUTH_IMPLEMENTATION,
+    CONF_COMPACT_ENTITIES,
+    CONF_DESK_MOTION_UPDATE_INTERVAL,
+    CONF_DEVICE_ID,
+    CONF_DISCONNECT_GRACE,
+    CONF_DISPLAY_STATUS_CONCURRENCY,
+    CONF_RECONCILIATION_INTERVAL,
+    DESK_MOTION_UPDATE_INTERVAL,
+    DISPLAY_STATUS_CONCURRENCY,
+    DOMAIN,
+    MIN_RECONCILIATION_INTERVAL,
+    RECONCILIATION_INTERVAL,
+    WEBSOCKET_DISCONNECT_GRACE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +88,12 @@ class NetlinkConfigFlow(
         self._netlink_reauth_entry_id: str | None = None
         self._netlink_reauth_entry_data: dict[str, Any] | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> NetlinkOptionsFlow:
+        """Return the options flow."""
+        return NetlinkOptionsFlow()
+
     @property
     def logger(self) -> logging.Logger:
         """Return logger."""
@@ -523,3 +547,67 @@ class NetlinkConfigFlow(
         return await super().async_step_pick_implementation(
             {"implementation": implementation_key}
         )
+
+
+def _duration(value: timedelta) -> dict[str, int]:
+    """Return a timedelta as a duration selector value."""
+    seconds, milliseconds = divmod(int(value.total_seconds() * 1000), 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return {
+        "hours": hours,
+        "minutes": minutes,
+        "seconds": seconds,
+        "milliseconds": milliseconds,
+    }
+
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_COMPACT_ENTITIES, default=False): selector.BooleanSelector(),
+        vol.Optional(CONF_RECONCILIATION_INTERVAL): selector.DurationSelector(),
+        vol.Optional(CONF_DISCONNECT_GRACE): selector.DurationSelector(),
+        vol.Optional(CONF_DESK_MOTION_UPDATE_INTERVAL): selector.DurationSelector(
+            selector.DurationSelectorConfig(enable_millisecond=True)
+        ),
+        vol.Optional(CONF_DISPLAY_STATUS_CONCURRENCY): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1, max=16, step=1, mode=selector.NumberSelectorMode.BOX
+            )
+        ),
+    }
+)
+
+# Values shown for tuning options that were never changed
+DEFAULT_OPTIONS = {
+    CONF_RECONCILIATION_INTERVAL: _duration(RECONCILIATION_INTERVAL),
+    CONF_DISCONNECT_GRACE: _duration(WEBSOCKET_DISCONNECT_GRACE),
+    CONF_DESK_MOTION_UPDATE_INTERVAL: _duration(DESK_MOTION_UPDATE_INTERVAL),
+    CONF_DISPLAY_STATUS_CONCURRENCY: DISPLAY_STATUS_CONCURRENCY,
+}
+
+
+class NetlinkOptionsFlow(OptionsFlow):
+    """Handle NetLink options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the NetLink options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            interval = user_input.get(CONF_RECONCILIATION_INTERVAL)
+            if interval is not None and (
+                timedelta(**interval) < MIN_RECONCILIATION_INTERVAL
+            ):
+                errors[CONF_RECONCILIATION_INTERVAL] = "interval_too_short"
+            else:
+                return self.async_create_entry(data=user_input)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
+                {**DEFAULT_OPTIONS, **self.config_entry.options, **(user_input or {})},
+            ),
+            errors=errors,
+        )
@@ -10,9 +10,71 @@ DOMAIN = "netlink"
 CONF_DEVICE_ID = "device_id"
 CONF_AUTH_IMPLEMENTATION = "auth_implementation"
 
+# Options
+# Only create the control entity for display fields that have one, without
+# the read-only sensor of the same field
+CONF_COMPACT_ENTITIES = "compact_entities"
+# Tuning options, applied to the running coordinator without a reload; the
+# durations are stored as duration selector values
+CONF_RECONCILIATION_INTERVAL = "reconciliation_interval"
+CONF_DISCONNECT_GRACE = "disconnect_grace"
+CONF_DESK_MOTION_UPDATE_INTERVAL = "desk_motion_update_interval"
+CONF_DISPLAY_STATUS_CONCURRENCY = "display_status_concurrency"
+
 # Connectivity lifecycle
 WEBSOCKET_DISCONNECT_GRACE = timedelta(seconds=15)
 RECONCILIATION_INTERVAL = timedelta(minutes=15)
+MIN_RECONCILIATION_INTERVAL = timedelta(minutes=1)
+# Fraction of a reconciliation slot that may be cut off at random
+RECONCILIATION_JITTER = 0.1
+# REST snapshots running at the same time across all entries
+SNAPSHOT_CONCURRENCY = 4
+# Recovery snapshots running at the same time across all entries after a
+# reconnect; kept below SNAPSHOT_CONCURRENCY so reconciliation is not starved
+RECONNECT_CONCURRENCY = 3
+# Exponential backoff between failed recovery snapshots
+RECONNECT_BACKOFF = timedelta(seconds=2)
+RECONNECT_BACKOFF_MAX = timedelta(minutes=5)
+
+# Display status fan-out during snapshots
+DISPLAY_STATUS_CONCURRENCY = 4
+DISPLAY_STATUS_TIMEOUT = timedelta(seconds=3)
+
+# Delay before the last known snapshot is written to storage
+SNAPSHOT_CACHE_SAVE_DELAY = timedelta(seconds=30)
+
+# Time the device has to confirm a requested value once the command was sent
+OPTIMISTIC_STATE_TIMEOUT = timedelta(seconds=5)
+
+# Time an entity command may wait for its target and the device to acknowledge it;
+# longer than pynetlink's own acknowledgement timeouts (up to 20 s for displays)
+COMMAND_DEADLINE = timedelta(seconds=30)
+
+# Command-to-confirmation latency: commands not confirmed within the timeout
+# are dropped; percentiles use the most recent samples per command type
+ACKNOWLEDGEMENT_TIMEOUT = timedelta(minutes=1)
+ACKNOWLEDGEMENT_SAMPLES = 100
+ACKNOWLEDGEMENT_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Default limits of the batch_command service: commands in flight across all
+# entries, and per controller
+BATCH_CONCURRENCY = 32
+BATCH_DEVICE_CONCURRENCY = 4
+
+# Event capture: buffered lines are written after the flush delay; the file
+# is rotated when it would exceed the size limit
+CAPTURE_FLUSH_DELAY = timedelta(seconds=5)
+CAPTURE_MAX_BYTES = 10 * 1024 * 1024
+CAPTURE_BACKUPS = 3
+
+# Distinct raw display error strings kept parsed for the error sensors
+DISPLAY_ERROR_CACHE_SIZE = 64
+
+# Push coalescing
+DESK_MOTION_UPDATE_INTERVAL = timedelta(milliseconds=500)
+
+# Maximum number of distinct push events kept while recovering a connection
+RECOVERY_PUSH_BUFFER_SIZE = 64
 
 # Platforms
 PLATFORMS = [
@@ -22,4 +84,5 @@ PLATFORMS = [
     Platform.SWITCH,
     Platform.SELECT,
     Platform.BUTTON,
+    Platform.EVENT,
 ]
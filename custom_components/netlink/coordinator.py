@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterator
-from datetime import datetime
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
 from enum import Enum, auto
+from functools import partial
 import logging
+from pathlib import Path
+import time
 from typing import Any
 
 from pynetlink import (
@@ -30,17 +36,41 @@ from pynetlink import (
     NetlinkDataError,
     NetlinkError,
     NetlinkNotFoundError,
+    NetlinkTimeoutError,
 )
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, RECONCILIATION_INTERVAL, WEBSOCKET_DISCONNECT_GRACE
+from .const import (
+    ACKNOWLEDGEMENT_TIMEOUT,
+    CONF_COMPACT_ENTITIES,
+    CONF_DESK_MOTION_UPDATE_INTERVAL,
+    CONF_DISCONNECT_GRACE,
+    CONF_DISPLAY_STATUS_CONCURRENCY,
+    CONF_RECONCILIATION_INTERVAL,
+    DESK_MOTION_UPDATE_INTERVAL,
+    DISPLAY_STATUS_CONCURRENCY,
+    DISPLAY_STATUS_TIMEOUT,
+    DOMAIN,
+    OPTIMISTIC_STATE_TIMEOUT,
+    RECONCILIATION_INTERVAL,
+    RECOVERY_PUSH_BUFFER_SIZE,
+    SNAPSHOT_CACHE_SAVE_DELAY,
+    WEBSOCKET_DISCONNECT_GRACE,
+)
+from .acknowledgements import AcknowledgementTracker
+from .capture import EventCapture
+from .cache import dump_snapshot, load_snapshot, snapshot_store
+from .commands import CommandQueue, CommandSender
+from .optimistic import OptimisticState, with_state
+from .scheduler import async_get_scheduler, reconnect_backoff
+from .snapshot import NetlinkSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,6 +91,38 @@ EXPECTED_HOME_ASSISTANT_COMMANDS = frozenset(
 )
 
 
+# Resources that reconciliation can skip when a push confirmed them recently.
+# Displays are tracked per bus through their listener key.
+RECONCILED_RESOURCES = frozenset(
+    {"access_codes", "browser", "desk", "device_info", "inventory"}
+)
+
+
+PushHandler = Callable[[Any], Awaitable[None]]
+
+# Resources the refresh running in the current task is limited to; None for a
+# full snapshot. DataUpdateCoordinator calls _async_update_data() without
+# arguments, so async_refresh() hands the scope down through the task context.
+_REFRESH_SCOPE: ContextVar[frozenset[str] | None] = ContextVar(
+    "netlink_refresh_scope", default=None
+)
+
+
+DISPLAY_LISTENER_PREFIX = "displays/"
+COMMAND_LISTENER_PREFIX = "commands/"
+ACKNOWLEDGEMENTS_LISTENER_KEY = "acknowledgements"
+
+
+def display_listener_key(bus_id: str) -> str:
+    """Return the keyed-listener key for push updates of a single display."""
+    return f"{DISPLAY_LISTENER_PREFIX}{bus_id}"
+
+
+def command_listener_key(command: str) -> str:
+    """Return the keyed-listener key for permission changes of a command."""
+    return f"{COMMAND_LISTENER_PREFIX}{command}"
+
+
 class _ConnectivityState(Enum):
     """Authoritative connectivity state for coordinator data."""
 
@@ -71,7 +133,7 @@ class _ConnectivityState(Enum):
     SHUTTING_DOWN = auto()
 
 
-class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[NetlinkSnapshot]):
     """Class to manage fetching NetLink data via WebSocket."""
 
     def __init__(
@@ -90,19 +152,102 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=None,
         )
         self.client = client
+        self.scheduler = async_get_scheduler(hass)
+        self.snapshot_from_cache = False
+        self._store = snapshot_store(hass, config_entry.entry_id)
         self.device_id = device_id
         self.device_info: DeviceInfo | None = None
         self.display_info: dict[str, DisplaySummary] = {}
         self.known_bus_ids: set[str] = set()
         self._new_display_callbacks: list[Callable[[str], None]] = []
         self._access_codes_available_callbacks: list[Callable[[], None]] = []
+        self._keyed_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self.statistics: Counter[str] = Counter()
+        self.optimistic = OptimisticState(
+            hass,
+            OPTIMISTIC_STATE_TIMEOUT,
+            self.statistics,
+            self._async_rollback_optimistic,
+        )
+        self.commands = CommandQueue(self.statistics)
+        self.acknowledgements = AcknowledgementTracker(
+            self.statistics, ACKNOWLEDGEMENT_TIMEOUT
+        )
         self.access_codes_status = "unknown"
         self.last_authorization_failure: str | None = None
         self._last_missing_commands: frozenset[str] = frozenset()
+        # Commands permitted by the indexed policy version; None when the
+        # server does not advertise a policy
+        self._policy_version: int | None = None
+        self._allowed_commands: frozenset[str] | None = None
         self._connectivity_state = _ConnectivityState.INITIALIZING
         self._cancel_disconnect_grace: CALLBACK_TYPE | None = None
         self._cancel_reconciliation: CALLBACK_TYPE | None = None
         self._reconnect_lock = asyncio.Lock()
+        self._reconnect_attempts = 0
+        self._cancel_reconnect_retry: CALLBACK_TYPE | None = None
+        self._cancel_connect_retry: CALLBACK_TYPE | None = None
+        self._connecting: asyncio.Task[None] | None = None
+        self.setup_timings: dict[str, float] = {}
+        self._confirmed_at: dict[str, float] = {}
+        self._reconciled_at = 0.0
+        self.desk_motion_update_interval = DESK_MOTION_UPDATE_INTERVAL
+        self._pending_desk: Desk | None = None
+        self._cancel_desk_flush: CALLBACK_TYPE | None = None
+        self.display_status_concurrency = DISPLAY_STATUS_CONCURRENCY
+        self.display_status_timeout = DISPLAY_STATUS_TIMEOUT
+        self.stale_displays: set[str] = set()
+        self._recovery_buffer: dict[str, tuple[float, PushHandler, Any]] = {}
+        self._refresh_in_flight: (
+            tuple[asyncio.Future[None], frozenset[str] | None] | None
+        ) = None
+        self._push_handlers: dict[str, PushHandler] = {}
+        self.capture: EventCapture | None = None
+        self.reconciliation_interval = RECONCILIATION_INTERVAL
+        self.disconnect_grace = WEBSOCKET_DISCONNECT_GRACE
+        self._setup_config = self._entry_setup_config()
+        self.async_apply_options()
+
+    def _entry_setup_config(self) -> tuple[dict[str, Any], bool]:
+        """Return the parts of the config entry that only apply on setup."""
+        return (
+            dict(self.config_entry.data),
+            self.config_entry.options.get(CONF_COMPACT_ENTITIES, False),
+        )
+
+    def requires_reload(self) -> bool:
+        """Return whether the config entry changed in a way only setup applies."""
+        return self._entry_setup_config() != self._setup_config
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply the tuning options of the config entry to the running coordinator.
+
+        Pending timers keep their delay; the next ones use the new values.
+        """
+        options = self.config_entry.options
+
+        def duration(key: str, default: timedelta) -> timedelta:
+            # Cleared fields are left out of the options and fall back too.
+            value = options.get(key)
+            return default if value is None else timedelta(**value)
+
+        self.reconciliation_interval = duration(
+            CONF_RECONCILIATION_INTERVAL, RECONCILIATION_INTERVAL
+        )
+        self.disconnect_grace = duration(
+            CONF_DISCONNECT_GRACE, WEBSOCKET_DISCONNECT_GRACE
+        )
+        self.desk_motion_update_interval = duration(
+            CONF_DESK_MOTION_UPDATE_INTERVAL, DESK_MOTION_UPDATE_INTERVAL
+        )
+        self.display_status_concurrency = int(
+            options.get(CONF_DISPLAY_STATUS_CONCURRENCY) or DISPLAY_STATUS_CONCURRENCY
+        )
+        if self._cancel_reconciliation is not None:
+            self.scheduler.async_set_interval(
+                self.config_entry.entry_id, self.reconciliation_interval
+            )
 
     def _cancel_disconnect_timer(self) -> None:
         """Cancel a pending disconnect grace timer."""
@@ -119,11 +264,75 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self.async_set_update_error(UpdateFailed("WebSocket connection lost"))
 
+    async def async_refresh(self, scope: frozenset[str] | None = None) -> None:
+        """Refresh data, joining a snapshot that is already in flight.
+
+        Reconciliation, reconnects and manual entity updates may request a
+        refresh at the same time; only the first one queries the device.
+        A ``scope`` limits the snapshot to those resources. A full refresh
+        never joins a scoped one; it waits for it and then fetches everything.
+        """
+        while (in_flight := self._refresh_in_flight) is not None:
+            future, in_flight_scope = in_flight
+            await asyncio.shield(future)
+            if in_flight_scope is None or scope is not None:
+                self.statistics["refresh_joined"] += 1
+                return
+
+        self.statistics["refresh_executed"] += 1
+        future = self.hass.loop.create_future()
+        self._refresh_in_flight = (future, scope)
+        token = _REFRESH_SCOPE.set(scope)
+        try:
+            async with self.scheduler.snapshots:
+                await super().async_refresh()
+        finally:
+            _REFRESH_SCOPE.reset(token)
+            self._refresh_in_flight = None
+            future.set_result(None)
+
     def _push_updates_allowed(self) -> bool:
         """Return whether push events may update authoritative live state."""
         return self._connectivity_state is _ConnectivityState.READY
 
-    async def _async_reconcile(self, _: datetime) -> None:
+    def _push_deferred(self, key: str, handler: PushHandler, data: Any) -> bool:
+        """Return whether a push must wait for the connection to be READY.
+
+        Until the initial or recovery snapshot lands, the latest push per key is
+        buffered so it can be replayed on top of that snapshot.
+        """
+        if self._push_updates_allowed():
+            return False
+        if self._connectivity_state is _ConnectivityState.SHUTTING_DOWN:
+            return True
+        self._recovery_buffer.pop(key, None)
+        if len(self._recovery_buffer) >= RECOVERY_PUSH_BUFFER_SIZE:
+            del self._recovery_buffer[next(iter(self._recovery_buffer))]
+            self.statistics["recovery_pushes_dropped"] += 1
+        self._recovery_buffer[key] = (time.monotonic(), handler, data)
+        return True
+
+    async def _async_recover(self) -> None:
+        """Refresh the complete snapshot and replay pushes it may have missed."""
+        access_codes_known = self.access_codes_known
+        await self.async_refresh()
+        if not self._push_updates_allowed():
+            return
+        if not access_codes_known and self.access_codes_known:
+            for callback in self._access_codes_available_callbacks:
+                callback()
+        await self._async_replay_buffered_pushes()
+
+    async def _async_replay_buffered_pushes(self) -> None:
+        """Replay buffered pushes received after the latest snapshot started."""
+        buffered, self._recovery_buffer = self._recovery_buffer, {}
+        for received_at, handler, data in buffered.values():
+            # Older pushes are already covered by the snapshot.
+            if received_at > self._reconciled_at:
+                self.statistics["recovery_pushes_replayed"] += 1
+                await handler(data)
+
+    async def _async_reconcile(self) -> None:
         """Refresh REST state periodically without replacing push updates."""
         if (
             self._connectivity_state
@@ -134,7 +343,71 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             or self._cancel_disconnect_grace is not None
         ):
             return
-        await self.async_refresh()
+        if self._connectivity_state is not _ConnectivityState.READY:
+            await self._async_recover()
+            return
+
+        stale = self._stale_resources()
+        if not stale and self.client.connected:
+            self._reconciled_at = time.monotonic()
+            self.statistics["reconciliations_skipped"] += 1
+            return
+        await self.async_refresh(stale)
+
+    async def _async_reconnect(self) -> None:
+        """Recover through the fleet-wide reconnect gate, retrying with backoff."""
+        async with self._reconnect_lock:
+            if self._connectivity_state is not _ConnectivityState.RECOVERING:
+                return
+            async with self.scheduler.reconnects:
+                await self._async_recover()
+            if self._push_updates_allowed():
+                self._reconnect_attempts = 0
+                return
+            if (
+                self._connectivity_state is not _ConnectivityState.RECOVERING
+                or self._cancel_reconnect_retry is not None
+            ):
+                return
+            delay = reconnect_backoff(self._reconnect_attempts)
+            self._reconnect_attempts += 1
+            _LOGGER.debug(
+                "Retrying NetLink %s recovery in %.1f s",
+                self.device_id,
+                delay.total_seconds(),
+            )
+            self._cancel_reconnect_retry = async_call_later(
+                self.hass, delay, self._async_retry_reconnect
+            )
+
+    async def _async_retry_reconnect(self, _: datetime) -> None:
+        """Retry a failed recovery snapshot."""
+        self._cancel_reconnect_retry = None
+        await self._async_reconnect()
+
+    def _cancel_reconnect_retry_timer(self) -> None:
+        """Cancel a pending recovery retry."""
+        if self._cancel_reconnect_retry is None:
+            return
+        self._cancel_reconnect_retry()
+        self._cancel_reconnect_retry = None
+
+    def _confirm(self, resource: str) -> None:
+        """Record that a push confirmed the authoritative state of a resource."""
+        self._confirmed_at[resource] = time.monotonic()
+
+    def _stale_resources(self) -> frozenset[str]:
+        """Return resources not confirmed by a push since the last snapshot."""
+        resources = set(RECONCILED_RESOURCES)
+        resources.update(
+            display_listener_key(bus_id)
+            for bus_id in (*self.data.displays, *self.display_info)
+        )
+        return frozenset(
+            resource
+            for resource in resources
+            if self._confirmed_at.get(resource, 0.0) <= self._reconciled_at
+        )
 
     def _iter_registry_display_buses(self) -> Iterator[tuple[str, dr.DeviceEntry]]:
         """Yield (bus_id, device) for all display devices in the HA device registry."""
@@ -162,40 +435,294 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         for display in displays:
             self._track_bus_id(str(display.bus))
 
+    @callback
+    def async_add_keyed_listener(
+        self, key: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for push updates of a single part of the coordinator data.
+
+        Keyed listeners are only called for push events affecting their key.
+        Full snapshots still notify every listener registered through
+        ``async_add_listener``.
+        """
+        self._keyed_listeners.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the keyed listener."""
+            listeners = self._keyed_listeners[key]
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._keyed_listeners[key]
+
+        return remove_listener
+
+    @callback
+    def _async_update_keyed_listeners(self, key: str) -> None:
+        """Notify only the listeners subscribed to a single key."""
+        for update_callback in list(self._keyed_listeners.get(key, ())):
+            update_callback()
+
     def _patch_data(self, key: str, value: Any) -> None:
-        """Update a single key in coordinator data and notify listeners."""
+        """Replace a top-level snapshot branch and notify its listeners."""
+        if not self._push_updates_allowed():
+            return
+        if getattr(self.data, key) == value:
+            self.statistics["suppressed_updates"] += 1
+            return
+        self.data = self.data.replace(**{key: value})
+        self._async_update_keyed_listeners(key)
+
+    def _patch_display(self, bus_id: str, display: Display) -> None:
+        """Replace a single display state and notify its listeners."""
         if not self._push_updates_allowed():
             return
-        self.async_set_updated_data({**(self.data or {}), key: value})
+        if self.data.display(bus_id) == display:
+            self.statistics["suppressed_updates"] += 1
+            return
+        self.data = self.data.with_display(bus_id, display)
+        self._async_update_keyed_listeners(display_listener_key(bus_id))
+
+    def _optimistic_model(self, key: str) -> Desk | Display | None:
+        """Return the desk or display state behind a keyed-listener key."""
+        if self.data is None:
+            return None
+        if key == "desk":
+            return self.data.desk
+        return self.data.display(key.removeprefix(DISPLAY_LISTENER_PREFIX))
+
+    def _set_optimistic_model(self, key: str, model: Desk | Display) -> None:
+        """Publish a desk or display state for a keyed-listener key."""
+        if key == "desk":
+            self._patch_data("desk", model)
+        else:
+            self._patch_display(key.removeprefix(DISPLAY_LISTENER_PREFIX), model)
+
+    @asynccontextmanager
+    async def async_optimistic_update(
+        self, key: str, field: str, value: Any
+    ) -> AsyncIterator[None]:
+        """Show a requested state value while the command runs.
+
+        The value stays pending until a received state confirms it. It is
+        rolled back when the command raises or no confirmation arrives in time
+        after the command was sent.
+        """
+        if (
+            self._push_updates_allowed()
+            and (model := self._optimistic_model(key)) is not None
+        ):
+            self._set_optimistic_model(
+                key, self.optimistic.apply(key, field, value, model)
+            )
+        try:
+            yield
+        except BaseException:
+            self._async_rollback_optimistic(key, field)
+            raise
+
+    async def async_send_command(
+        self,
+        key: str,
+        field: str,
+        value: Any,
+        send: CommandSender,
+        *,
+        optimistic: bool = True,
+    ) -> None:
+        """Show a requested state value and queue the command setting it.
+
+        Commands share one queue per desk or display, so a burst of values for
+        the same field only sends the latest one. The time until received
+        state confirms the value is recorded per command type.
+        """
+        tracked = partial(self._async_send_tracked, key, field, send)
+        if not optimistic:
+            await self.commands.async_send(key, field, value, tracked)
+            return
+        async with self.async_optimistic_update(key, field, value):
+            await self.commands.async_send(key, field, value, tracked)
+
+    async def _async_send_tracked(
+        self, key: str, field: str, send: CommandSender, value: Any
+    ) -> None:
+        """Send a queued command and start waiting for its confirmation."""
+        self.acknowledgements.sent(key, field, value)
+        try:
+            await send(value)
+        except BaseException:
+            self.acknowledgements.discard(key, field)
+            raise
+        self.optimistic.sent(key, field, value)
+
+    @callback
+    def _reconcile_received[ModelT: (Desk, Display)](
+        self, key: str, model: ModelT
+    ) -> ModelT:
+        """Confirm sent and optimistic values with a received state."""
+        if self.acknowledgements.observe(key, model):
+            self._async_update_keyed_listeners(ACKNOWLEDGEMENTS_LISTENER_KEY)
+        return self.optimistic.reconcile(key, model)
+
+    @callback
+    def _async_rollback_optimistic(self, key: str, field: str) -> None:
+        """Restore the last authoritative value of an unconfirmed change."""
+        if (change := self.optimistic.pop(key, field)) is None:
+            return
+        self.statistics["optimistic_rolled_back"] += 1
+        if (model := self._optimistic_model(key)) is not None:
+            self._set_optimistic_model(
+                key, with_state(model, {field: change.authoritative})
+            )
+
+    @callback
+    def _schedule_cache_save(self) -> None:
+        """Persist the last known state after a short delay.
+
+        Only full snapshots and inventory or device info changes save; push
+        updates of live state ride along with the next save.
+        """
+        self._store.async_delay_save(
+            lambda: dump_snapshot(
+                self.device_info, self.display_info.values(), self.data
+            ),
+            SNAPSHOT_CACHE_SAVE_DELAY.total_seconds(),
+        )
+
+    @callback
+    def _async_coalesce_desk(self, desk: Desk) -> None:
+        """Limit desk state writes while the desk is moving.
+
+        The first frame of a movement is written immediately, later frames are
+        coalesced to at most one write per ``desk_motion_update_interval``. The
+        resting state is always written immediately.
+        """
+        if not desk.state.moving:
+            self._cancel_desk_flush_timer()
+            self._patch_data("desk", desk)
+            return
+        if self._cancel_desk_flush is not None:
+            self._pending_desk = desk
+            return
+        self._patch_data("desk", desk)
+        self._cancel_desk_flush = async_call_later(
+            self.hass, self.desk_motion_update_interval, self._async_flush_desk
+        )
+
+    @callback
+    def _async_flush_desk(self, _: datetime) -> None:
+        """Write the latest coalesced desk frame, if any."""
+        self._cancel_desk_flush = None
+        desk, self._pending_desk = self._pending_desk, None
+        if desk is not None:
+            self._async_coalesce_desk(desk)
+
+    def _cancel_desk_flush_timer(self) -> None:
+        """Drop coalesced desk frames and cancel the pending flush."""
+        self._pending_desk = None
+        if self._cancel_desk_flush is None:
+            return
+        self._cancel_desk_flush()
+        self._cancel_desk_flush = None
 
     async def _fetch_display_status(
-        self, display: DisplaySummary
-    ) -> tuple[str, Display]:
-        """Fetch authoritative status for a display."""
-        return str(display.bus), await self.client.get_display_status(display.bus)
+        self, display: DisplaySummary, semaphore: asyncio.Semaphore
+    ) -> tuple[str, Display | None]:
+        """Fetch authoritative status for a display within its deadline.
+
+        Returns ``None`` as the state when the display missed its deadline.
+        """
+        bus_id = str(display.bus)
+        async with semaphore:
+            try:
+                async with asyncio.timeout(self.display_status_timeout.total_seconds()):
+                    return bus_id, await self.client.get_display_status(display.bus)
+            except TimeoutError, NetlinkTimeoutError:
+                _LOGGER.debug("Display %s missed its status deadline", bus_id)
+                self.statistics["display_timeouts"] += 1
+                return bus_id, None
+
+    async def _async_update_data(self) -> NetlinkSnapshot:
+        """Fetch an authoritative state snapshot via REST API.
+
+        Periodic reconciliation passes the resources that were not confirmed by a
+        push since the previous snapshot; every other resource is carried over
+        from the current snapshot instead of being fetched again.
+        """
+        scope = _REFRESH_SCOPE.get()
+        if scope is not None and not self._push_updates_allowed():
+            # The connection dropped while the refresh waited for its turn;
+            # carried state may be stale, so recover everything.
+            scope = None
+        previous = self.data if scope is not None else None
+        carried = previous or NetlinkSnapshot()
+        self._reconciled_at = time.monotonic()
+
+        def needs(resource: str) -> bool:
+            return scope is None or previous is None or resource in scope
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch an authoritative state snapshot via REST API."""
         try:
-            device_info, desk_status, displays, browser_state = await asyncio.gather(
-                self.client.get_device_info(),
-                self.client.get_desk_status(),
-                self.client.get_displays(),
-                self.client.get_browser_status(),
+            requests = {
+                resource: request
+                for resource, request in (
+                    ("device_info", self.client.get_device_info),
+                    ("desk", self.client.get_desk_status),
+                    ("inventory", self.client.get_displays),
+                    ("browser", self.client.get_browser_status),
+                )
+                if needs(resource)
+            }
+            results = dict(
+                zip(
+                    requests,
+                    await asyncio.gather(*(request() for request in requests.values())),
+                    strict=True,
+                )
             )
+            device_info = results.get("device_info", self.device_info)
+            desk_status = results.get("desk", carried.desk)
+            if "desk" in results:
+                desk_status = self._reconcile_received("desk", desk_status)
+            browser_state = results.get("browser", carried.browser)
+            displays: list[DisplaySummary] = results.get(
+                "inventory", list(self.display_info.values())
+            )
+
+            display_states: dict[str, Display] = {}
+            displays_to_fetch: list[DisplaySummary] = []
+            for display in displays:
+                bus_id = str(display.bus)
+                current = carried.display(bus_id)
+                if current is None or needs(display_listener_key(bus_id)):
+                    displays_to_fetch.append(display)
+                else:
+                    display_states[bus_id] = current
+            semaphore = asyncio.Semaphore(self.display_status_concurrency)
             display_results = await asyncio.gather(
-                *[self._fetch_display_status(d) for d in displays]
+                *[self._fetch_display_status(d, semaphore) for d in displays_to_fetch]
+            )
+            timed_out: set[str] = set()
+            for bus_id, display_state in display_results:
+                if display_state is not None:
+                    display_states[bus_id] = self._reconcile_received(
+                        display_listener_key(bus_id), display_state
+                    )
+                    continue
+                # Keep the last known state of a display that missed its deadline;
+                # it is not confirmed, so the next reconciliation fetches it again.
+                timed_out.add(bus_id)
+                if (
+                    self.data is not None
+                    and (last_known := self.data.display(bus_id)) is not None
+                ):
+                    display_states[bus_id] = last_known
+            self.statistics["snapshot_requests"] += len(requests) + len(
+                displays_to_fetch
             )
-            display_states = dict(display_results)
 
-            coordinator_data: dict[str, Any] = {
-                "desk": desk_status,
-                "displays": display_states,
-                "browser": browser_state,
-            }
+            access_codes: AccessCodes | None = None
             authorization = self.client.authorization_state
             if authorization is not None:
-                coordinator_data["authorization"] = authorization
                 self._report_missing_commands(authorization)
 
             if (
@@ -203,11 +730,12 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 and authorization.receives_event(EVENT_ACCESS_CODES_STATE) is False
             ):
                 self.access_codes_status = "unauthorized"
+            elif not needs("access_codes"):
+                access_codes = carried.access_codes
             else:
+                self.statistics["snapshot_requests"] += 1
                 try:
-                    coordinator_data[
-                        "access_codes"
-                    ] = await self.client.get_access_codes()
+                    access_codes = await self.client.get_access_codes()
                 except NetlinkNotFoundError:
                     self.access_codes_status = "not_supported"
                 except NetlinkAuthenticationError:
@@ -219,6 +747,19 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 else:
                     self.access_codes_status = "available"
 
+            if (connecting := self._connecting) is not None:
+                # The initial snapshot overlaps the WebSocket handshake.
+                self._connecting = None
+                await connecting
+
+            coordinator_data = NetlinkSnapshot(
+                desk=desk_status,
+                browser=browser_state,
+                access_codes=access_codes,
+                authorization=authorization,
+                displays=display_states,
+            )
+
         except NetlinkAuthenticationError as err:
             self._mark_refresh_failed()
             raise ConfigEntryAuthFailed(
@@ -244,9 +785,13 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self._mark_refresh_failed()
                 raise UpdateFailed("WebSocket is disconnected")
             self.device_info = device_info
+            self.stale_displays = timed_out
             self.display_info = {str(d.bus): d for d in displays}
             self._track_bus_ids(displays)
             self._connectivity_state = _ConnectivityState.READY
+            self.snapshot_from_cache = False
+            self._index_authorization(authorization)
+            self._schedule_cache_save()
             return coordinator_data
 
     def _mark_refresh_failed(self) -> None:
@@ -269,7 +814,7 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns None when no data is available yet.
         """
         for data in (
-            self.data["displays"].get(bus_id) if self.data else None,
+            self.data.display(bus_id) if self.data else None,
             self.display_info.get(bus_id),
         ):
             if data is not None:
@@ -281,23 +826,50 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def authorization_state(self) -> AuthorizationState | None:
         """Return the current connection policy, if advertised by the server."""
-        if not self.data:
+        if self.data is None:
             return None
-        return self.data.get("authorization")
+        return self.data.authorization
 
     def command_allowed(self, command: str) -> bool:
         """Return whether the advertised policy permits a command.
 
         Older servers do not advertise a policy and retain their existing behavior.
         """
-        authorization = self.authorization_state
-        return authorization is None or authorization.allows_command(command)
+        return self._allowed_commands is None or command in self._allowed_commands
+
+    def _index_authorization(
+        self, authorization: AuthorizationState | None
+    ) -> frozenset[str]:
+        """Index the commands a policy permits and return those that flipped.
+
+        The index only changes with the policy version or its command set.
+        Only commands that entities listen to are reported.
+        """
+        if authorization is None:
+            policy_version, allowed = None, None
+        else:
+            policy_version = authorization.policy_version
+            allowed = authorization.allowed_commands
+        if policy_version == self._policy_version and allowed == self._allowed_commands:
+            return frozenset()
+        previous = self._allowed_commands
+        self._policy_version, self._allowed_commands = policy_version, allowed
+        flipped: set[str] = set()
+        for key in self._keyed_listeners:
+            if not key.startswith(COMMAND_LISTENER_PREFIX):
+                continue
+            command = key.removeprefix(COMMAND_LISTENER_PREFIX)
+            if (previous is None or command in previous) != (
+                allowed is None or command in allowed
+            ):
+                flipped.add(command)
+        return frozenset(flipped)
 
     @property
     def access_codes_known(self) -> bool:
         """Return whether access-code entities should be represented."""
         return bool(
-            (self.data and "access_codes" in self.data)
+            (self.data is not None and self.data.access_codes is not None)
             or self.access_codes_status == "unauthorized"
         )
 
@@ -305,8 +877,8 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def access_codes_available(self) -> bool:
         """Return whether access-code values are currently available."""
         return bool(
-            self.data
-            and "access_codes" in self.data
+            self.data is not None
+            and self.data.access_codes is not None
             and self.access_codes_status == "available"
         )
 
@@ -339,7 +911,160 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._access_codes_available_callbacks.append(callback)
 
     async def async_setup(self) -> None:
-        """Setup WebSocket listeners and fetch initial data."""
+        """Setup WebSocket listeners and fetch initial data.
+
+        The WebSocket handshake runs concurrently with the REST snapshot, which
+        waits for it before it completes; pushes that arrive in between are
+        replayed on top of the snapshot. The snapshot counts towards the
+        fleet-wide snapshot limit, so a restart does not query every device
+        at once.
+        """
+        started = time.monotonic()
+        self._register_event_handlers()
+        self._connecting = connecting = self.hass.async_create_task(
+            self._async_timed("connect", self._async_connect()),
+            f"{DOMAIN} connect {self.device_id}",
+        )
+        try:
+            async with self.scheduler.snapshots:
+                await self._async_timed(
+                    "snapshot", self.async_config_entry_first_refresh()
+                )
+        except BaseException:
+            connecting.cancel()
+            await asyncio.wait([connecting])
+            if not connecting.cancelled():
+                connecting.exception()  # Already reported through the snapshot.
+            await self.client.disconnect()
+            raise
+        finally:
+            self._connecting = None
+        await self._async_replay_buffered_pushes()
+        self._async_start()
+        self.setup_timings["total"] = round(time.monotonic() - started, 3)
+
+    async def _async_timed[T](self, phase: str, awaitable: Awaitable[T]) -> T:
+        """Await a setup phase and record how long it took in seconds."""
+        started = time.monotonic()
+        try:
+            return await awaitable
+        finally:
+            self.setup_timings[phase] = round(time.monotonic() - started, 3)
+
+    async def async_setup_from_cache(self) -> bool:
+        """Set up from the cached snapshot and connect in the background.
+
+        Entities are created from the last known state right away; the cached
+        state is replaced once the device answers. Returns False when no usable
+        cache exists.
+        """
+        if (cached := load_snapshot(await self._store.async_load())) is None:
+            return False
+        self.device_info = cached.device_info
+        self.display_info = {str(d.bus): d for d in cached.inventory}
+        self._track_bus_ids(cached.inventory)
+        self.data = cached.snapshot
+        self.snapshot_from_cache = True
+        self._register_event_handlers()
+        self._async_start()
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_connect_in_background(),
+            f"{DOMAIN} connect {self.device_id}",
+        )
+        return True
+
+    async def _async_connect_in_background(self, _: datetime | None = None) -> None:
+        """Connect after a cached setup, retrying with backoff until it succeeds."""
+        self._cancel_connect_retry = None
+        try:
+            await self._async_timed("connect", self._async_connect())
+        except NetlinkAuthenticationError:
+            self.async_set_update_error(
+                UpdateFailed("NetLink rejected the configured credentials")
+            )
+            self.config_entry.async_start_reauth(self.hass)
+            return
+        except NetlinkError as err:
+            self.async_set_update_error(
+                UpdateFailed(
+                    translation_domain=DOMAIN,
+                    translation_key="cannot_connect",
+                    translation_placeholders={
+                        "name": self.config_entry.title,
+                        "host": self.config_entry.data[CONF_HOST],
+                    },
+                )
+            )
+            _LOGGER.debug("NetLink %s is not reachable yet: %s", self.device_id, err)
+            delay = reconnect_backoff(self._reconnect_attempts)
+            self._reconnect_attempts += 1
+            self._cancel_connect_retry = async_call_later(
+                self.hass, delay, self._async_connect_in_background
+            )
+            return
+        self._reconnect_attempts = 0
+        self._connectivity_state = _ConnectivityState.RECOVERING
+        await self._async_reconnect()
+
+    async def _async_connect(self) -> None:
+        """Connect the WebSocket, closing it again when connecting fails."""
+        try:
+            await self.client.connect()
+        except Exception:
+            await self.client.disconnect()
+            raise
+
+    @callback
+    def _async_start(self) -> None:
+        """Start periodic reconciliation and clean up removed displays."""
+        self._cancel_reconciliation = self.scheduler.async_register(
+            self.config_entry.entry_id,
+            self._async_reconcile,
+            self.reconciliation_interval,
+        )
+        self._async_cleanup_stale_devices()
+
+    def _on_push(self, event: str) -> Callable[[PushHandler], PushHandler]:
+        """Register a push handler, capturing its events while capture is on."""
+
+        def register(handler: PushHandler) -> PushHandler:
+            self._push_handlers[event] = handler
+
+            async def dispatch(data: Any) -> None:
+                if self.capture is not None:
+                    self.capture.record(event, data)
+                await handler(data)
+
+            self.client.on(event)(dispatch)
+            return handler
+
+        return register
+
+    async def async_replay_event(self, event: str, data: Any) -> bool:
+        """Handle a captured push event; return False for unknown events."""
+        if (handler := self._push_handlers.get(event)) is None:
+            return False
+        await handler(data)
+        return True
+
+    @callback
+    def async_start_capture(self, path: Path) -> EventCapture:
+        """Start capturing received push events to ``path``."""
+        if self.capture is None:
+            self.capture = EventCapture(self.hass, path)
+        return self.capture
+
+    async def async_stop_capture(self) -> EventCapture | None:
+        """Stop capturing push events and write the buffered ones."""
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            await capture.async_close()
+        return capture
+
+    @callback
+    def _register_event_handlers(self) -> None:
+        """Register the WebSocket event handlers."""
 
         @self.client.on("connect")
         async def on_connect(_: dict[str, Any]) -> None:
@@ -351,11 +1076,11 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return
 
             self._cancel_disconnect_timer()
-            async with self._reconnect_lock:
-                if self._connectivity_state is _ConnectivityState.READY:
-                    return
-                self._connectivity_state = _ConnectivityState.RECOVERING
-                await self.async_refresh()
+            self._cancel_reconnect_retry_timer()
+            if self._connectivity_state is _ConnectivityState.READY:
+                return
+            self._connectivity_state = _ConnectivityState.RECOVERING
+            await self._async_reconnect()
 
         @self.client.on("disconnect")
         async def on_disconnect(_: dict[str, Any]) -> None:
@@ -364,20 +1089,26 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 return
 
             self._connectivity_state = _ConnectivityState.DISCONNECTED
+            self._cancel_reconnect_retry_timer()
             if self._cancel_disconnect_grace is not None:
                 return
             self._cancel_disconnect_grace = async_call_later(
                 self.hass,
-                WEBSOCKET_DISCONNECT_GRACE,
+                self.disconnect_grace,
                 self._async_disconnect_grace_elapsed,
             )
 
-        @self.client.on(EVENT_DEVICE_INFO)
+        @self._on_push(EVENT_DEVICE_INFO)
         async def on_device_info(data: dict[str, Any]) -> None:
             """Handle device info updates."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(EVENT_DEVICE_INFO, on_device_info, data):
+                return
+            device_info = DeviceInfo.from_dict(data)
+            self._confirm("device_info")
+            if device_info == self.device_info:
+                self.statistics["suppressed_updates"] += 1
                 return
-            self.device_info = DeviceInfo.from_dict(data)
+            self.device_info = device_info
             device_reg = dr.async_get(self.hass)
             for device in dr.async_entries_for_config_entry(
                 device_reg, self.config_entry.entry_id
@@ -387,27 +1118,31 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     sw_version=self.device_info.version,
                     model=self.device_info.model,
                 )
+            self._schedule_cache_save()
 
             # Keep coordinator updated so entities get a refresh signal.
             if self.data is not None:
                 self.async_set_updated_data(self.data)
 
-        @self.client.on(EVENT_DESK_STATE)
+        @self._on_push(EVENT_DESK_STATE)
         async def on_desk_state(data: dict[str, Any]) -> None:
             """Handle desk state updates."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(EVENT_DESK_STATE, on_desk_state, data):
                 return
             try:
                 desk = Desk.from_dict(data)
             except NetlinkDataError as exc:
                 _LOGGER.warning("Skipping incomplete desk state: %s", exc)
                 return
-            self._patch_data("desk", desk)
+            self._confirm("desk")
+            self._async_coalesce_desk(self._reconcile_received("desk", desk))
 
-        @self.client.on(EVENT_DISPLAY_STATE)
+        @self._on_push(EVENT_DISPLAY_STATE)
         async def on_display_state(data: dict[str, Any]) -> None:
             """Handle display state updates."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(
+                f"{EVENT_DISPLAY_STATE}/{data.get('bus')}", on_display_state, data
+            ):
                 return
             bus_id = str(data["bus"])
             try:
@@ -415,27 +1150,37 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except NetlinkDataError as exc:
                 _LOGGER.warning("Skipping incomplete display %s state: %s", bus_id, exc)
                 return
-            displays = dict((self.data or {}).get("displays", {}))
-            displays[bus_id] = display
-            self._patch_data("displays", displays)
+            self._confirm(display_listener_key(bus_id))
+            was_stale = bus_id in self.stale_displays
+            self.stale_displays.discard(bus_id)
+            self._patch_display(
+                bus_id,
+                self._reconcile_received(display_listener_key(bus_id), display),
+            )
+            if was_stale:
+                # An unchanged state still clears the stale flag of entities.
+                self._async_update_keyed_listeners(display_listener_key(bus_id))
             self._track_bus_id(bus_id)
 
-        @self.client.on(EVENT_BROWSER_STATE)
+        @self._on_push(EVENT_BROWSER_STATE)
         async def on_browser_state(data: dict[str, Any]) -> None:
             """Handle browser state updates."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(EVENT_BROWSER_STATE, on_browser_state, data):
                 return
             try:
                 browser = BrowserState.from_dict(data)
             except NetlinkDataError as exc:
                 _LOGGER.warning("Skipping incomplete browser state: %s", exc)
                 return
+            self._confirm("browser")
             self._patch_data("browser", browser)
 
-        @self.client.on(EVENT_ACCESS_CODES_STATE)
+        @self._on_push(EVENT_ACCESS_CODES_STATE)
         async def on_access_codes_state(data: dict[str, Any]) -> None:
             """Handle push updates for access codes."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(
+                EVENT_ACCESS_CODES_STATE, on_access_codes_state, data
+            ):
                 return
             authorization = self.authorization_state
             if (
@@ -451,14 +1196,15 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             except NetlinkDataError as exc:
                 _LOGGER.warning("Skipping incomplete access code state: %s", exc)
                 return
-            had_access_codes = "access_codes" in (self.data or {})
+            self._confirm("access_codes")
+            had_access_codes = self.data.access_codes is not None
             self.access_codes_status = "available"
             self._patch_data("access_codes", access_codes)
             if not had_access_codes:
                 for callback in self._access_codes_available_callbacks:
                     callback()
 
-        @self.client.on(EVENT_AUTHORIZATION_STATE)
+        @self._on_push(EVENT_AUTHORIZATION_STATE)
         async def on_authorization_state(data: dict[str, Any]) -> None:
             """Handle effective connection-policy updates."""
             try:
@@ -469,46 +1215,49 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
             self.last_authorization_failure = None
             self._report_missing_commands(authorization)
-            if not self._push_updates_allowed():
+            if self._push_deferred(
+                EVENT_AUTHORIZATION_STATE, on_authorization_state, data
+            ):
+                return
+            if authorization == self.authorization_state:
+                self.statistics["suppressed_updates"] += 1
                 return
 
+            previous_access_codes = (self.data.access_codes, self.access_codes_status)
             previous_access_codes_known = self.access_codes_known
-            updated_data = {**(self.data or {}), "authorization": authorization}
+            updated_data = self.data.replace(authorization=authorization)
             if authorization.receives_event(EVENT_ACCESS_CODES_STATE) is False:
-                updated_data.pop("access_codes", None)
+                updated_data = updated_data.replace(access_codes=None)
                 self.access_codes_status = "unauthorized"
-            elif "access_codes" in updated_data:
+            elif updated_data.access_codes is not None:
                 self.access_codes_status = "available"
             else:
                 self.access_codes_status = "unknown"
-            self.async_set_updated_data(updated_data)
+            # Only entities whose command permission flipped need a new state.
+            self.data = updated_data
+            for command in self._index_authorization(authorization):
+                self._async_update_keyed_listeners(command_listener_key(command))
+            if (updated_data.access_codes, self.access_codes_status) != (
+                previous_access_codes
+            ):
+                self._async_update_keyed_listeners("access_codes")
             if not previous_access_codes_known and self.access_codes_known:
                 for callback in self._access_codes_available_callbacks:
                     callback()
 
-        @self.client.on(EVENT_DISPLAYS_LIST)
+        @self._on_push(EVENT_DISPLAYS_LIST)
         async def on_displays_list(data: list[dict[str, Any]]) -> None:
             """Handle display list updates."""
-            if not self._push_updates_allowed():
+            if self._push_deferred(EVENT_DISPLAYS_LIST, on_displays_list, data):
                 return
             displays = [DisplaySummary.from_dict(item) for item in data]
-            self.display_info = {str(display.bus): display for display in displays}
+            self._confirm("inventory")
+            display_info = {str(display.bus): display for display in displays}
+            if display_info != self.display_info:
+                self.display_info = display_info
+                self._schedule_cache_save()
             self._track_bus_ids(displays)
 
-        try:
-            await self.client.connect()
-        except Exception:
-            await self.client.disconnect()
-            raise
-
-        await self.async_config_entry_first_refresh()
-        self._cancel_reconciliation = async_track_time_interval(
-            self.hass,
-            self._async_reconcile,
-            RECONCILIATION_INTERVAL,
-        )
-        self._async_cleanup_stale_devices()
-
     def _async_cleanup_stale_devices(self) -> None:
         """Remove display devices that are no longer in the webserver inventory."""
         device_reg = dr.async_get(self.hass)
@@ -528,8 +1277,16 @@ class NetlinkDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
         self._connectivity_state = _ConnectivityState.SHUTTING_DOWN
         self._cancel_disconnect_timer()
+        self._cancel_desk_flush_timer()
+        self._cancel_reconnect_retry_timer()
+        self.optimistic.clear()
+        if self._cancel_connect_retry is not None:
+            self._cancel_connect_retry()
+            self._cancel_connect_retry = None
+        self._recovery_buffer.clear()
         if self._cancel_reconciliation is not None:
             self._cancel_reconciliation()
             self._cancel_reconciliation = None
+        await self.async_stop_capture()
         await super().async_shutdown()
         await self.client.disconnect()
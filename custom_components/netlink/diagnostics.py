@@ -39,10 +39,9 @@ async def async_get_config_entry_diagnostics(
 
     # Serialize coordinator data
     coordinator_data_dict = {}
-    if coordinator.data:
+    if (snapshot := coordinator.data) is not None:
         # Desk data
-        if "desk" in coordinator.data:
-            desk = coordinator.data["desk"]
+        if (desk := snapshot.desk) is not None:
             coordinator_data_dict["desk"] = {
                 "capabilities": desk.capabilities,
                 "inventory": desk.inventory,
@@ -57,26 +56,24 @@ async def async_get_config_entry_diagnostics(
             }
 
         # Display data (Display objects with full state)
-        if "displays" in coordinator.data:
-            displays_dict = {}
-            for bus_id, display in coordinator.data["displays"].items():
-                displays_dict[bus_id] = {
-                    "bus": display.bus,
-                    "model": display.model,
-                    "type": display.type,
-                    "serial_number": display.serial_number,
-                    "state": {
-                        "power": display.state.power,
-                        "brightness": display.state.brightness,
-                        "volume": display.state.volume,
-                        "source": display.state.source,
-                        "error": display.state.error,
-                    },
-                }
-            coordinator_data_dict["displays"] = displays_dict
+        displays_dict = {}
+        for bus_id, display in snapshot.displays.items():
+            displays_dict[bus_id] = {
+                "bus": display.bus,
+                "model": display.model,
+                "type": display.type,
+                "serial_number": display.serial_number,
+                "state": {
+                    "power": display.state.power,
+                    "brightness": display.state.brightness,
+                    "volume": display.state.volume,
+                    "source": display.state.source,
+                    "error": display.state.error,
+                },
+            }
+        coordinator_data_dict["displays"] = displays_dict
 
-        if "access_codes" in coordinator.data:
-            access_codes = coordinator.data["access_codes"]
+        if (access_codes := snapshot.access_codes) is not None:
             coordinator_data_dict["access_codes"] = async_redact_data(
                 access_codes.to_dict(),
                 {"code"},
@@ -127,8 +124,25 @@ async def async_get_config_entry_diagnostics(
         "coordinator": {
             "name": coordinator.name,
             "last_update_success": coordinator.last_update_success,
+            "snapshot_from_cache": coordinator.snapshot_from_cache,
+            "setup_timings": coordinator.setup_timings,
             "data": coordinator_data_dict,
             "authorization": authorization_data,
+            "stale_displays": sorted(coordinator.stale_displays),
+            "pending_optimistic_updates": coordinator.optimistic.pending,
+            "acknowledgement_latency": {
+                command_type: histogram.as_dict()
+                for command_type, histogram in sorted(
+                    coordinator.acknowledgements.histograms.items()
+                )
+            },
+            "command_queue": {
+                "depth": coordinator.commands.depth,
+                "peak_depth": coordinator.commands.peak_depth,
+                "wait_mean": coordinator.commands.wait_mean,
+                "wait_max": coordinator.commands.wait_max,
+            },
+            "statistics": dict(sorted(coordinator.statistics.items())),
         },
         "client": client_state,
     }
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import re
+from typing import Any
 
 from pynetlink import (
     NetlinkAuthorizationError,
@@ -13,12 +15,17 @@ from pynetlink import (
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_DEVICE_ID, DOMAIN
-from .coordinator import NetlinkDataUpdateCoordinator
+from .coordinator import (
+    NetlinkDataUpdateCoordinator,
+    command_listener_key,
+    display_listener_key,
+)
 
 
 def _get_suggested_area(device_name: str | None) -> str | None:
@@ -33,6 +40,8 @@ class NetlinkBaseEntity(CoordinatorEntity[NetlinkDataUpdateCoordinator]):
     """Base entity for NetLink platforms."""
 
     command: str | None = None
+    listener_key: str | None = None
+    _last_rendered_state: tuple[Any, ...] | None = None
 
     def __init__(
         self,
@@ -47,6 +56,61 @@ class NetlinkBaseEntity(CoordinatorEntity[NetlinkDataUpdateCoordinator]):
         self.device_identifier = f"netlink-{self.device_id}"
         self.suggested_area = _get_suggested_area(self.device_name)
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to push updates for the coordinator data this entity renders.
+
+        Entities with a command also follow permission changes of that command.
+        """
+        await super().async_added_to_hass()
+        self._last_rendered_state = self._rendered_state()
+        for key in (
+            self.listener_key,
+            command_listener_key(self.command) if self.command is not None else None,
+        ):
+            if key is not None:
+                self.async_on_remove(
+                    self.coordinator.async_add_keyed_listener(
+                        key, self._handle_coordinator_update
+                    )
+                )
+
+    def _rendered_state(self) -> tuple[Any, ...]:
+        """Return everything this entity would write to the state machine."""
+        if not self.available:
+            return (False,)
+        return (
+            True,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+            self.capability_attributes,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the rendered state or attributes changed."""
+        rendered_state = self._rendered_state()
+        if rendered_state == self._last_rendered_state:
+            self.coordinator.statistics["suppressed_entity_writes"] += 1
+            return
+        self._last_rendered_state = rendered_state
+        self.coordinator.statistics["entity_writes"] += 1
+        self.async_write_ha_state()
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the rendered state may be outdated.
+
+        State restored from the snapshot cache is stale until the device
+        answers with a live snapshot.
+        """
+        return self.coordinator.snapshot_from_cache
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Flag state the device did not confirm in the last snapshot."""
+        return {"stale": True} if self.stale else None
+
     def _device_sw_version(self) -> str | None:
         """Return device software version if known."""
         return self.coordinator.device_info.version
@@ -109,14 +173,17 @@ class NetlinkDisplayEntity(NetlinkBaseEntity):
         """Initialize display entity."""
         super().__init__(coordinator, entry)
         self.bus_id = str(bus_id)
+        self.listener_key = display_listener_key(self.bus_id)
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the display missed its deadline in the last snapshot."""
+        return super().stale or self.bus_id in self.coordinator.stale_displays
 
     def _display_model(self) -> str:
         """Return display model name if known."""
-        display_info = self.coordinator.display_info
-        display_states = self.coordinator.data["displays"]
-
-        summary = display_info.get(self.bus_id)
-        state = display_states.get(self.bus_id)
+        summary = self.coordinator.display_info.get(self.bus_id)
+        state = self.coordinator.data.display(self.bus_id)
         return (
             getattr(summary, "model", None)
             or getattr(state, "model", None)
@@ -126,7 +193,7 @@ class NetlinkDisplayEntity(NetlinkBaseEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device registry info for the display."""
-        state = self.coordinator.data["displays"].get(self.bus_id)
+        state = self.coordinator.data.display(self.bus_id)
         serial = getattr(state, "serial_number", None) if state else None
         model = self._display_model()
 
@@ -0,0 +1,73 @@
+"""Structured display errors reported by NetLink."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+from typing import Any
+
+from .const import DISPLAY_ERROR_CACHE_SIZE
+
+DISPLAY_ERROR_OPTIONS = [
+    "ddc_timeout",
+    "unsupported_feature",
+    "monitor_missing",
+    "malformed_response",
+    "general_io_failure",
+    "profile_missing",
+    "state_mismatch",
+    "other",
+]
+
+DISPLAY_ERROR_ATTRIBUTE_KEYS = (
+    "stage",
+    "operation",
+    "reason",
+    "detail",
+    "exception_type",
+    "attempt",
+    "max_attempts",
+    "retry_outcome",
+    "elapsed_ms",
+    "bus",
+    "model",
+    "profile",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DisplayError:
+    """Parsed display error: its bounded reason and diagnostic fields."""
+
+    value: str
+    attributes: dict[str, Any]
+
+
+@lru_cache(maxsize=DISPLAY_ERROR_CACHE_SIZE)
+def parse_display_error(error: str) -> DisplayError:
+    """Parse a raw display error once; the result is shared and not mutated.
+
+    Every state write of an error entity reads both the reason and the
+    fields, so the parsed error is cached by its raw string.
+    """
+    try:
+        payload = json.loads(error)
+    except json.JSONDecodeError:
+        payload = None
+    attributes = (
+        {
+            key: payload[key]
+            for key in DISPLAY_ERROR_ATTRIBUTE_KEYS
+            if key in payload and payload[key] is not None
+        }
+        if isinstance(payload, dict)
+        else {}
+    )
+    if not attributes:
+        attributes = {"detail": error[:1024]}
+    reason = attributes.get("reason")
+    return DisplayError(
+        value=reason if reason in DISPLAY_ERROR_OPTIONS else "other",
+        attributes=attributes,
+    )
@@ -0,0 +1,117 @@
+"""Event platform for NetLink."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import Any
+
+from homeassistant.components.event import EventEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import NetlinkDataUpdateCoordinator
+from .entity import NetlinkBaseEntity, NetlinkControllerEntity, NetlinkDisplayEntity
+from .errors import DISPLAY_ERROR_OPTIONS, parse_display_error
+
+DESK_ERROR_EVENT = "error"
+
+
+class NetlinkErrorEvent(NetlinkBaseEntity, EventEntity):
+    """Fire an event for every new error a desk or display reports.
+
+    An error fires once when it appears or changes; the error that is already
+    reported when the entity is added does not fire.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _last_error: str | None = None
+
+    @abstractmethod
+    def _current_error(self) -> str | None:
+        """Return the raw error the device reports now."""
+
+    @abstractmethod
+    def _error_event(self, error: str) -> tuple[str, dict[str, Any]]:
+        """Return the event type and data of an error."""
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the reported error before listening for new ones."""
+        self._last_error = self._current_error()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Fire an event when the reported error changed to a new one."""
+        error = self._current_error()
+        if error != self._last_error:
+            self._last_error = error
+            if error:
+                self._trigger_event(*self._error_event(error))
+        super()._handle_coordinator_update()
+
+
+class NetlinkDeskErrorEvent(NetlinkErrorEvent, NetlinkControllerEntity):
+    """Desk error event."""
+
+    _attr_translation_key = "desk_error"
+    listener_key = "desk"
+
+    def __init__(
+        self, coordinator: NetlinkDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{self.device_id}_desk_error_event"
+        self._attr_event_types = [DESK_ERROR_EVENT]
+
+    def _current_error(self) -> str | None:
+        if (desk := self.coordinator.data.desk) is None:
+            return None
+        return desk.state.error
+
+    def _error_event(self, error: str) -> tuple[str, dict[str, Any]]:
+        return DESK_ERROR_EVENT, {"detail": error[:1024]}
+
+
+class NetlinkDisplayErrorEvent(NetlinkErrorEvent, NetlinkDisplayEntity):
+    """Display error event, typed by the reason of the error."""
+
+    _attr_translation_key = "display_error"
+
+    def __init__(
+        self, coordinator: NetlinkDataUpdateCoordinator, entry: ConfigEntry, bus_id: str
+    ) -> None:
+        super().__init__(coordinator, entry, bus_id)
+        self._attr_unique_id = f"{self.device_id}_display_{bus_id}_error_event"
+        self._attr_event_types = DISPLAY_ERROR_OPTIONS
+
+    def _current_error(self) -> str | None:
+        if (display := self.coordinator.data.display(self.bus_id)) is None:
+            return None
+        return display.state.error
+
+    def _error_event(self, error: str) -> tuple[str, dict[str, Any]]:
+        parsed = parse_display_error(str(error))
+        return parsed.value, parsed.attributes
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up NetLink event entities."""
+    coordinator: NetlinkDataUpdateCoordinator = entry.runtime_data
+
+    entities: list[EventEntity] = [NetlinkDeskErrorEvent(coordinator, entry)]
+    entities.extend(
+        NetlinkDisplayErrorEvent(coordinator, entry, bus_id)
+        for bus_id in sorted(coordinator.known_bus_ids)
+    )
+    async_add_entities(entities)
+
+    def _on_new_display(bus_id: str) -> None:
+        async_add_entities([NetlinkDisplayErrorEvent(coordinator, entry, bus_id)])
+
+    coordinator.async_add_new_display_callback(_on_new_display)
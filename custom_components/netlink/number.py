@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Callable
 
@@ -82,6 +83,7 @@ class NetlinkDeskNumber(NetlinkControllerEntity, NumberEntity):
     """Desk number entity."""
 
     _attr_has_entity_name = True
+    listener_key = "desk"
 
     def __init__(
         self,
@@ -96,12 +98,18 @@ class NetlinkDeskNumber(NetlinkControllerEntity, NumberEntity):
 
     @property
     def native_value(self) -> int | float | None:
-        data = self.coordinator.data["desk"]
+        data = self.coordinator.data.desk
         return self.entity_description.value_fn(data)
 
     async def async_set_native_value(self, value: float) -> None:
         try:
-            await self.coordinator.client.set_desk_height(value)
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                "height",
+                value,
+                self.coordinator.client.set_desk_height,
+                optimistic=False,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -127,7 +135,7 @@ class NetlinkDisplayNumber(NetlinkDisplayEntity, NumberEntity):
 
     @property
     def native_value(self) -> int | float | None:
-        data = self.coordinator.data["displays"].get(self.bus_id)
+        data = self.coordinator.data.display(self.bus_id)
         if data is None:
             return None
         return self.entity_description.value_fn(data)
@@ -141,8 +149,13 @@ class NetlinkDisplayNumber(NetlinkDisplayEntity, NumberEntity):
             _LOGGER.debug("Display %s does not support %s", self.bus_id, key)
             return
         try:
-            await self.entity_description.set_fn(
-                self.coordinator.client, self.bus_id, int(value)
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                key,
+                int(value),
+                partial(
+                    self.entity_description.set_fn, self.coordinator.client, self.bus_id
+                ),
             )
         except NetlinkCommandError as err:
             if str(err) == "unsupported_command":
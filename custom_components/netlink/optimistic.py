@@ -0,0 +1,133 @@
+"""Optimistic command state for NetLink entities."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from pynetlink import Desk, Display
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+def with_state[ModelT: (Desk, Display)](
+    model: ModelT, changes: dict[str, Any]
+) -> ModelT:
+    """Return a copy of a desk or display with state fields replaced."""
+    return replace(model, state=replace(model.state, **changes))
+
+
+@dataclass(slots=True)
+class PendingChange:
+    """A requested state value that the device has not confirmed yet."""
+
+    value: Any
+    authoritative: Any
+    cancel_timeout: CALLBACK_TYPE | None = None
+
+    def cancel(self) -> None:
+        """Stop waiting for the confirmation, if the value was sent."""
+        if self.cancel_timeout is not None:
+            self.cancel_timeout()
+            self.cancel_timeout = None
+
+
+class OptimisticState:
+    """Track requested state values until a push confirms them.
+
+    Values are keyed by the keyed-listener key of the desk or display and the
+    name of the state field. While a value is pending it is overlaid on every
+    state received for that key; a received state that matches it confirms
+    it. The ``timeout`` only starts once the command carrying the value was
+    sent, so a command waiting for its target or a slow acknowledgement is
+    not rolled back while it is still in flight. When the timeout passes
+    before a confirmation, ``on_expired`` is called so the coordinator can
+    restore the last authoritative value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout: timedelta,
+        statistics: Counter[str],
+        on_expired: Callable[[str, str], None],
+    ) -> None:
+        """Initialize the optimistic state tracker."""
+        self.hass = hass
+        self.timeout = timeout
+        self.statistics = statistics
+        self._on_expired = on_expired
+        self._pending: dict[str, dict[str, PendingChange]] = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of unconfirmed values."""
+        return sum(len(fields) for fields in self._pending.values())
+
+    @callback
+    def apply[ModelT: (Desk, Display)](
+        self, key: str, field: str, value: Any, model: ModelT
+    ) -> ModelT:
+        """Record a requested value and return the model showing it."""
+        fields = self._pending.setdefault(key, {})
+        authoritative = getattr(model.state, field)
+        if (previous := fields.pop(field, None)) is not None:
+            previous.cancel()
+            authoritative = previous.authoritative
+        fields[field] = PendingChange(value=value, authoritative=authoritative)
+        self.statistics["optimistic_applied"] += 1
+        return with_state(model, {field: value})
+
+    @callback
+    def sent(self, key: str, field: str, value: Any) -> None:
+        """Start waiting for the device to confirm a sent value."""
+        fields = self._pending.get(key, {})
+        if (change := fields.get(field)) is None or change.value != value:
+            return
+
+        @callback
+        def expired(_: datetime) -> None:
+            self._on_expired(key, field)
+
+        change.cancel()
+        change.cancel_timeout = async_call_later(self.hass, self.timeout, expired)
+
+    @callback
+    def reconcile[ModelT: (Desk, Display)](self, key: str, model: ModelT) -> ModelT:
+        """Confirm matching values and overlay the others on received state."""
+        if not (fields := self._pending.get(key)):
+            return model
+        overlay: dict[str, Any] = {}
+        for field, change in list(fields.items()):
+            received = getattr(model.state, field)
+            if received == change.value:
+                self.pop(key, field)
+                self.statistics["optimistic_confirmed"] += 1
+            else:
+                change.authoritative = received
+                overlay[field] = change.value
+        return with_state(model, overlay) if overlay else model
+
+    @callback
+    def pop(self, key: str, field: str) -> PendingChange | None:
+        """Stop tracking a value and return it, if it was pending."""
+        if (fields := self._pending.get(key)) is None:
+            return None
+        if (change := fields.pop(field, None)) is None:
+            return None
+        change.cancel()
+        if not fields:
+            del self._pending[key]
+        return change
+
+    @callback
+    def clear(self) -> None:
+        """Forget every pending value."""
+        for fields in self._pending.values():
+            for change in fields.values():
+                change.cancel()
+        self._pending.clear()
@@ -0,0 +1,143 @@
+"""Fleet-wide scheduling shared by all NetLink config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+import random
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    RECONCILIATION_INTERVAL,
+    RECONCILIATION_JITTER,
+    RECONNECT_BACKOFF,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_CONCURRENCY,
+    SNAPSHOT_CONCURRENCY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER: HassKey[NetlinkScheduler] = HassKey(DOMAIN)
+
+
+def reconnect_backoff(attempt: int) -> timedelta:
+    """Return the jittered delay before recovery attempt ``attempt + 1``.
+
+    The delay doubles per failed attempt up to ``RECONNECT_BACKOFF_MAX``; a
+    random half of it is cut off so entries that failed together spread out.
+    """
+    delay = min(RECONNECT_BACKOFF * 2**attempt, RECONNECT_BACKOFF_MAX)
+    return delay * (1 - random.random() / 2)
+
+
+class NetlinkScheduler:
+    """Spread periodic reconciliation of all entries across their intervals.
+
+    Every entry is due once per its own interval. Ticks are spaced so the
+    fleet reconciles at the combined rate of all entries, and each tick
+    reconciles at most the entry that has been due longest, so a restart does
+    not make every entry reconcile in the same second and a short interval on
+    one entry does not add load to the others. Jitter only shortens a slot,
+    and an entry may be reconciled up to that jitter before it is due, which
+    keeps every entry reconciled about once per interval. ``snapshots`` caps
+    the number of REST snapshots running at the same time across all entries,
+    and ``reconnects`` caps how many of those are recoveries after a reconnect.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: timedelta = RECONCILIATION_INTERVAL,
+        max_concurrent_snapshots: int = SNAPSHOT_CONCURRENCY,
+        max_concurrent_reconnects: int = RECONNECT_CONCURRENCY,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.interval = interval
+        self.snapshots = asyncio.Semaphore(max_concurrent_snapshots)
+        self.reconnects = asyncio.Semaphore(max_concurrent_reconnects)
+        self._reconcilers: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._intervals: dict[str, timedelta] = {}
+        self._due: dict[str, datetime] = {}
+        self._cancel_tick: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(
+        self,
+        entry_id: str,
+        reconcile: Callable[[], Awaitable[None]],
+        interval: timedelta | None = None,
+    ) -> CALLBACK_TYPE:
+        """Add an entry to the reconciliation rotation and return a remover."""
+        self._reconcilers[entry_id] = reconcile
+        self._intervals[entry_id] = interval or self.interval
+        # New entries take their turn in registration order.
+        self._due[entry_id] = dt_util.utcnow()
+        self._schedule_tick()
+
+        @callback
+        def unregister() -> None:
+            if self._reconcilers.pop(entry_id, None) is None:
+                return
+            del self._intervals[entry_id]
+            del self._due[entry_id]
+            self._schedule_tick()
+
+        return unregister
+
+    @callback
+    def async_set_interval(self, entry_id: str, interval: timedelta) -> None:
+        """Change the reconciliation interval of a registered entry."""
+        if (previous := self._intervals.get(entry_id, interval)) == interval:
+            return
+        self._intervals[entry_id] = interval
+        self._due[entry_id] += interval - previous
+        self._schedule_tick()
+
+    def _slot(self) -> timedelta:
+        """Return the jittered delay until the next tick."""
+        rate = sum(
+            1 / interval.total_seconds() for interval in self._intervals.values()
+        )
+        return timedelta(seconds=1 / rate) * (
+            1 - RECONCILIATION_JITTER * random.random()
+        )
+
+    def _schedule_tick(self) -> None:
+        """(Re)start the rotation timer for the current entries."""
+        if self._cancel_tick is not None:
+            self._cancel_tick()
+            self._cancel_tick = None
+        if self._reconcilers:
+            self._cancel_tick = async_call_later(self.hass, self._slot(), self._tick)
+
+    @callback
+    def _tick(self, now: datetime) -> None:
+        """Reconcile the entry that has been due longest, if any is due."""
+        self._cancel_tick = None
+        entry_id = min(self._due, key=self._due.__getitem__)
+        interval = self._intervals[entry_id]
+        if self._due[entry_id] - interval * RECONCILIATION_JITTER <= now:
+            self._due[entry_id] = now + interval
+            self.hass.async_create_background_task(
+                self._reconcilers[entry_id](),
+                f"{DOMAIN} reconcile {entry_id}",
+                eager_start=True,
+            )
+        self._schedule_tick()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> NetlinkScheduler:
+    """Return the scheduler shared by all NetLink entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = NetlinkScheduler(hass)
+    return scheduler
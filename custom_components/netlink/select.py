@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Callable
 
 from pynetlink import NetlinkCommandError, NetlinkConnectionError, NetlinkTimeoutError
@@ -52,7 +53,7 @@ class NetlinkDisplaySelect(NetlinkDisplayEntity, SelectEntity):
         self._attr_unique_id = f"{self.device_id}_display_{bus_id}_{description.key}"
         # Seed options from initial coordinator data so they remain available
         # even when the display temporarily disappears (e.g. after power-off).
-        initial = coordinator.data.get("displays", {}).get(bus_id)
+        initial = coordinator.data.display(bus_id)
         self._attr_options = (
             [str(item) for item in initial.source_options or []] if initial else []
         )
@@ -60,22 +61,29 @@ class NetlinkDisplaySelect(NetlinkDisplayEntity, SelectEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update options when coordinator data arrives, preserve last known on absence."""
-        data = self.coordinator.data.get("displays", {}).get(self.bus_id)
+        data = self.coordinator.data.display(self.bus_id)
         if data is not None:
             self._attr_options = [str(item) for item in data.source_options or []]
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
 
     @property
     def current_option(self) -> str | None:
-        data = self.coordinator.data["displays"].get(self.bus_id)
+        data = self.coordinator.data.display(self.bus_id)
         if data is None:
             return None
         return data.state.source
 
     async def async_select_option(self, option: str) -> None:
         try:
-            await self.entity_description.select_fn(
-                self.coordinator.client, self.bus_id, option
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                self.entity_description.key,
+                option,
+                partial(
+                    self.entity_description.select_fn,
+                    self.coordinator.client,
+                    self.bus_id,
+                ),
             )
         except NetlinkCommandError as err:
             raise self._command_error(err) from err
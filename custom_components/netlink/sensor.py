@@ -2,25 +2,33 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfLength
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfLength, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
-from .coordinator import NetlinkDataUpdateCoordinator
+from .acknowledgements import LatencyHistogram
+from .const import CONF_COMPACT_ENTITIES, DOMAIN
+from .coordinator import ACKNOWLEDGEMENTS_LISTENER_KEY, NetlinkDataUpdateCoordinator
 from .entity import NetlinkControllerEntity, NetlinkDisplayEntity
+from .errors import (
+    DISPLAY_ERROR_ATTRIBUTE_KEYS,
+    DISPLAY_ERROR_OPTIONS,
+    parse_display_error,
+)
 
 
 @dataclass(kw_only=True)
@@ -28,60 +36,32 @@ class NetlinkSensorEntityDescription(SensorEntityDescription):
     """Sensor entity description with value resolver."""
 
     value_fn: Callable[[object], int | float | str | bool | None]
+    # Whether a control entity of the display renders the same field; such
+    # sensors are not created in compact mode
+    has_control_fn: Callable[[NetlinkDataUpdateCoordinator, str], bool] | None = None
 
 
-DISPLAY_ERROR_OPTIONS = [
-    "ddc_timeout",
-    "unsupported_feature",
-    "monitor_missing",
-    "malformed_response",
-    "general_io_failure",
-    "profile_missing",
-    "state_mismatch",
-    "other",
-]
-
-_DISPLAY_ERROR_ATTRIBUTE_KEYS = (
-    "stage",
-    "operation",
-    "reason",
-    "detail",
-    "exception_type",
-    "attempt",
-    "max_attempts",
-    "retry_outcome",
-    "elapsed_ms",
-    "bus",
-    "model",
-    "profile",
-)
+def _has_control(
+    capability: str,
+) -> Callable[[NetlinkDataUpdateCoordinator, str], bool]:
+    """Return whether a display gets the control entity of a capability."""
+    return lambda coordinator, bus_id: (
+        coordinator.display_supports(bus_id, capability) is not False
+    )
 
 
 def _display_error_attributes(error: str | None) -> dict[str, Any] | None:
     """Return safe structured diagnostics without exposing JSON as entity state."""
     if not error:
         return None
-    try:
-        payload = json.loads(error)
-    except json.JSONDecodeError, TypeError:
-        return {"detail": str(error)[:1024]}
-    if not isinstance(payload, dict):
-        return {"detail": str(error)[:1024]}
-    attributes = {
-        key: payload[key]
-        for key in _DISPLAY_ERROR_ATTRIBUTE_KEYS
-        if key in payload and payload[key] is not None
-    }
-    return attributes or {"detail": str(error)[:1024]}
+    return parse_display_error(str(error)).attributes
 
 
 def _display_error_value(error: str | None) -> str | None:
     """Return a bounded, translatable display-error state."""
-    attributes = _display_error_attributes(error)
-    if attributes is None:
+    if not error:
         return None
-    reason = attributes.get("reason")
-    return reason if reason in DISPLAY_ERROR_OPTIONS else "other"
+    return parse_display_error(str(error)).value
 
 
 DESK_SENSORS: list[NetlinkSensorEntityDescription] = [
@@ -113,22 +93,27 @@ DISPLAY_SENSORS: list[NetlinkSensorEntityDescription] = [
         translation_key="display_brightness",
         native_unit_of_measurement=PERCENTAGE,
         value_fn=lambda data: data.state.brightness,
+        has_control_fn=_has_control("brightness"),
     ),
     NetlinkSensorEntityDescription(
         key="volume",
         translation_key="display_volume",
         native_unit_of_measurement=PERCENTAGE,
         value_fn=lambda data: data.state.volume,
+        has_control_fn=_has_control("volume"),
     ),
     NetlinkSensorEntityDescription(
         key="power",
         translation_key="display_power",
         value_fn=lambda data: data.state.power,
+        # The power switch is created for every display.
+        has_control_fn=lambda coordinator, bus_id: True,
     ),
     NetlinkSensorEntityDescription(
         key="source",
         translation_key="display_source",
         value_fn=lambda data: data.state.source,
+        has_control_fn=_has_control("source"),
     ),
     NetlinkSensorEntityDescription(
         key="error",
@@ -199,10 +184,39 @@ ACCESS_CODE_SENSORS: list[NetlinkSensorEntityDescription] = [
 ]
 
 
+def _acknowledgement_sensor(command_type: str) -> NetlinkSensorEntityDescription:
+    """Describe the confirmation latency sensor of a command type."""
+    return NetlinkSensorEntityDescription(
+        key=f"{command_type}_latency",
+        translation_key=f"{command_type}_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda histogram: histogram.quantile(0.5),
+    )
+
+
+ACKNOWLEDGEMENT_SENSORS: list[NetlinkSensorEntityDescription] = [
+    _acknowledgement_sensor(command_type)
+    for command_type in (
+        "desk_height",
+        "desk_beep",
+        "display_power",
+        "display_brightness",
+        "display_volume",
+        "display_source",
+    )
+]
+
+
 class NetlinkBrowserSensor(NetlinkControllerEntity, SensorEntity):
     """Browser controller sensor."""
 
     _attr_has_entity_name = True
+    listener_key = "browser"
 
     def __init__(
         self,
@@ -216,7 +230,7 @@ class NetlinkBrowserSensor(NetlinkControllerEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        data = self.coordinator.data["browser"]
+        data = self.coordinator.data.browser
         return self.entity_description.value_fn(data)
 
 
@@ -224,6 +238,7 @@ class NetlinkDeskSensor(NetlinkControllerEntity, SensorEntity):
     """Desk sensor."""
 
     _attr_has_entity_name = True
+    listener_key = "desk"
 
     def __init__(
         self,
@@ -237,13 +252,16 @@ class NetlinkDeskSensor(NetlinkControllerEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | float | str | bool | None:
-        data = self.coordinator.data["desk"]
+        data = self.coordinator.data.desk
         return self.entity_description.value_fn(data)
 
 
 class NetlinkDisplaySensor(NetlinkDisplayEntity, SensorEntity):
     """Display sensor."""
 
+    # Error occurrences and their fields are recorded by the error event entity.
+    _unrecorded_attributes = frozenset(DISPLAY_ERROR_ATTRIBUTE_KEYS)
+
     def __init__(
         self,
         coordinator: NetlinkDataUpdateCoordinator,
@@ -257,7 +275,7 @@ class NetlinkDisplaySensor(NetlinkDisplayEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | float | str | bool | None:
-        data = self.coordinator.data["displays"].get(self.bus_id)
+        data = self.coordinator.data.display(self.bus_id)
         if data is None:
             return None
         return self.entity_description.value_fn(data)
@@ -265,18 +283,23 @@ class NetlinkDisplaySensor(NetlinkDisplayEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Expose structured display diagnostics as attributes on the error sensor."""
+        attributes = super().extra_state_attributes
         if self.entity_description.key != "error":
-            return None
-        data = self.coordinator.data["displays"].get(self.bus_id)
+            return attributes
+        data = self.coordinator.data.display(self.bus_id)
         if data is None:
-            return None
-        return _display_error_attributes(data.state.error)
+            return attributes
+        error_attributes = _display_error_attributes(data.state.error)
+        if error_attributes is None or attributes is None:
+            return error_attributes or attributes
+        return {**error_attributes, **attributes}
 
 
 class NetlinkAccessCodeSensor(NetlinkControllerEntity, SensorEntity):
     """Access code diagnostic sensor."""
 
     _attr_has_entity_name = True
+    listener_key = "access_codes"
 
     def __init__(
         self,
@@ -290,7 +313,7 @@ class NetlinkAccessCodeSensor(NetlinkControllerEntity, SensorEntity):
 
     @property
     def native_value(self) -> int | float | str | bool | None:
-        data = self.coordinator.data.get("access_codes")
+        data = self.coordinator.data.access_codes
         if data is None:
             return None
         return self.entity_description.value_fn(data)
@@ -301,6 +324,90 @@ class NetlinkAccessCodeSensor(NetlinkControllerEntity, SensorEntity):
         return super().available and self.coordinator.access_codes_available
 
 
+class NetlinkAcknowledgementSensor(NetlinkControllerEntity, SensorEntity):
+    """Median time until received state confirms a command type."""
+
+    _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset({"p95", "max", "count"})
+    listener_key = ACKNOWLEDGEMENTS_LISTENER_KEY
+
+    def __init__(
+        self,
+        coordinator: NetlinkDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: NetlinkSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry)
+        self.entity_description = description
+        self.command_type = description.key.removesuffix("_latency")
+        self._attr_unique_id = f"{self.device_id}_{description.key}"
+
+    @property
+    def _histogram(self) -> LatencyHistogram | None:
+        return self.coordinator.acknowledgements.histograms.get(self.command_type)
+
+    @property
+    def native_value(self) -> float | None:
+        if (histogram := self._histogram) is None:
+            return None
+        return self.entity_description.value_fn(histogram)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Expose the tail latency and sample count."""
+        if (histogram := self._histogram) is None:
+            return None
+        return {
+            "p95": histogram.quantile(0.95),
+            "max": histogram.max,
+            "count": histogram.count,
+        }
+
+
+def _compacted(
+    coordinator: NetlinkDataUpdateCoordinator,
+    entry: ConfigEntry,
+    bus_id: str,
+    description: NetlinkSensorEntityDescription,
+) -> bool:
+    """Return whether compact mode leaves out a display sensor."""
+    return (
+        entry.options.get(CONF_COMPACT_ENTITIES, False)
+        and description.has_control_fn is not None
+        and description.has_control_fn(coordinator, bus_id)
+    )
+
+
+def _display_sensors(
+    coordinator: NetlinkDataUpdateCoordinator, entry: ConfigEntry, bus_id: str
+) -> list[NetlinkDisplaySensor]:
+    """Return the sensors of a display."""
+    return [
+        NetlinkDisplaySensor(coordinator, entry, bus_id, description)
+        for description in DISPLAY_SENSORS
+        if not _compacted(coordinator, entry, bus_id, description)
+    ]
+
+
+@callback
+def _async_remove_compacted_sensors(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: NetlinkDataUpdateCoordinator,
+) -> None:
+    """Remove registry entries of sensors that compact mode leaves out."""
+    entity_registry = er.async_get(hass)
+    for bus_id in coordinator.known_bus_ids:
+        for description in DISPLAY_SENSORS:
+            if not _compacted(coordinator, entry, bus_id, description):
+                continue
+            unique_id = f"{coordinator.device_id}_display_{bus_id}_{description.key}"
+            if entity_id := entity_registry.async_get_entity_id(
+                SENSOR_DOMAIN, DOMAIN, unique_id
+            ):
+                entity_registry.async_remove(entity_id)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -317,6 +424,10 @@ async def async_setup_entry(
         NetlinkDeskSensor(coordinator, entry, description)
         for description in DESK_SENSORS
     )
+    entities.extend(
+        NetlinkAcknowledgementSensor(coordinator, entry, description)
+        for description in ACKNOWLEDGEMENT_SENSORS
+    )
     if coordinator.access_codes_known:
         entities.extend(
             NetlinkAccessCodeSensor(coordinator, entry, description)
@@ -324,20 +435,13 @@ async def async_setup_entry(
         )
 
     for bus_id in sorted(coordinator.known_bus_ids):
-        for description in DISPLAY_SENSORS:
-            entities.append(
-                NetlinkDisplaySensor(coordinator, entry, bus_id, description)
-            )
+        entities.extend(_display_sensors(coordinator, entry, bus_id))
+    _async_remove_compacted_sensors(hass, entry, coordinator)
 
     async_add_entities(entities)
 
     def _on_new_display(bus_id: str) -> None:
-        async_add_entities(
-            [
-                NetlinkDisplaySensor(coordinator, entry, bus_id, description)
-                for description in DISPLAY_SENSORS
-            ]
-        )
+        async_add_entities(_display_sensors(coordinator, entry, bus_id))
 
     coordinator.async_add_new_display_callback(_on_new_display)
 
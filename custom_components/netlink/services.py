@@ -0,0 +1,292 @@
+"""Services for the NetLink integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+import time
+from typing import Any
+
+from pynetlink import (
+    NetlinkAuthorizationError,
+    NetlinkClient,
+    NetlinkCommandError,
+    NetlinkConnectionError,
+    NetlinkTimeoutError,
+)
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import BATCH_CONCURRENCY, BATCH_DEVICE_CONCURRENCY, DOMAIN
+from .coordinator import NetlinkDataUpdateCoordinator, display_listener_key
+
+SERVICE_BATCH_COMMAND = "batch_command"
+SERVICE_CAPTURE_EVENTS = "capture_events"
+
+ATTR_COMMAND = "command"
+ATTR_DISPLAYS = "displays"
+ATTR_ENABLED = "enabled"
+ATTR_MAX_PARALLEL = "max_parallel"
+ATTR_MAX_PARALLEL_PER_DEVICE = "max_parallel_per_device"
+ATTR_VALUE = "value"
+
+
+@dataclass(frozen=True, kw_only=True)
+class BatchCommand:
+    """Display command that can be sent by ``netlink.batch_command``."""
+
+    command: str
+    coerce: Callable[[Any], Any]
+    send_fn: Callable[[NetlinkClient, str, Any], Awaitable[None]]
+
+
+BATCH_COMMANDS: dict[str, BatchCommand] = {
+    "power": BatchCommand(
+        command="command.display.power",
+        coerce=vol.In(["on", "off"]),
+        send_fn=lambda client, bus_id, value: client.set_display_power(bus_id, value),
+    ),
+    "brightness": BatchCommand(
+        command="command.display.brightness",
+        coerce=vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        send_fn=lambda client, bus_id, value: client.set_display_brightness(
+            bus_id, value
+        ),
+    ),
+    "volume": BatchCommand(
+        command="command.display.volume",
+        coerce=vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        send_fn=lambda client, bus_id, value: client.set_display_volume(bus_id, value),
+    ),
+    "source": BatchCommand(
+        command="command.display.source",
+        coerce=cv.string,
+        send_fn=lambda client, bus_id, value: client.set_display_source(bus_id, value),
+    ),
+}
+
+
+def _validate_value(data: dict[str, Any]) -> dict[str, Any]:
+    """Coerce the value for the requested command."""
+    value = BATCH_COMMANDS[data[ATTR_COMMAND]].coerce(data[ATTR_VALUE])
+    return {**data, ATTR_VALUE: value}
+
+
+BATCH_COMMAND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_DISPLAYS): vol.All(
+                cv.ensure_list, [vol.All(vol.Coerce(str), cv.string)]
+            ),
+            vol.Required(ATTR_COMMAND): vol.In(BATCH_COMMANDS),
+            vol.Required(ATTR_VALUE): cv.match_all,
+            vol.Optional(ATTR_MAX_PARALLEL, default=BATCH_CONCURRENCY): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(
+                ATTR_MAX_PARALLEL_PER_DEVICE, default=BATCH_DEVICE_CONCURRENCY
+            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        }
+    ),
+    _validate_value,
+)
+
+CAPTURE_EVENTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_ENABLED): cv.boolean,
+    }
+)
+
+
+def _loaded_coordinators(
+    hass: HomeAssistant, entry_ids: list[str] | None
+) -> list[NetlinkDataUpdateCoordinator]:
+    """Return the coordinators of the requested, or all, loaded entries."""
+    if entry_ids is None:
+        return [
+            entry.runtime_data
+            for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+        ]
+    coordinators = []
+    for entry_id in entry_ids:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+        coordinators.append(entry.runtime_data)
+    return coordinators
+
+
+def _error_key(coordinator: NetlinkDataUpdateCoordinator, err: Exception) -> str:
+    """Return the result code of a failed command, like entity errors."""
+    if isinstance(err, NetlinkAuthorizationError):
+        coordinator.record_authorization_failure(err)
+        return "command_not_authorized"
+    if isinstance(err, (NetlinkConnectionError, NetlinkTimeoutError)):
+        return "command_unavailable"
+    return "command_failed"
+
+
+async def _async_send_batch_command(
+    coordinator: NetlinkDataUpdateCoordinator,
+    bus_id: str,
+    batch_command: BatchCommand,
+    field: str,
+    value: Any,
+    limits: tuple[asyncio.Semaphore, asyncio.Semaphore],
+) -> dict[str, Any]:
+    """Send one command of a batch and return its result."""
+    result: dict[str, Any] = {
+        "config_entry_id": coordinator.config_entry.entry_id,
+        "display": bus_id,
+    }
+    if not coordinator.command_allowed(batch_command.command):
+        return {**result, "success": False, "error": "command_not_authorized"}
+    if coordinator.display_supports(bus_id, field) is False:
+        return {**result, "success": False, "error": "unsupported"}
+
+    device_limit, fleet_limit = limits
+    async with device_limit, fleet_limit:
+        started = time.monotonic()
+        try:
+            await coordinator.async_send_command(
+                display_listener_key(bus_id),
+                field,
+                value,
+                partial(batch_command.send_fn, coordinator.client, bus_id),
+            )
+        except (
+            NetlinkCommandError,
+            NetlinkConnectionError,
+            NetlinkTimeoutError,
+        ) as err:
+            result.update(success=False, error=_error_key(coordinator, err))
+        else:
+            result.update(success=True, error=None)
+        result["latency"] = round(time.monotonic() - started, 3)
+    return result
+
+
+async def _async_batch_command(call: ServiceCall) -> ServiceResponse:
+    """Send a display command to many displays across entries."""
+    coordinators = _loaded_coordinators(call.hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+    field = call.data[ATTR_COMMAND]
+    batch_command = BATCH_COMMANDS[field]
+    displays = call.data.get(ATTR_DISPLAYS)
+
+    targets: list[tuple[NetlinkDataUpdateCoordinator, str]] = []
+    unknown = set(displays or ())
+    for coordinator in coordinators:
+        bus_ids = coordinator.known_bus_ids
+        if displays is not None:
+            bus_ids = bus_ids.intersection(displays)
+            unknown.difference_update(bus_ids)
+        targets.extend((coordinator, bus_id) for bus_id in sorted(bus_ids))
+    if not targets:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_batch_targets"
+        )
+
+    fleet_limit = asyncio.Semaphore(call.data[ATTR_MAX_PARALLEL])
+    device_limits = {
+        coordinator: asyncio.Semaphore(call.data[ATTR_MAX_PARALLEL_PER_DEVICE])
+        for coordinator in coordinators
+    }
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(
+            _async_send_batch_command(
+                coordinator,
+                bus_id,
+                batch_command,
+                field,
+                call.data[ATTR_VALUE],
+                (device_limits[coordinator], fleet_limit),
+            )
+            for coordinator, bus_id in targets
+        )
+    )
+    # Displays no selected controller knows would otherwise vanish silently.
+    results.extend(
+        {
+            "config_entry_id": None,
+            "display": bus_id,
+            "success": False,
+            "error": "unknown_display",
+        }
+        for bus_id in sorted(unknown)
+    )
+    succeeded = sum(result["success"] for result in results)
+    return {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "duration": round(time.monotonic() - started, 3),
+        "results": results,
+    }
+
+
+async def _async_capture_events(call: ServiceCall) -> ServiceResponse:
+    """Start or stop capturing the WebSocket events of entries."""
+    coordinators = _loaded_coordinators(call.hass, call.data.get(ATTR_CONFIG_ENTRY_ID))
+    captures = []
+    for coordinator in coordinators:
+        if call.data[ATTR_ENABLED]:
+            capture = coordinator.async_start_capture(
+                Path(
+                    call.hass.config.path(
+                        DOMAIN, f"capture-{coordinator.device_id}.jsonl"
+                    )
+                )
+            )
+        elif (capture := await coordinator.async_stop_capture()) is None:
+            continue
+        captures.append(
+            {
+                "config_entry_id": coordinator.config_entry.entry_id,
+                "path": str(capture.path),
+                "events": capture.events,
+            }
+        )
+    return {"captures": captures}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the NetLink services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH_COMMAND,
+        _async_batch_command,
+        schema=BATCH_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CAPTURE_EVENTS,
+        _async_capture_events,
+        schema=CAPTURE_EVENTS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,173 @@
+"""Immutable coordinator data snapshot for NetLink."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Self
+
+from pynetlink import AccessCodes, AuthorizationState, BrowserState, Desk, Display
+
+# Number of single-display layers kept before they are folded into a new base.
+_MAX_DISPLAY_LAYERS = 8
+
+
+class DisplayStates(Mapping[str, Display]):
+    """Immutable mapping of display states by bus ID.
+
+    Replacing a display stacks a single-entry layer on the previous mapping
+    instead of copying it, so unchanged displays are shared between
+    snapshots. Layers are folded into a fresh base once more than
+    ``_MAX_DISPLAY_LAYERS`` are stacked, which keeps lookups short. An update
+    allocates a single-entry layer, plus a copy of all n displays on every
+    ``_MAX_DISPLAY_LAYERS``-th update, so its amortized cost is
+    O(n / ``_MAX_DISPLAY_LAYERS``) rather than O(1). Iteration and ``len``
+    use a flattened view that costs O(n) to build the first time a mapping
+    is iterated, and is cached after that.
+    """
+
+    __slots__ = ("_depth", "_flat", "_items", "_parent")
+
+    _depth: int
+    _flat: dict[str, Display] | None
+    _items: dict[str, Display]
+    _parent: DisplayStates | None
+
+    def __init__(self, displays: Mapping[str, Display] | None = None) -> None:
+        """Initialize the mapping from display states by bus ID."""
+        self._items = dict(displays or {})
+        self._parent = None
+        self._depth = 0
+        self._flat = self._items
+
+    def set(self, bus_id: str, display: Display) -> DisplayStates:
+        """Return a mapping with a single display state replaced or added."""
+        if self._depth >= _MAX_DISPLAY_LAYERS:
+            return DisplayStates({**self._flatten(), bus_id: display})
+        layer = DisplayStates.__new__(DisplayStates)
+        layer._items = {bus_id: display}
+        layer._parent = self
+        layer._depth = self._depth + 1
+        layer._flat = None
+        return layer
+
+    def _flatten(self) -> dict[str, Display]:
+        """Return all display states as a plain dict; do not mutate it."""
+        if self._flat is None:
+            self._flat = {**self._parent._flatten(), **self._items}
+        return self._flat
+
+    def __getitem__(self, bus_id: str) -> Display:
+        """Return the state of a display."""
+        node: DisplayStates | None = self
+        while node is not None:
+            if bus_id in node._items:
+                return node._items[bus_id]
+            node = node._parent
+        raise KeyError(bus_id)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over bus IDs."""
+        return iter(self._flatten())
+
+    def __len__(self) -> int:
+        """Return the number of displays."""
+        return len(self._flatten())
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"DisplayStates({self._flatten()!r})"
+
+
+class NetlinkSnapshot:
+    """Immutable state snapshot shared by the coordinator and its entities.
+
+    Updates return a new snapshot that shares every unchanged branch with
+    the previous one.
+    """
+
+    __slots__ = ("_access_codes", "_authorization", "_browser", "_desk", "_displays")
+
+    _access_codes: AccessCodes | None
+    _authorization: AuthorizationState | None
+    _browser: BrowserState | None
+    _desk: Desk | None
+    _displays: DisplayStates
+
+    def __init__(
+        self,
+        *,
+        desk: Desk | None = None,
+        browser: BrowserState | None = None,
+        access_codes: AccessCodes | None = None,
+        authorization: AuthorizationState | None = None,
+        displays: DisplayStates | Mapping[str, Display] | None = None,
+    ) -> None:
+        """Initialize the snapshot."""
+        object.__setattr__(self, "_desk", desk)
+        object.__setattr__(self, "_browser", browser)
+        object.__setattr__(self, "_access_codes", access_codes)
+        object.__setattr__(self, "_authorization", authorization)
+        object.__setattr__(
+            self,
+            "_displays",
+            displays
+            if isinstance(displays, DisplayStates)
+            else DisplayStates(displays),
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject mutation; use ``replace`` or ``with_display`` instead."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def desk(self) -> Desk | None:
+        """Return the desk state."""
+        return self._desk
+
+    @property
+    def browser(self) -> BrowserState | None:
+        """Return the browser state."""
+        return self._browser
+
+    @property
+    def access_codes(self) -> AccessCodes | None:
+        """Return the access codes, if available and authorized."""
+        return self._access_codes
+
+    @property
+    def authorization(self) -> AuthorizationState | None:
+        """Return the advertised connection policy, if any."""
+        return self._authorization
+
+    @property
+    def displays(self) -> DisplayStates:
+        """Return display states by bus ID."""
+        return self._displays
+
+    def display(self, bus_id: str) -> Display | None:
+        """Return the state of a single display, if known."""
+        return self._displays.get(bus_id)
+
+    def replace(self, **changes: Any) -> Self:
+        """Return a snapshot with the given top-level branches replaced."""
+        values = {
+            "desk": self._desk,
+            "browser": self._browser,
+            "access_codes": self._access_codes,
+            "authorization": self._authorization,
+            "displays": self._displays,
+        }
+        values.update(changes)
+        return type(self)(**values)
+
+    def with_display(self, bus_id: str, display: Display) -> Self:
+        """Return a snapshot with a single display state replaced."""
+        return self.replace(displays=self._displays.set(bus_id, display))
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return (
+            f"NetlinkSnapshot(desk={self._desk!r}, browser={self._browser!r}, "
+            f"access_codes={'set' if self._access_codes else None}, "
+            f"authorization={self._authorization!r}, displays={self._displays!r})"
+        )
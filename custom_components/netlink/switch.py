@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Callable
 
 from pynetlink import (
@@ -59,6 +60,7 @@ class NetlinkDeskSwitch(NetlinkControllerEntity, SwitchEntity):
     """Desk switch."""
 
     _attr_has_entity_name = True
+    listener_key = "desk"
 
     def __init__(
         self,
@@ -73,15 +75,23 @@ class NetlinkDeskSwitch(NetlinkControllerEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        data = self.coordinator.data["desk"]
+        data = self.coordinator.data.desk
         value = self.entity_description.value_fn(data)
         if isinstance(value, str):
             return value == "on"
         return bool(value)
 
+    async def _set_beep(self, state: str) -> None:
+        await self.coordinator.client.set_desk_beep(state=state)
+
     async def async_turn_on(self, **_: Any) -> None:
         try:
-            await self.coordinator.client.set_desk_beep(state="on")
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                "beep",
+                "on",
+                self._set_beep,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -91,7 +101,12 @@ class NetlinkDeskSwitch(NetlinkControllerEntity, SwitchEntity):
 
     async def async_turn_off(self, **_: Any) -> None:
         try:
-            await self.coordinator.client.set_desk_beep(state="off")
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                "beep",
+                "off",
+                self._set_beep,
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -117,7 +132,7 @@ class NetlinkDisplaySwitch(NetlinkDisplayEntity, SwitchEntity):
 
     @property
     def is_on(self) -> bool | None:
-        data = self.coordinator.data["displays"].get(self.bus_id)
+        data = self.coordinator.data.display(self.bus_id)
         if data is None:
             return None
         value = self.entity_description.value_fn(data)
@@ -127,7 +142,12 @@ class NetlinkDisplaySwitch(NetlinkDisplayEntity, SwitchEntity):
 
     async def async_turn_on(self, **_: Any) -> None:
         try:
-            await self.coordinator.client.set_display_power(self.bus_id, "on")
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                "power",
+                "on",
+                partial(self.coordinator.client.set_display_power, self.bus_id),
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
@@ -137,7 +157,12 @@ class NetlinkDisplaySwitch(NetlinkDisplayEntity, SwitchEntity):
 
     async def async_turn_off(self, **_: Any) -> None:
         try:
-            await self.coordinator.client.set_display_power(self.bus_id, "off")
+            await self.coordinator.async_send_command(
+                self.listener_key,
+                "power",
+                "off",
+                partial(self.coordinator.client.set_display_power, self.bus_id),
+            )
         except (
             NetlinkCommandError,
             NetlinkConnectionError,
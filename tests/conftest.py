@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import AsyncGenerator, Generator
 from typing import Any
 from unittest.mock import patch
@@ -72,6 +73,7 @@ class FakeNetlinkClient:
         self.display_error: Exception | None = None
         self.access_codes_error: Exception | None = None
         self.access_codes_calls = 0
+        self.rest_calls: Counter[str] = Counter()
         self.command_error: Exception | None = None
         self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
         self.device_info = DeviceInfo(
@@ -165,41 +167,43 @@ class FakeNetlinkClient:
         """Disconnect the fake WebSocket."""
         self.connected = False
 
-    def _raise_rest_error(self) -> None:
-        """Raise the configured snapshot error, if any."""
+    def _raise_rest_error(self, request: str) -> None:
+        """Record a snapshot request and raise the configured error, if any."""
+        self.rest_calls[request] += 1
         if self.rest_error is not None:
             raise self.rest_error
 
     async def get_device_info(self) -> DeviceInfo:
         """Return device information."""
-        self._raise_rest_error()
+        self._raise_rest_error("get_device_info")
         return self.device_info
 
     async def get_desk_status(self) -> Desk:
         """Return desk state."""
-        self._raise_rest_error()
+        self._raise_rest_error("get_desk_status")
         return self.desk
 
     async def get_displays(self) -> list[DisplaySummary]:
         """Return the display inventory."""
-        self._raise_rest_error()
+        self._raise_rest_error("get_displays")
         return self.display_summaries
 
     async def get_display_status(self, _: int | str) -> Display:
         """Return display state."""
+        self.rest_calls["get_display_status"] += 1
         if self.display_error is not None:
             raise self.display_error
         return self.display
 
     async def get_browser_status(self) -> BrowserState:
         """Return browser state."""
-        self._raise_rest_error()
+        self._raise_rest_error("get_browser_status")
         return self.browser
 
     async def get_access_codes(self) -> AccessCodes:
         """Return access codes."""
         self.access_codes_calls += 1
-        self._raise_rest_error()
+        self._raise_rest_error("get_access_codes")
         if self.access_codes_error is not None:
             raise self.access_codes_error
         return self.access_codes
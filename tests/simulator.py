@@ -0,0 +1,555 @@
+"""Local NetLink device simulator for load and soak testing.
+
+The simulator serves the REST endpoints and Socket.IO events that pynetlink
+consumes for any number of virtual controllers from one aiohttp listener.
+Controllers are told apart by the host name clients connect to, so the
+integration can be pointed at hundreds of them on one Linux box::
+
+    python -m tests.simulator --controllers 200 --displays 6
+
+pynetlink always connects to port 80. The simulator therefore gives each
+controller its own loopback address (127.0.1.1, 127.0.1.2, ...), which Linux
+routes to the listener without further setup; add every address as a NetLink
+entry with the simulator token. Binding port 80 needs root or
+``sysctl net.ipv4.ip_unprivileged_port_start=80``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable
+import contextlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from ipaddress import IPv4Address
+import logging
+import random
+from typing import Any, Final
+
+from aiohttp import web
+import socketio
+
+_LOGGER = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1/"
+BASE_ADDRESS: Final = IPv4Address("127.0.1.1")
+DESK_MIN_HEIGHT = 62.0
+DESK_MAX_HEIGHT = 127.0
+DESK_MOTION_STEP = 0.25
+SOURCES = ["HDMI1", "HDMI2", "USBC"]
+ALLOWED_COMMANDS = (
+    "command.browser.refresh",
+    "command.browser.set_url",
+    "command.desk.beep",
+    "command.desk.calibrate",
+    "command.desk.height",
+    "command.desk.reset",
+    "command.desk.stop",
+    "command.display.brightness",
+    "command.display.power",
+    "command.display.source",
+    "command.display.volume",
+    "command.system.reboot",
+)
+
+type Emit = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+class CommandFailed(Exception):
+    """A command the virtual controller rejects with an error code."""
+
+
+@dataclass(kw_only=True)
+class SimulatorConfig:
+    """Behaviour shared by all virtual controllers."""
+
+    controllers: int = 1
+    displays: int = 6
+    token: str = "simulator-token"
+    base_address: IPv4Address = BASE_ADDRESS
+    # Mean delay of every REST response and command acknowledgement, in seconds
+    latency: float = 0.0
+    # Spontaneous display changes per controller per second
+    event_rate: float = 0.0
+    # Desk motion in centimetres per second
+    desk_speed: float = 4.0
+    # Fractions of REST requests and commands that fail
+    rest_failure_rate: float = 0.0
+    command_failure_rate: float = 0.0
+    # WebSocket drops per controller per second
+    disconnect_rate: float = 0.0
+    seed: int | None = None
+
+
+def _envelope(event: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Wrap an event payload like the NetLink webserver."""
+    return {"type": event, "data": data, "ts": datetime.now(UTC).isoformat()}
+
+
+class VirtualController:
+    """State and command handling of one simulated NetLink controller."""
+
+    def __init__(self, index: int, host: str, config: SimulatorConfig) -> None:
+        """Initialize a controller with a healthy desk and displays."""
+        self.host = host
+        self.config = config
+        self.device_info = {
+            "device_id": f"sim-{index:04d}",
+            "device_name": f"Simulated room {index}",
+            "version": "1.0.0",
+            "api_version": "1",
+            "model": "NetLink Simulator",
+            "mac_address": f"02:00:00:00:{index // 256:02x}:{index % 256:02x}",
+        }
+        self.desk: dict[str, Any] = {
+            "capabilities": {"supports": {"height": True}},
+            "inventory": {},
+            "state": {
+                "mode": "idle",
+                "moving": False,
+                "height": 75.0,
+                "error": None,
+                "target": None,
+                "beep": "on",
+            },
+        }
+        self.displays: dict[str, dict[str, Any]] = {
+            str(bus): {
+                "bus": bus,
+                "model": "Simulated display",
+                "type": "display",
+                "supports": {
+                    "brightness": True,
+                    "power": True,
+                    "source": True,
+                    "volume": True,
+                },
+                "state": {
+                    "power": "on",
+                    "source": SOURCES[0],
+                    "brightness": 50,
+                    "volume": 20,
+                    "error": None,
+                },
+                "source_options": SOURCES,
+                "connected": True,
+            }
+            for bus in range(1, config.displays + 1)
+        }
+        self.browser = {"url": "https://example.com", "default_url": None}
+        self.access_codes = {
+            login: {
+                "code": f"{index:06d}",
+                "valid_from": "2026-01-01T00:00:00Z",
+                "valid_until": "2099-01-01T00:00:00Z",
+                "timezone": "UTC",
+            }
+            for login in ("web_login", "signing_maintenance")
+        }
+        self.authorization = {
+            "policy_version": 1,
+            "allowed_commands": list(ALLOWED_COMMANDS),
+            "event_audiences": {"access_codes.state": True},
+            "maintenance": {"granted": False, "valid_until": None},
+        }
+        self._motion: asyncio.Task[None] | None = None
+
+    def display_summaries(self) -> list[dict[str, Any]]:
+        """Return the display inventory."""
+        return [
+            {
+                "id": index,
+                "bus": display["bus"],
+                "model": display["model"],
+                "type": display["type"],
+                "connected": display["connected"],
+            }
+            for index, display in enumerate(self.displays.values())
+        ]
+
+    def snapshot_events(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return the events sent to a client right after it connects."""
+        return [
+            ("authorization.state", self.authorization),
+            ("device.info", self.device_info),
+            ("desk.state", self.desk),
+            *(("display.state", display) for display in self.displays.values()),
+            ("browser.state", self.browser),
+            ("access_codes.state", self.access_codes),
+        ]
+
+    async def async_command(
+        self, command: str, data: dict[str, Any], emit: Emit
+    ) -> None:
+        """Apply a command and emit the state it changed."""
+        match command.removeprefix("command."):
+            case "desk.height":
+                self._move_desk(float(data["height"]), emit)
+            case "desk.stop":
+                self._stop_desk()
+                await emit("desk.state", self.desk)
+            case "desk.reset" | "desk.calibrate":
+                await emit("desk.state", self.desk)
+            case "desk.beep":
+                state = data["state"]
+                if isinstance(state, bool):
+                    state = "on" if state else "off"
+                self.desk["state"]["beep"] = state
+                await emit("desk.state", self.desk)
+            case (
+                "display.power"
+                | "display.brightness"
+                | "display.volume"
+                | ("display.source")
+            ):
+                if (display := self.displays.get(str(data["bus"]))) is None:
+                    raise CommandFailed("monitor_missing")
+                display["state"][data["attr"]] = data["value"]
+                await emit("display.state", display)
+            case "browser.refresh":
+                await emit("browser.state", self.browser)
+            case "browser.set_url":
+                self.browser["url"] = data["url"]
+                await emit("browser.state", self.browser)
+            case "system.reboot":
+                pass
+            case _:
+                raise CommandFailed("unsupported_command")
+
+    def _move_desk(self, target: float, emit: Emit) -> None:
+        """Start moving the desk towards ``target``."""
+        if not DESK_MIN_HEIGHT <= target <= DESK_MAX_HEIGHT:
+            raise CommandFailed("invalid_height")
+        self._stop_desk()
+        self._motion = asyncio.create_task(self._async_move_desk(target, emit))
+
+    async def _async_move_desk(self, target: float, emit: Emit) -> None:
+        """Report the desk height while it moves, like the real firmware."""
+        state = self.desk["state"]
+        state.update(mode="moving", moving=True, target=target)
+        step = self.config.desk_speed * DESK_MOTION_STEP
+        while state["height"] != target:
+            await emit("desk.state", self.desk)
+            await asyncio.sleep(DESK_MOTION_STEP)
+            delta = target - state["height"]
+            if abs(delta) <= step:
+                # Rounding the last step could miss a target between tenths.
+                state["height"] = target
+            else:
+                state["height"] = round(state["height"] + step * (delta > 0 or -1), 1)
+        state.update(mode="idle", moving=False, target=None)
+        await emit("desk.state", self.desk)
+
+    def _stop_desk(self) -> None:
+        """Stop a desk motion in progress."""
+        if self._motion is not None:
+            self._motion.cancel()
+            self._motion = None
+        self.desk["state"].update(mode="idle", moving=False, target=None)
+
+    def random_change(self, rng: random.Random) -> dict[str, Any]:
+        """Change a random display setting and return the display."""
+        display = rng.choice(list(self.displays.values()))
+        state = display["state"]
+        state["brightness"] = min(100, max(0, state["brightness"] + rng.randint(-5, 5)))
+        return display
+
+    def stop(self) -> None:
+        """Cancel background motion."""
+        self._stop_desk()
+
+
+class NetlinkSimulator:
+    """Serve any number of virtual NetLink controllers from one listener."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        """Initialize the simulator and its controllers."""
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.statistics: Counter[str] = Counter()
+        self.controllers: dict[str, VirtualController] = {}
+        for index in range(config.controllers):
+            host = str(config.base_address + index)
+            self.controllers[host] = VirtualController(index, host, config)
+        self._clients: dict[str, str] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+        self._runner: web.AppRunner | None = None
+
+        self.sio = socketio.AsyncServer(async_mode="aiohttp")
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self.sio.on("command", self._on_command)
+        self.app = web.Application(middlewares=[self._middleware])
+        self.sio.attach(self.app)
+        self.app.add_routes(self._routes())
+        self.app.on_startup.append(self._start_background)
+        self.app.on_cleanup.append(self._stop_background)
+
+    def controller_for(self, request: web.Request) -> VirtualController:
+        """Return the controller a request was addressed to."""
+        if len(self.controllers) == 1:
+            return next(iter(self.controllers.values()))
+        host = request.host.rsplit(":", 1)[0]
+        if (controller := self.controllers.get(host)) is None:
+            raise web.HTTPNotFound(text=f"No simulated controller at {host}")
+        return controller
+
+    async def _delay(self) -> None:
+        """Wait for a jittered response latency."""
+        if self.config.latency:
+            await asyncio.sleep(self.rng.expovariate(1 / self.config.latency))
+
+    async def _emit(
+        self, controller: VirtualController, event: str, data: dict[str, Any]
+    ) -> None:
+        """Send an event to every client of a controller."""
+        self.statistics["events"] += 1
+        await self.sio.emit(event, _envelope(event, data), room=controller.host)
+
+    # REST
+
+    @web.middleware
+    async def _middleware(
+        self,
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        """Authenticate REST requests and inject latency and failures."""
+        if not request.path.startswith(API_PREFIX):
+            return await handler(request)
+        self.statistics["rest_requests"] += 1
+        if request.headers.get("Authorization") != f"Bearer {self.config.token}":
+            raise web.HTTPUnauthorized
+        await self._delay()
+        if self.rng.random() < self.config.rest_failure_rate:
+            self.statistics["rest_failures"] += 1
+            raise web.HTTPServiceUnavailable
+        return await handler(request)
+
+    def _routes(self) -> list[web.RouteDef]:
+        """Return the REST routes pynetlink uses."""
+
+        def state(read: Callable[[VirtualController, web.Request], Any]):
+            async def handler(request: web.Request) -> web.Response:
+                return web.json_response(read(self.controller_for(request), request))
+
+            return handler
+
+        def command(
+            name: str, data: Callable[[dict[str, Any], web.Request], dict[str, Any]]
+        ):
+            async def handler(request: web.Request) -> web.Response:
+                controller = self.controller_for(request)
+                body = await request.json() if request.can_read_body else {}
+                try:
+                    await controller.async_command(
+                        name,
+                        data(body, request),
+                        lambda event, payload: self._emit(controller, event, payload),
+                    )
+                except CommandFailed as err:
+                    return web.json_response(
+                        {"status": "error", "error": str(err)}, status=400
+                    )
+                return web.json_response({"status": "ok"})
+
+            return handler
+
+        def display_command(attr: str):
+            return command(
+                f"command.display.{attr}",
+                lambda body, request: {
+                    "bus": request.match_info["bus"],
+                    "attr": attr,
+                    "value": body["state" if attr == "power" else attr],
+                },
+            )
+
+        def display(
+            controller: VirtualController, request: web.Request
+        ) -> dict[str, Any]:
+            if (found := controller.displays.get(request.match_info["bus"])) is None:
+                raise web.HTTPNotFound
+            return found
+
+        api = API_PREFIX
+        return [
+            web.get(f"{api}device/info", state(lambda c, _: c.device_info)),
+            web.get(f"{api}desk/status", state(lambda c, _: c.desk)),
+            web.get(f"{api}displays", state(lambda c, _: c.display_summaries())),
+            web.get(f"{api}display/{{bus}}/status", state(display)),
+            web.get(f"{api}browser/status", state(lambda c, _: c.browser)),
+            web.get(f"{api}admin/access-codes", state(lambda c, _: c.access_codes)),
+            web.post(
+                f"{api}desk/height", command("command.desk.height", lambda b, _: b)
+            ),
+            web.post(f"{api}desk/stop", command("command.desk.stop", lambda b, _: {})),
+            web.post(
+                f"{api}desk/reset", command("command.desk.reset", lambda b, _: {})
+            ),
+            web.post(
+                f"{api}desk/calibrate",
+                command("command.desk.calibrate", lambda b, _: {}),
+            ),
+            web.post(f"{api}desk/beep", command("command.desk.beep", lambda b, _: b)),
+            web.post(
+                f"{api}browser/refresh",
+                command("command.browser.refresh", lambda b, _: {}),
+            ),
+            web.post(
+                f"{api}browser/url", command("command.browser.set_url", lambda b, _: b)
+            ),
+            *(
+                web.put(f"{api}display/{{bus}}/{attr}", display_command(attr))
+                for attr in ("power", "brightness", "volume", "source")
+            ),
+        ]
+
+    # Socket.IO
+
+    async def _on_connect(self, sid: str, environ: dict[str, Any], auth: Any) -> None:
+        """Authenticate a WebSocket client and send it the current state."""
+        if not isinstance(auth, dict) or auth.get("token") != self.config.token:
+            raise socketio.exceptions.ConnectionRefusedError("unauthorized")
+        controller = self.controller_for(environ["aiohttp.request"])
+        self._clients[sid] = controller.host
+        await self.sio.enter_room(sid, controller.host)
+        self.statistics["connections"] += 1
+        for event, data in controller.snapshot_events():
+            await self.sio.emit(event, _envelope(event, data), to=sid)
+
+    async def _on_disconnect(self, sid: str, *_: Any) -> None:
+        """Forget a disconnected WebSocket client."""
+        self._clients.pop(sid, None)
+
+    async def _on_command(self, sid: str, payload: dict[str, Any]) -> None:
+        """Acknowledge a WebSocket command after the simulated latency."""
+        if (host := self._clients.get(sid)) is None:
+            return
+        controller = self.controllers[host]
+        command = payload.get("type", "")
+        self.statistics["commands"] += 1
+        await self._delay()
+        ack: dict[str, Any] = {"id": payload.get("id"), "status": "ok"}
+        try:
+            if self.rng.random() < self.config.command_failure_rate:
+                raise CommandFailed("injected_failure")
+            await controller.async_command(
+                command,
+                payload.get("data", {}),
+                lambda event, data: self._emit(controller, event, data),
+            )
+        except CommandFailed as err:
+            self.statistics["command_failures"] += 1
+            ack.update(status="error", error=str(err), command=command)
+        await self.sio.emit("command_ack", _envelope("command_ack", ack), to=sid)
+        if command == "command.system.reboot":
+            await self._drop_clients(controller)
+
+    async def _drop_clients(self, controller: VirtualController) -> None:
+        """Disconnect every WebSocket client of a controller."""
+        for sid, host in list(self._clients.items()):
+            if host == controller.host:
+                self.statistics["disconnects"] += 1
+                await self.sio.disconnect(sid)
+
+    # Background activity
+
+    async def _start_background(self, _: web.Application) -> None:
+        """Start spontaneous events and connection drops."""
+        for controller in self.controllers.values():
+            if self.config.event_rate:
+                self._tasks.append(asyncio.create_task(self._async_chatter(controller)))
+            if self.config.disconnect_rate:
+                self._tasks.append(asyncio.create_task(self._async_flap(controller)))
+
+    async def _stop_background(self, _: web.Application) -> None:
+        """Stop all background activity."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        for controller in self.controllers.values():
+            controller.stop()
+
+    async def _async_chatter(self, controller: VirtualController) -> None:
+        """Change display settings at random, like people using the remote."""
+        while True:
+            await asyncio.sleep(self.rng.expovariate(self.config.event_rate))
+            await self._emit(
+                controller, "display.state", controller.random_change(self.rng)
+            )
+
+    async def _async_flap(self, controller: VirtualController) -> None:
+        """Drop WebSocket connections at random."""
+        while True:
+            await asyncio.sleep(self.rng.expovariate(self.config.disconnect_rate))
+            await self._drop_clients(controller)
+
+    # Lifecycle
+
+    async def async_start(self, host: str = "0.0.0.0", port: int = 80) -> None:
+        """Start serving on ``host`` and ``port``."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def _parse_args() -> SimulatorConfig:
+    """Return the simulator configuration from the command line."""
+    defaults = SimulatorConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--controllers", type=int, default=defaults.controllers)
+    parser.add_argument("--displays", type=int, default=defaults.displays)
+    parser.add_argument("--token", default=defaults.token)
+    parser.add_argument(
+        "--base-address", type=IPv4Address, default=defaults.base_address
+    )
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--event-rate", type=float, default=defaults.event_rate)
+    parser.add_argument("--desk-speed", type=float, default=defaults.desk_speed)
+    parser.add_argument(
+        "--rest-failure-rate", type=float, default=defaults.rest_failure_rate
+    )
+    parser.add_argument(
+        "--command-failure-rate", type=float, default=defaults.command_failure_rate
+    )
+    parser.add_argument(
+        "--disconnect-rate", type=float, default=defaults.disconnect_rate
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return SimulatorConfig(**vars(parser.parse_args()))
+
+
+async def _async_main(config: SimulatorConfig) -> None:
+    """Run the simulator until interrupted."""
+    simulator = NetlinkSimulator(config)
+    await simulator.async_start()
+    last = config.base_address + config.controllers - 1
+    _LOGGER.info(
+        "Simulating %d controllers at %s-%s with token %s",
+        config.controllers,
+        config.base_address,
+        last,
+        config.token,
+    )
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.async_stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_main(_parse_args()))
@@ -0,0 +1,648 @@
+"""Benchmarks for the NetLink push path."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import replace
+import json
+import os
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+from pynetlink import (
+    EVENT_AUTHORIZATION_STATE,
+    EVENT_DESK_STATE,
+    EVENT_DISPLAY_STATE,
+    EVENT_DISPLAYS_LIST,
+    DeviceInfo,
+    DisplayState,
+)
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_TOKEN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.netlink.cache import STORAGE_VERSION, dump_snapshot
+from custom_components.netlink.capture import CapturedEvent, async_replay
+from custom_components.netlink.const import (
+    CONF_DEVICE_ID,
+    DOMAIN,
+    RECONNECT_CONCURRENCY,
+)
+from custom_components.netlink.coordinator import EXPECTED_HOME_ASSISTANT_COMMANDS
+from custom_components.netlink.errors import parse_display_error
+from custom_components.netlink.sensor import (
+    _display_error_attributes,
+    _display_error_value,
+)
+from custom_components.netlink.snapshot import NetlinkSnapshot
+from custom_components.netlink.entity import NetlinkBaseEntity
+
+from .conftest import (
+    DEVICE_ID,
+    FakeNetlinkClient,
+    authorization_payload,
+    authorization_state,
+)
+
+DISPLAY_COUNT = 6
+FLEET_SIZE = 200
+SNAPSHOT_LATENCY = 0.002
+CONNECT_LATENCY = 0.2
+COMMAND_LATENCY = 0.03
+SLIDER_VALUES = 50
+SLIDER_STEP = 0.005
+REPLAY_MOTION_FRAMES = 200
+STORM_EVENTS = 200
+ERROR_SENSOR_WRITES = 5000
+
+# Stored results of the push-path storms. Refresh them after an intended
+# change with NETLINK_BENCHMARK_UPDATE=1 pytest tests/test_benchmarks.py
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+# Factor a storm metric may regress by before the benchmark fails: counts are
+# deterministic, timings vary between machines.
+REGRESSION_BUDGETS = {
+    "entity_writes_per_event": 1.1,
+    "allocated_kib_per_event": 1.5,
+    "p99_handler_ms": 4.0,
+    "events_per_second": 4.0,
+}
+# Metrics where a higher value is better
+HIGHER_IS_BETTER = frozenset({"events_per_second"})
+# Timings and allocations depend on the machine and on tracers such as
+# coverage, so they are only measured on request
+BENCHMARK = bool(
+    os.environ.get("NETLINK_BENCHMARK") or os.environ.get("NETLINK_BENCHMARK_UPDATE")
+)
+
+
+@pytest.fixture
+async def fleet_room(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> MockConfigEntry:
+    """Set up a room controller with several displays."""
+    netlink_client.display_summaries = [
+        replace(netlink_client.display_summary, id=index, bus=index + 1)
+        for index in range(DISPLAY_COUNT)
+    ]
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return mock_config_entry
+
+
+def _count_calls(name: str) -> tuple[Counter[str], object]:
+    """Patch an entity method to count its calls per entity."""
+    calls: Counter[str] = Counter()
+    original = getattr(NetlinkBaseEntity, name)
+
+    def count(entity: NetlinkBaseEntity) -> object:
+        calls[entity.entity_id] += 1
+        return original(entity)
+
+    return calls, patch.object(
+        NetlinkBaseEntity, name, autospec=True, side_effect=count
+    )
+
+
+async def test_entity_callbacks_per_push_event(
+    hass: HomeAssistant,
+    fleet_room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """A push event only wakes the entities rendering the affected data."""
+    coordinator = fleet_room.runtime_data
+    callbacks, count_callbacks = _count_calls("_rendered_state")
+    writes, count_writes = _count_calls("async_write_ha_state")
+
+    with count_callbacks, count_writes:
+        # Before: a full coordinator update fans out to every entity.
+        coordinator.async_set_updated_data(coordinator.data)
+        fan_out = callbacks.total()
+        callbacks.clear()
+        writes.clear()
+
+        desk = netlink_client.desk.to_dict()
+        desk["state"]["height"] = 90
+        await netlink_client.emit(EVENT_DESK_STATE, desk)
+        desk_callbacks, desk_writes = callbacks.total(), writes.total()
+        callbacks.clear()
+        writes.clear()
+
+        display = replace(
+            netlink_client.display,
+            bus=3,
+            state=DisplayState(power="on", source="HDMI1", brightness=80, volume=20),
+        )
+        await netlink_client.emit(EVENT_DISPLAY_STATE, display.to_dict())
+        display_callbacks, display_writes = callbacks.total(), writes.total()
+        display_entities = set(callbacks)
+        await hass.async_block_till_done()
+
+    record_property("full_fan_out_callbacks", fan_out)
+    # Desk height, mode and error sensors, moving, target height, beep and the
+    # error event.
+    assert desk_callbacks == 7
+    # Only the height sensor and the target height number render the height.
+    assert desk_writes == 2
+    # Brightness, volume, power, source and error sensors, two numbers,
+    # the power switch, the source select, the connected sensor and the error
+    # event.
+    assert display_callbacks == 11
+    assert display_writes == 2
+    assert all("display_3" in entity_id for entity_id in display_entities)
+    assert fan_out >= DISPLAY_COUNT * display_callbacks + desk_callbacks
+
+
+class SlowNetlinkClient(FakeNetlinkClient):
+    """Fake client whose snapshot takes a little while, like a real device."""
+
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def get_device_info(self) -> DeviceInfo:
+        """Return device information after a simulated round-trip."""
+        cls = type(self)
+        cls.in_flight += 1
+        cls.peak_in_flight = max(cls.peak_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(SNAPSHOT_LATENCY)
+            return await super().get_device_info()
+        finally:
+            cls.in_flight -= 1
+
+
+async def test_reconnect_storm_time_to_ready(
+    hass: HomeAssistant, record_property: Callable[[str, object], None]
+) -> None:
+    """A fleet-wide reconnect is gated instead of snapshotting all at once."""
+    clients: list[SlowNetlinkClient] = []
+    entries = []
+    for index in range(FLEET_SIZE):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Room {index}",
+            data={
+                CONF_DEVICE_ID: f"device-{index}",
+                CONF_HOST: f"netlink-{index}.local",
+                CONF_TOKEN: "secret-token",
+            },
+            unique_id=f"device-{index}",
+            version=1,
+            minor_version=2,
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    def create_client(**_: object) -> SlowNetlinkClient:
+        clients.append(client := SlowNetlinkClient())
+        return client
+
+    with (
+        patch("custom_components.netlink.NetlinkClient", side_effect=create_client),
+        patch("custom_components.netlink.PLATFORMS", []),
+    ):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+    assert len(clients) == FLEET_SIZE
+
+    for client in clients:
+        await client.emit("disconnect")
+    SlowNetlinkClient.peak_in_flight = 0
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client.emit("connect") for client in clients))
+    elapsed = time.perf_counter() - started
+
+    coordinators = [entry.runtime_data for entry in entries]
+    record_property("time_to_ready_ms", round(elapsed * 1000))
+    record_property("peak_concurrent_snapshots", SlowNetlinkClient.peak_in_flight)
+    assert all(coordinator._push_updates_allowed() for coordinator in coordinators)
+    assert SlowNetlinkClient.peak_in_flight <= RECONNECT_CONCURRENCY
+
+
+async def _time_to_first_entity(
+    hass: HomeAssistant, entry: MockConfigEntry, client: FakeNetlinkClient
+) -> float:
+    """Set up an entry against a slow device and time its first entity state."""
+    connect = client.connect
+
+    async def slow_connect() -> None:
+        await asyncio.sleep(CONNECT_LATENCY)
+        await connect()
+
+    client.connect = slow_connect
+    entry.add_to_hass(hass)
+    started = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert hass.states.async_entity_ids("sensor")
+    elapsed = time.perf_counter() - started
+    await hass.async_block_till_done(wait_background_tasks=True)
+    return elapsed
+
+
+async def test_time_to_first_entity_cold(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Without a cache, entities wait for the device to answer."""
+    elapsed = await _time_to_first_entity(hass, mock_config_entry, netlink_client)
+
+    record_property("time_to_first_entity_ms", round(elapsed * 1000))
+    assert elapsed >= CONNECT_LATENCY
+
+
+async def test_time_to_first_entity_cached(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """With a cached snapshot, entities exist before the device answers."""
+    key = f"{DOMAIN}.{mock_config_entry.entry_id}.snapshot"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": dump_snapshot(
+            netlink_client.device_info,
+            [netlink_client.display_summary],
+            NetlinkSnapshot(
+                desk=netlink_client.desk,
+                browser=netlink_client.browser,
+                displays={"1": netlink_client.display},
+            ),
+        ),
+    }
+
+    elapsed = await _time_to_first_entity(hass, mock_config_entry, netlink_client)
+
+    record_property("time_to_first_entity_ms", round(elapsed * 1000))
+    assert elapsed < CONNECT_LATENCY
+    assert mock_config_entry.runtime_data.snapshot_from_cache is False
+
+
+async def test_slider_drag_commands_sent(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Dragging a slider sends far fewer commands than values it produces."""
+    coordinator = setup_integration.runtime_data
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "number", DOMAIN, f"{DEVICE_ID}_display_1_brightness"
+    )
+    record = netlink_client._record_command
+
+    async def slow_command(name: str, *args: object, **kwargs: object) -> None:
+        await asyncio.sleep(COMMAND_LATENCY)
+        await record(name, *args, **kwargs)
+
+    netlink_client._record_command = slow_command
+    calls = []
+    for value in range(SLIDER_VALUES):
+        calls.append(
+            hass.async_create_task(
+                hass.services.async_call(
+                    "number",
+                    "set_value",
+                    {ATTR_ENTITY_ID: entity_id, "value": value},
+                    blocking=True,
+                )
+            )
+        )
+        await asyncio.sleep(SLIDER_STEP)
+    await asyncio.gather(*calls)
+
+    sent = coordinator.statistics["commands_sent"]
+    assert coordinator.statistics["commands_requested"] == SLIDER_VALUES
+    assert sent < SLIDER_VALUES / 2, f"{sent} commands sent for {SLIDER_VALUES}"
+    assert netlink_client.commands[-1] == (
+        "set_display_brightness",
+        ("1", SLIDER_VALUES - 1),
+        {},
+    )
+
+
+def _captured_incident(netlink_client: FakeNetlinkClient) -> list[CapturedEvent]:
+    """Build a desk movement interleaved with display chatter and list updates."""
+    desk = netlink_client.desk
+    inventory = [summary.to_dict() for summary in netlink_client.display_summaries]
+    events = []
+    for frame in range(REPLAY_MOTION_FRAMES):
+        moving = frame < REPLAY_MOTION_FRAMES - 1
+        state = replace(desk.state, moving=moving, height=70 + frame * 0.1)
+        events.append((EVENT_DESK_STATE, replace(desk, state=state).to_dict()))
+        bus = frame % DISPLAY_COUNT + 1
+        display = replace(
+            netlink_client.display,
+            bus=bus,
+            state=DisplayState(
+                power="on", source="HDMI1", brightness=frame % 3, volume=20
+            ),
+        )
+        events.append((EVENT_DISPLAY_STATE, display.to_dict()))
+        if frame % 50 == 0:
+            events.append((EVENT_DISPLAYS_LIST, inventory))
+    return [
+        CapturedEvent(index * 0.01, event, data)
+        for index, (event, data) in enumerate(events)
+    ]
+
+
+async def test_replay_captured_event_stream(
+    hass: HomeAssistant,
+    fleet_room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """A captured incident replays at full speed with bounded state writes."""
+    events = _captured_incident(netlink_client)
+
+    report = await async_replay(fleet_room.runtime_data, events, speed=None)
+    await hass.async_block_till_done()
+
+    record_property("events_per_second", round(report.events_per_second))
+    assert report.events == len(events)
+    assert report.skipped == 0
+    # Desk motion frames are coalesced and repeated display states suppressed.
+    assert report.entity_writes < len(events) / 10, report
+
+
+type Storm = list[tuple[str, Any]]
+
+
+def _desk_motion_storm(client: FakeNetlinkClient, generation: int) -> Storm:
+    """Build the height frames of one desk movement."""
+    desk = client.desk
+    return [
+        (
+            EVENT_DESK_STATE,
+            replace(
+                desk,
+                state=replace(
+                    desk.state,
+                    moving=frame < STORM_EVENTS - 1,
+                    height=70 + 10 * generation + frame * 0.05,
+                ),
+            ).to_dict(),
+        )
+        for frame in range(STORM_EVENTS)
+    ]
+
+
+def _display_storm(client: FakeNetlinkClient, generation: int) -> Storm:
+    """Build brightness and volume changes spread over every display."""
+    storm = []
+    for frame in range(STORM_EVENTS):
+        level = (frame // DISPLAY_COUNT + 50 * generation) % 101
+        display = replace(
+            client.display,
+            bus=frame % DISPLAY_COUNT + 1,
+            state=DisplayState(
+                power="on", source="HDMI1", brightness=level, volume=100 - level
+            ),
+        )
+        storm.append((EVENT_DISPLAY_STATE, display.to_dict()))
+    return storm
+
+
+def _authorization_storm(client: FakeNetlinkClient, generation: int) -> Storm:
+    """Build policies that alternately revoke and restore display commands."""
+    full = authorization_payload(authorization_state(*EXPECTED_HOME_ASSISTANT_COMMANDS))
+    restricted = authorization_payload(
+        authorization_state(
+            *(
+                command
+                for command in EXPECTED_HOME_ASSISTANT_COMMANDS
+                if not command.startswith("command.display.")
+            )
+        )
+    )
+    return [
+        (EVENT_AUTHORIZATION_STATE, restricted if frame % 2 == 0 else full)
+        for frame in range(STORM_EVENTS)
+    ]
+
+
+def _inventory_storm(client: FakeNetlinkClient, generation: int) -> Storm:
+    """Build display lists where one display keeps disconnecting."""
+    summaries = [
+        replace(client.display_summary, id=index, bus=index + 1)
+        for index in range(DISPLAY_COUNT)
+    ]
+    return [
+        (
+            EVENT_DISPLAYS_LIST,
+            [
+                replace(
+                    summary,
+                    connected=summary.bus != DISPLAY_COUNT or frame % 2 == 1,
+                ).to_dict()
+                for summary in summaries
+            ],
+        )
+        for frame in range(STORM_EVENTS)
+    ]
+
+
+STORMS: dict[str, Callable[[FakeNetlinkClient, int], Storm]] = {
+    "desk_motion": _desk_motion_storm,
+    "display_updates": _display_storm,
+    "authorization_flips": _authorization_storm,
+    "inventory_changes": _inventory_storm,
+}
+
+
+async def _count_storm_writes(
+    coordinator: Any, client: FakeNetlinkClient, build: Callable[..., Storm]
+) -> dict[str, float]:
+    """Drive the registered handlers with a storm and count the state writes."""
+    storm = build(client, 0)
+    writes = coordinator.statistics["entity_writes"]
+    for event, data in storm:
+        await client.emit(event, data)
+    writes = coordinator.statistics["entity_writes"] - writes
+    return {"entity_writes_per_event": round(writes / len(storm), 3)}
+
+
+async def _measure_storm(
+    coordinator: Any, client: FakeNetlinkClient, build: Callable[..., Storm]
+) -> dict[str, float]:
+    """Drive the registered handlers with a storm and measure the push path.
+
+    Timings and allocations are measured in separate passes, because tracing
+    allocations slows every handler down.
+    """
+    storm = build(client, 0)
+    writes = coordinator.statistics["entity_writes"]
+    latencies = []
+    for event, data in storm:
+        started = time.perf_counter()
+        await client.emit(event, data)
+        latencies.append(time.perf_counter() - started)
+    writes = coordinator.statistics["entity_writes"] - writes
+
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for event, data in build(client, 1):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await client.emit(event, data)
+            allocated += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "events_per_second": round(len(storm) / sum(latencies)),
+        "entity_writes_per_event": round(writes / len(storm), 3),
+        "allocated_kib_per_event": round(allocated / len(storm) / 1024, 1),
+        "p99_handler_ms": round(latencies[int(0.99 * len(latencies))] * 1000, 3),
+    }
+
+
+def _regressions(storm: str, result: dict[str, float]) -> list[str]:
+    """Compare the metrics of a storm result with the stored baseline.
+
+    With NETLINK_BENCHMARK_UPDATE set, the metrics become the new baseline.
+    """
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    if os.environ.get("NETLINK_BENCHMARK_UPDATE"):
+        baseline[storm] = {**baseline.get(storm, {}), **result}
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return []
+    if storm not in baseline:
+        pytest.fail(f"no baseline for {storm}")
+    regressions = []
+    for metric, measured in result.items():
+        expected, budget = baseline[storm][metric], REGRESSION_BUDGETS[metric]
+        if metric in HIGHER_IS_BETTER:
+            regressed = measured < expected / budget
+        else:
+            # Allow a little slack for metrics that are zero in the baseline.
+            regressed = measured > max(expected * budget, expected + 0.01)
+        if regressed:
+            regressions.append(f"{metric}: {measured} (baseline {expected})")
+    return regressions
+
+
+def _tracing() -> bool:
+    """Return whether a tracer such as coverage slows the interpreter down."""
+    if sys.gettrace() is not None:
+        return True
+    monitoring = getattr(sys, "monitoring", None)
+    return monitoring is not None and any(
+        monitoring.get_tool(tool_id) is not None for tool_id in range(6)
+    )
+
+
+@pytest.mark.parametrize("storm", STORMS)
+async def test_push_storm_entity_writes(
+    hass: HomeAssistant,
+    fleet_room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    storm: str,
+) -> None:
+    """A push storm does not write more entity states than the baseline."""
+    result = await _count_storm_writes(
+        fleet_room.runtime_data, netlink_client, STORMS[storm]
+    )
+    await hass.async_block_till_done()
+
+    regressions = _regressions(storm, result)
+    assert not regressions, f"{storm}: {regressions}"
+
+
+@pytest.mark.skipif(not BENCHMARK, reason="set NETLINK_BENCHMARK to measure timings")
+@pytest.mark.parametrize("storm", STORMS)
+async def test_push_storm_within_baseline(
+    hass: HomeAssistant,
+    fleet_room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    storm: str,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """A push storm does not regress timings or allocations beyond the baseline."""
+    if _tracing():
+        pytest.skip("a tracer distorts timings and allocations")
+    result = await _measure_storm(
+        fleet_room.runtime_data, netlink_client, STORMS[storm]
+    )
+    await hass.async_block_till_done()
+
+    for metric, value in result.items():
+        record_property(metric, value)
+    regressions = _regressions(storm, result)
+    assert not regressions, f"{storm}: {regressions}"
+
+
+DISPLAY_ERRORS = [
+    json.dumps(
+        {
+            "stage": "ddc",
+            "operation": "set_brightness",
+            "reason": reason,
+            "detail": "ddcutil exited with returncode=1 and no error text",
+            "exception_type": "DdcError",
+            "attempt": attempt,
+            "max_attempts": 3,
+            "retry_outcome": "exhausted",
+            "elapsed_ms": 1520.4,
+            "bus": bus,
+            "model": "Test display",
+            "profile": None,
+        }
+    )
+    for reason in ("ddc_timeout", "monitor_missing", "state_mismatch")
+    for attempt in (1, 3)
+    for bus in range(1, DISPLAY_COUNT + 1)
+] + ["No DDC/CI response from monitor", "[1, 2, 3]"]
+
+
+def test_display_error_parsing(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Error sensor writes reuse the parsed error of an unchanged string."""
+
+    def render_error_sensors(parse: Callable[[str], Any]) -> float:
+        started = time.perf_counter()
+        for write in range(ERROR_SENSOR_WRITES):
+            error = DISPLAY_ERRORS[write % len(DISPLAY_ERRORS)]
+            # The state and the attributes of the sensor each parse the error.
+            parse(error)
+            parse(error)
+        return time.perf_counter() - started
+
+    parse_display_error.cache_clear()
+    cached = render_error_sensors(parse_display_error)
+    info = parse_display_error.cache_info()
+
+    # Every distinct error is parsed once; all other writes hit the cache.
+    assert info.misses == len(DISPLAY_ERRORS)
+    assert info.hits == 2 * ERROR_SENSOR_WRITES - len(DISPLAY_ERRORS)
+    if BENCHMARK:
+        uncached = render_error_sensors(parse_display_error.__wrapped__)
+        record_property("uncached_ms", round(uncached * 1000, 1))
+        record_property("cached_ms", round(cached * 1000, 1))
+    assert _display_error_value(DISPLAY_ERRORS[0]) == "ddc_timeout"
+    assert _display_error_attributes(DISPLAY_ERRORS[0])["attempt"] == 1
+    assert _display_error_value(DISPLAY_ERRORS[-1]) == "other"
+    assert _display_error_attributes(DISPLAY_ERRORS[-1]) == {"detail": "[1, 2, 3]"}
@@ -0,0 +1,74 @@
+"""Tests for capturing and replaying NetLink WebSocket events."""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.netlink.capture import CapturedEvent, _append, async_replay
+
+
+def test_capture_file_is_rotated(tmp_path: Path) -> None:
+    """A full capture file is rotated and the oldest backup is dropped."""
+    path = tmp_path / "netlink" / "capture.jsonl"
+    for line in (b"first\n", b"second\n", b"third\n", b"fourth\n"):
+        _append(path, line, max_bytes=10, backups=2)
+
+    assert path.read_bytes() == b"fourth\n"
+    assert path.with_suffix(".jsonl.1").read_bytes() == b"third\n"
+    assert path.with_suffix(".jsonl.2").read_bytes() == b"second\n"
+    assert not path.with_suffix(".jsonl.3").exists()
+    assert sorted(file.name for file in path.parent.iterdir()) == [
+        "capture.jsonl",
+        "capture.jsonl.1",
+        "capture.jsonl.2",
+    ]
+
+
+def test_capture_file_without_backups_starts_over(tmp_path: Path) -> None:
+    """Without backups a full capture file is replaced."""
+    path = tmp_path / "capture.jsonl"
+    _append(path, b"first\n", max_bytes=10, backups=0)
+    _append(path, b"second\n", max_bytes=10, backups=0)
+
+    assert path.read_bytes() == b"second\n"
+    assert [file.name for file in tmp_path.iterdir()] == ["capture.jsonl"]
+
+
+class ReplayTarget:
+    """Coordinator stand-in recording the replayed events."""
+
+    def __init__(self) -> None:
+        self.statistics: Counter[str] = Counter()
+        self.events: list[tuple[str, Any]] = []
+
+    async def async_replay_event(self, event: str, data: Any) -> bool:
+        self.events.append((event, data))
+        self.statistics["entity_writes"] += 1
+        return event != "unknown"
+
+
+async def test_replay_keeps_the_captured_spacing() -> None:
+    """Events are replayed with their original spacing divided by the speed."""
+    target = ReplayTarget()
+    events = [
+        CapturedEvent(100.0, "desk.state", {"height": 70}),
+        CapturedEvent(101.0, "unknown", None),
+        CapturedEvent(103.0, "desk.state", {"height": 80}),
+    ]
+
+    with patch("custom_components.netlink.capture.asyncio.sleep", AsyncMock()) as sleep:
+        report = await async_replay(target, events, speed=2.0)
+
+    assert [call.args[0] for call in sleep.await_args_list] == [
+        pytest.approx(0.5, abs=0.05),
+        pytest.approx(1.5, abs=0.05),
+    ]
+    assert target.events == [(event.event, event.data) for event in events]
+    assert report.events == 2
+    assert report.skipped == 1
+    assert report.entity_writes == 3
@@ -0,0 +1,78 @@
+"""Tests for the NetLink command queue."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from datetime import timedelta
+
+from pynetlink import NetlinkTimeoutError
+import pytest
+
+from custom_components.netlink.commands import CommandPriority, CommandQueue
+
+
+async def test_command_waiting_past_its_deadline_is_not_sent() -> None:
+    """A command that cannot start in time fails instead of being sent late."""
+    queue = CommandQueue(Counter())
+    release = asyncio.Event()
+    sent: list[str] = []
+
+    async def send(value: str) -> None:
+        if value == "slow":
+            await release.wait()
+        sent.append(value)
+
+    slow = asyncio.create_task(queue.async_send("displays/1", "power", "slow", send))
+    await asyncio.sleep(0)
+    with pytest.raises(NetlinkTimeoutError):
+        await queue.async_send(
+            "displays/1", "source", "late", send, deadline=timedelta(seconds=0.01)
+        )
+
+    release.set()
+    await slow
+    assert sent == ["slow"]
+    assert queue.statistics["commands_expired"] == 1
+    assert queue.depth == 0
+    assert queue.peak_depth == 1
+    assert queue.wait_max < 0.01
+
+
+async def test_unacknowledged_command_times_out() -> None:
+    """The deadline also bounds the time until the device acknowledges."""
+    queue = CommandQueue(Counter())
+
+    async def send(_: None) -> None:
+        await asyncio.Event().wait()
+
+    with pytest.raises(NetlinkTimeoutError):
+        await queue.async_send(
+            "desk",
+            "desk_stop",
+            None,
+            send,
+            priority=CommandPriority.SAFETY,
+            deadline=timedelta(seconds=0.01),
+        )
+    assert queue.statistics["commands_expired"] == 1
+
+
+async def test_targets_do_not_wait_for_each_other() -> None:
+    """Each desk or display has its own lane."""
+    queue = CommandQueue(Counter())
+    release = asyncio.Event()
+
+    async def blocked(_: int) -> None:
+        await release.wait()
+
+    async def immediate(_: int) -> None:
+        pass
+
+    slow = asyncio.create_task(queue.async_send("displays/1", "volume", 1, blocked))
+    await asyncio.sleep(0)
+    await queue.async_send("displays/2", "volume", 1, immediate)
+
+    assert not slow.done()
+    release.set()
+    await slow
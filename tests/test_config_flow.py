@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ipaddress import ip_address
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from pynetlink import (
@@ -18,13 +19,18 @@ from homeassistant.const import CONF_HOST, CONF_TOKEN
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
-from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers import config_entry_oauth2_flow, entity_registry as er
 
 from custom_components.netlink.config_flow import (
     NetlinkConfigFlow,
     _validate_connection,
 )
-from custom_components.netlink.const import CONF_DEVICE_ID, DOMAIN
+from custom_components.netlink.const import (
+    CONF_COMPACT_ENTITIES,
+    CONF_DEVICE_ID,
+    CONF_RECONCILIATION_INTERVAL,
+    DOMAIN,
+)
 
 from .conftest import DEVICE_ID, HOST, TOKEN, FakeNetlinkClient
 
@@ -459,3 +465,60 @@ async def test_pick_oauth_implementation_registers_device_host(
     assert result == expected
     register.assert_called_once_with(HOST)
     parent_step.assert_awaited_once_with({"implementation": HOST})
+
+
+async def test_options_flow_enables_compact_entities(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Compact mode removes sensors that duplicate a display control."""
+    registry = er.async_get(hass)
+
+    def sensor(key: str) -> str | None:
+        return registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{DEVICE_ID}_display_1_{key}"
+        )
+
+    assert sensor("brightness") is not None
+
+    result = await hass.config_entries.options.async_init(setup_integration.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_COMPACT_ENTITIES: True}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert setup_integration.options == {CONF_COMPACT_ENTITIES: True}
+    for key in ("brightness", "volume", "power", "source"):
+        assert sensor(key) is None
+    assert sensor("error") is not None
+    assert registry.async_get_entity_id(
+        "number", DOMAIN, f"{DEVICE_ID}_display_1_brightness"
+    )
+
+
+async def test_options_flow_rejects_short_reconciliation_interval(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Reconciliation cannot be configured to run more than once a minute."""
+    result = await hass.config_entries.options.async_init(setup_integration.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_COMPACT_ENTITIES: False, CONF_RECONCILIATION_INTERVAL: {"seconds": 30}},
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_RECONCILIATION_INTERVAL: "interval_too_short"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_COMPACT_ENTITIES: False, CONF_RECONCILIATION_INTERVAL: {"minutes": 5}},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert setup_integration.runtime_data.reconciliation_interval == timedelta(
+        minutes=5
+    )
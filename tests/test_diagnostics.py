@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant
 
 from custom_components.netlink.coordinator import EXPECTED_HOME_ASSISTANT_COMMANDS
 from custom_components.netlink.diagnostics import async_get_config_entry_diagnostics
+from custom_components.netlink.snapshot import NetlinkSnapshot
 
 from .conftest import (
     TOKEN,
@@ -42,6 +43,7 @@ async def test_diagnostics_include_state_and_redact_secrets(
     assert diagnostics["config_entry"]["data"][CONF_TOKEN] == "**REDACTED**"
     assert TOKEN not in str(diagnostics)
     assert diagnostics["client"] == {"connected": True, "host": "netlink.local"}
+    assert diagnostics["coordinator"]["statistics"] == {"snapshot_requests": 6}
 
 
 async def test_diagnostics_support_partial_runtime_state(
@@ -50,23 +52,23 @@ async def test_diagnostics_support_partial_runtime_state(
 ) -> None:
     """Diagnostics remain useful while runtime state is incomplete."""
     coordinator = setup_integration.runtime_data
-    desk = coordinator.data["desk"]
+    desk = coordinator.data.desk
     client = coordinator.client
 
     coordinator.device_info = None
-    coordinator.data = {}
+    coordinator.data = None
     del client.connected
     diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
     assert diagnostics["device_info"] is None
     assert diagnostics["coordinator"]["data"] == {}
     assert diagnostics["client"]["connected"] is None
 
-    coordinator.data = {"desk": desk}
+    coordinator.data = NetlinkSnapshot(desk=desk)
     diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
-    assert set(diagnostics["coordinator"]["data"]) == {"desk"}
+    assert set(diagnostics["coordinator"]["data"]) == {"desk", "displays"}
     assert diagnostics["coordinator"]["data"]["desk"]["state"]["height"] == 75
 
-    coordinator.data = {"displays": {}}
+    coordinator.data = NetlinkSnapshot()
     diagnostics = await async_get_config_entry_diagnostics(hass, setup_integration)
     assert diagnostics["coordinator"]["data"] == {"displays": {}}
 
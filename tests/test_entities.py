@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 import json
 
+from freezegun.api import FrozenDateTimeFactory
 from pynetlink import (
     EVENT_AUTHORIZATION_STATE,
+    EVENT_DESK_STATE,
+    EVENT_DISPLAY_STATE,
     NetlinkCommandError,
     NetlinkConnectionError,
     NetlinkUnauthorizedError,
 )
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
 
-from custom_components.netlink.const import DOMAIN
+from custom_components.netlink.diagnostics import async_get_config_entry_diagnostics
+from custom_components.netlink.const import DOMAIN, OPTIMISTIC_STATE_TIMEOUT
 from custom_components.netlink.sensor import (
     _access_code_valid_until,
     _access_code_value,
@@ -96,6 +110,55 @@ async def test_display_error_sensor_preserves_legacy_detail(
     assert state.attributes["detail"] == "No DDC/CI response from monitor"
 
 
+async def test_error_events_fire_once_per_new_error(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Error events fire when an error appears, not on every state update."""
+    display_event = _entity_id(hass, "event", f"{DEVICE_ID}_display_1_error_event")
+    desk_event = _entity_id(hass, "event", f"{DEVICE_ID}_desk_error_event")
+    fired: list[tuple[str, str]] = []
+
+    @callback
+    def record(event: Event[EventStateChangedData]) -> None:
+        fired.append(
+            (
+                event.data["entity_id"],
+                event.data["new_state"].attributes.get("event_type"),
+            )
+        )
+
+    async_track_state_change_event(hass, [display_event, desk_event], record)
+    display, desk = netlink_client.display, netlink_client.desk
+    timeout = json.dumps({"reason": "ddc_timeout", "attempt": 1, "stage": "ddc"})
+    for error, brightness in (
+        (timeout, 40),
+        (timeout, 50),
+        (None, 50),
+        (timeout, 50),
+        ("No DDC/CI response from monitor", 50),
+    ):
+        # Event states are timestamps; identical events need distinct ones.
+        freezer.tick()
+        state = replace(display.state, error=error, brightness=brightness)
+        await netlink_client.emit(
+            EVENT_DISPLAY_STATE, replace(display, state=state).to_dict()
+        )
+    state = replace(desk.state, error="Motor overload")
+    await netlink_client.emit(EVENT_DESK_STATE, replace(desk, state=state).to_dict())
+    await hass.async_block_till_done()
+
+    assert fired == [
+        (display_event, "ddc_timeout"),
+        (display_event, "ddc_timeout"),
+        (display_event, "other"),
+        (desk_event, "error"),
+    ]
+    assert hass.states.get(desk_event).attributes["detail"] == "Motor overload"
+
+
 def _entity_id(hass: HomeAssistant, platform: str, unique_id: str) -> str:
     """Resolve an entity through the Home Assistant entity registry."""
     entity_id = er.async_get(hass).async_get_entity_id(platform, DOMAIN, unique_id)
@@ -299,3 +362,254 @@ async def test_typed_authorization_denial_is_recorded(
         == "NetlinkUnauthorizedError"
     )
     assert netlink_client.commands == []
+
+
+async def test_display_command_is_shown_optimistically_until_confirmed(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A requested value is shown at once and confirmed by the matching push."""
+    coordinator = setup_integration.runtime_data
+    entity_id = _entity_id(hass, "number", f"{DEVICE_ID}_display_1_brightness")
+
+    await _call_entity_service(hass, "number", "set_value", entity_id, value=80)
+
+    assert hass.states.get(entity_id).state == "80"
+    assert coordinator.optimistic.pending == 1
+
+    # A push that predates the command does not revert the requested value.
+    volume_changed = netlink_client.display.to_dict()
+    volume_changed["state"]["volume"] = 25
+    await netlink_client.emit(EVENT_DISPLAY_STATE, volume_changed)
+    assert hass.states.get(entity_id).state == "80"
+    assert coordinator.data.display("1").state.volume == 25
+
+    confirmed = netlink_client.display.to_dict()
+    confirmed["state"]["brightness"] = 80
+    await netlink_client.emit(EVENT_DISPLAY_STATE, confirmed)
+
+    assert hass.states.get(entity_id).state == "80"
+    assert coordinator.optimistic.pending == 0
+    assert coordinator.statistics["optimistic_confirmed"] == 1
+
+
+async def test_unconfirmed_command_is_rolled_back(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Without a confirming push the last authoritative value is restored."""
+    coordinator = setup_integration.runtime_data
+    select = _entity_id(hass, "select", f"{DEVICE_ID}_display_1_source")
+    beep = _entity_id(hass, "switch", f"{DEVICE_ID}_desk_beep")
+
+    await _call_entity_service(hass, "select", "select_option", select, option="USBC")
+    await _call_entity_service(hass, "switch", "turn_off", beep)
+    assert hass.states.get(select).state == "USBC"
+    assert hass.states.get(beep).state == "off"
+
+    await netlink_client.emit(EVENT_DESK_STATE, netlink_client.desk.to_dict())
+    assert hass.states.get(beep).state == "off"
+
+    async_fire_time_changed(
+        hass, datetime.now(UTC) + OPTIMISTIC_STATE_TIMEOUT + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(select).state == "HDMI1"
+    assert hass.states.get(beep).state == "on"
+    assert coordinator.optimistic.pending == 0
+    assert coordinator.statistics["optimistic_rolled_back"] == 2
+
+
+async def test_slow_command_is_not_rolled_back_while_in_flight(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """The confirmation timeout only starts once the command was sent."""
+    coordinator = setup_integration.runtime_data
+    entity_id = _entity_id(hass, "number", f"{DEVICE_ID}_display_1_brightness")
+    acknowledge = asyncio.Event()
+    record = netlink_client._record_command
+
+    async def slow_command(name: str, *args: object, **kwargs: object) -> None:
+        await acknowledge.wait()
+        await record(name, *args, **kwargs)
+
+    netlink_client._record_command = slow_command
+    command = hass.async_create_task(
+        _call_entity_service(hass, "number", "set_value", entity_id, value=80)
+    )
+    await asyncio.sleep(0)
+    assert hass.states.get(entity_id).state == "80"
+
+    now = datetime.now(UTC)
+    async_fire_time_changed(hass, now + OPTIMISTIC_STATE_TIMEOUT + timedelta(seconds=1))
+    await asyncio.sleep(0)
+    assert hass.states.get(entity_id).state == "80"
+    assert coordinator.statistics["optimistic_rolled_back"] == 0
+
+    acknowledge.set()
+    await command
+    assert hass.states.get(entity_id).state == "80"
+    assert coordinator.optimistic.pending == 1
+
+    async_fire_time_changed(
+        hass, now + 2 * (OPTIMISTIC_STATE_TIMEOUT + timedelta(seconds=1))
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == "40"
+    assert coordinator.statistics["optimistic_rolled_back"] == 1
+
+
+async def test_failed_command_rolls_back_immediately(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A command error restores the previous value without waiting."""
+    entity_id = _entity_id(hass, "switch", f"{DEVICE_ID}_display_1_power")
+    netlink_client.command_error = NetlinkConnectionError("offline")
+
+    with pytest.raises(HomeAssistantError):
+        await _call_entity_service(hass, "switch", "turn_off", entity_id)
+
+    assert hass.states.get(entity_id).state == "on"
+    assert setup_integration.runtime_data.optimistic.pending == 0
+
+
+async def test_slider_burst_sends_only_the_latest_value(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Values queued behind an in-flight command collapse to the latest one."""
+    coordinator = setup_integration.runtime_data
+    brightness = _entity_id(hass, "number", f"{DEVICE_ID}_display_1_brightness")
+    volume = _entity_id(hass, "number", f"{DEVICE_ID}_display_1_volume")
+    release = asyncio.Event()
+    record = netlink_client._record_command
+
+    async def slow_command(name: str, *args: object, **kwargs: object) -> None:
+        await release.wait()
+        await record(name, *args, **kwargs)
+
+    netlink_client._record_command = slow_command
+    calls = [
+        hass.async_create_task(
+            _call_entity_service(hass, "number", "set_value", brightness, value=value)
+        )
+        for value in (10, 20, 30, 40)
+    ]
+    calls.append(
+        hass.async_create_task(
+            _call_entity_service(hass, "number", "set_value", volume, value=5)
+        )
+    )
+    await asyncio.sleep(0)
+    assert hass.states.get(brightness).state == "40"
+
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert netlink_client.commands == [
+        ("set_display_brightness", ("1", 10), {}),
+        ("set_display_brightness", ("1", 40), {}),
+        ("set_display_volume", ("1", 5), {}),
+    ]
+    assert coordinator.statistics["commands_requested"] == 5
+    assert coordinator.statistics["commands_sent"] == 3
+    assert coordinator.statistics["commands_superseded"] == 2
+
+
+async def test_desk_stop_preempts_queued_commands(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Stopping the desk does not wait for queued work and cancels it."""
+    height = _entity_id(hass, "number", f"{DEVICE_ID}_desk_desk_target_height")
+    stop = _entity_id(hass, "button", f"{DEVICE_ID}_desk_stop")
+    release = asyncio.Event()
+    record = netlink_client._record_command
+
+    async def slow_command(name: str, *args: object, **kwargs: object) -> None:
+        if name == "set_desk_height":
+            await release.wait()
+        await record(name, *args, **kwargs)
+
+    netlink_client._record_command = slow_command
+    moving = hass.async_create_task(
+        _call_entity_service(hass, "number", "set_value", height, value=100)
+    )
+    queued = hass.async_create_task(
+        _call_entity_service(hass, "number", "set_value", height, value=120)
+    )
+    await asyncio.sleep(0)
+
+    await _call_entity_service(hass, "button", "press", stop)
+    assert netlink_client.commands == [("stop_desk", (), {})]
+    with pytest.raises(HomeAssistantError):
+        await queued
+
+    release.set()
+    await moving
+    assert netlink_client.commands == [
+        ("stop_desk", (), {}),
+        ("set_desk_height", (100,), {}),
+    ]
+    assert setup_integration.runtime_data.statistics["commands_preempted"] == 1
+
+
+async def test_command_confirmation_latency_is_recorded(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """The time until a push confirms a command is recorded per command type."""
+    mock_config_entry.add_to_hass(hass)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{DEVICE_ID}_desk_height_latency",
+        config_entry=mock_config_entry,
+    )
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = mock_config_entry.runtime_data
+    height = _entity_id(hass, "number", f"{DEVICE_ID}_desk_desk_target_height")
+    power = _entity_id(hass, "switch", f"{DEVICE_ID}_display_1_power")
+    latency = _entity_id(hass, "sensor", f"{DEVICE_ID}_desk_height_latency")
+    assert hass.states.get(latency).state == "unknown"
+
+    await _call_entity_service(hass, "number", "set_value", height, value=100)
+    await _call_entity_service(hass, "switch", "turn_off", power)
+
+    moving = netlink_client.desk.to_dict()
+    moving["state"]["height"] = 90
+    await netlink_client.emit(EVENT_DESK_STATE, moving)
+    assert "desk_height" not in coordinator.acknowledgements.histograms
+
+    arrived = netlink_client.desk.to_dict()
+    arrived["state"]["height"] = 100
+    await netlink_client.emit(EVENT_DESK_STATE, arrived)
+    powered_off = netlink_client.display.to_dict()
+    powered_off["state"]["power"] = "off"
+    await netlink_client.emit(EVENT_DISPLAY_STATE, powered_off)
+
+    histograms = coordinator.acknowledgements.histograms
+    assert histograms["desk_height"].count == 1
+    assert histograms["display_power"].count == 1
+    assert coordinator.statistics["acknowledgements_confirmed"] == 2
+    state = hass.states.get(latency)
+    assert float(state.state) >= 0
+    assert state.attributes["count"] == 1
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+    assert (
+        diagnostics["coordinator"]["acknowledgement_latency"]["display_power"]["count"]
+        == 1
+    )
@@ -2,24 +2,52 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
-from pynetlink import NetlinkAuthenticationError, NetlinkConnectionError
+from pynetlink import (
+    EVENT_DESK_STATE,
+    EVENT_DISPLAYS_LIST,
+    Desk,
+    NetlinkAuthenticationError,
+    NetlinkConnectionError,
+)
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from homeassistant.const import CONF_HOST, CONF_TOKEN
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_TOKEN, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 from custom_components.netlink import (
-    _async_update_listener,
     async_migrate_entry,
+    async_remove_entry,
     async_setup_entry,
     async_unload_entry,
 )
-from custom_components.netlink.const import CONF_DEVICE_ID, DOMAIN
+from custom_components.netlink.cache import STORAGE_VERSION, dump_snapshot
+from custom_components.netlink.const import (
+    CONF_COMPACT_ENTITIES,
+    CONF_DESK_MOTION_UPDATE_INTERVAL,
+    CONF_DEVICE_ID,
+    CONF_DISCONNECT_GRACE,
+    CONF_DISPLAY_STATUS_CONCURRENCY,
+    CONF_RECONCILIATION_INTERVAL,
+    DESK_MOTION_UPDATE_INTERVAL,
+    DISPLAY_STATUS_CONCURRENCY,
+    DOMAIN,
+    RECONNECT_BACKOFF,
+    SNAPSHOT_CACHE_SAVE_DELAY,
+    WEBSOCKET_DISCONNECT_GRACE,
+)
+from custom_components.netlink.snapshot import NetlinkSnapshot
 
 from .conftest import DEVICE_ID, HOST, TOKEN, FakeNetlinkClient
 
@@ -86,12 +114,81 @@ async def test_setup_requires_device_info(
 
 async def test_update_listener_reloads_entry(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Config-entry data updates trigger a reload."""
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload_entry:
+        hass.config_entries.async_update_entry(
+            setup_integration, data={**setup_integration.data, CONF_TOKEN: "new"}
+        )
+        await hass.async_block_till_done()
+    reload_entry.assert_awaited_once_with(setup_integration.entry_id)
+
+
+async def test_update_listener_applies_tuning_options(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
 ) -> None:
-    """Config-entry updates trigger a reload."""
+    """Tuning options reach the running coordinator without a reload."""
+    coordinator = setup_integration.runtime_data
     with patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload_entry:
-        await _async_update_listener(hass, mock_config_entry)
-    reload_entry.assert_awaited_once_with(mock_config_entry.entry_id)
+        hass.config_entries.async_update_entry(
+            setup_integration,
+            options={
+                CONF_RECONCILIATION_INTERVAL: {"minutes": 5},
+                CONF_DISCONNECT_GRACE: {"seconds": 30},
+                CONF_DESK_MOTION_UPDATE_INTERVAL: {"milliseconds": 250},
+                CONF_DISPLAY_STATUS_CONCURRENCY: 2.0,
+            },
+        )
+        await hass.async_block_till_done()
+
+    reload_entry.assert_not_awaited()
+    assert setup_integration.runtime_data is coordinator
+    assert coordinator.reconciliation_interval == timedelta(minutes=5)
+    assert coordinator.disconnect_grace == timedelta(seconds=30)
+    assert coordinator.desk_motion_update_interval == timedelta(milliseconds=250)
+    assert coordinator.display_status_concurrency == 2
+
+    netlink_client.rest_calls.clear()
+    async_fire_time_changed(hass, datetime.now(UTC) + timedelta(minutes=5, seconds=1))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert netlink_client.rest_calls
+
+    with patch.object(hass.config_entries, "async_reload", AsyncMock()) as reload_entry:
+        hass.config_entries.async_update_entry(
+            setup_integration,
+            options={**setup_integration.options, CONF_COMPACT_ENTITIES: True},
+        )
+        await hass.async_block_till_done()
+    reload_entry.assert_awaited_once_with(setup_integration.entry_id)
+
+
+async def test_cleared_tuning_options_restore_defaults(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+) -> None:
+    """Clearing a tuning option falls back to its default without a restart."""
+    coordinator = setup_integration.runtime_data
+    hass.config_entries.async_update_entry(
+        setup_integration,
+        options={
+            CONF_DISCONNECT_GRACE: {"seconds": 30},
+            CONF_DESK_MOTION_UPDATE_INTERVAL: {"milliseconds": 250},
+            CONF_DISPLAY_STATUS_CONCURRENCY: 2.0,
+        },
+    )
+    await hass.async_block_till_done()
+    assert coordinator.disconnect_grace == timedelta(seconds=30)
+
+    hass.config_entries.async_update_entry(setup_integration, options={})
+    await hass.async_block_till_done()
+
+    assert setup_integration.runtime_data is coordinator
+    assert coordinator.disconnect_grace == WEBSOCKET_DISCONNECT_GRACE
+    assert coordinator.desk_motion_update_interval == DESK_MOTION_UPDATE_INTERVAL
+    assert coordinator.display_status_concurrency == DISPLAY_STATUS_CONCURRENCY
 
 
 async def test_unload_disconnects_client(
@@ -142,6 +239,41 @@ async def test_coordinator_setup_maps_rest_authentication_failure(
     assert await hass.config_entries.async_setup(mock_config_entry.entry_id) is False
 
 
+async def test_setup_overlaps_connect_with_the_first_snapshot(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """The WebSocket handshake and REST snapshot run at the same time."""
+    snapshot_started = asyncio.Event()
+    connect = netlink_client.connect
+    get_desk_status = netlink_client.get_desk_status
+
+    async def connect_after_snapshot_started() -> None:
+        async with asyncio.timeout(1):
+            await snapshot_started.wait()
+        await connect()
+        # A push racing the snapshot must not be lost.
+        desk = netlink_client.desk.to_dict()
+        desk["state"]["height"] = 99
+        await netlink_client.emit(EVENT_DESK_STATE, desk)
+
+    async def get_desk_status_signalling_start() -> Desk:
+        snapshot_started.set()
+        return await get_desk_status()
+
+    netlink_client.connect = connect_after_snapshot_started
+    netlink_client.get_desk_status = get_desk_status_signalling_start
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.data.desk.state.height == 99
+    assert set(coordinator.setup_timings) == {"connect", "snapshot", "total"}
+
+
 async def test_setup_removes_stale_display_device(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -160,3 +292,170 @@ async def test_setup_removes_stale_display_device(
     await hass.async_block_till_done()
 
     assert registry.async_get(stale.id) is None
+
+
+def _store_key(entry: MockConfigEntry) -> str:
+    """Return the storage key of the cached snapshot of an entry."""
+    return f"{DOMAIN}.{entry.entry_id}.snapshot"
+
+
+def _cache_snapshot(
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    client: FakeNetlinkClient,
+    height: float,
+) -> None:
+    """Store a cached snapshot whose desk height differs from the device."""
+    desk = client.desk.to_dict()
+    desk["state"]["height"] = height
+    snapshot = NetlinkSnapshot(
+        desk=client.desk.from_dict(desk),
+        browser=client.browser,
+        displays={"1": client.display},
+    )
+    hass_storage[_store_key(entry)] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": _store_key(entry),
+        "data": dump_snapshot(client.device_info, [client.display_summary], snapshot),
+    }
+
+
+def _desk_height_state(hass: HomeAssistant) -> str:
+    """Return the state of the desk height sensor."""
+    return _desk_height(hass).state
+
+
+def _desk_height(hass: HomeAssistant) -> State:
+    """Return the desk height sensor."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{DEVICE_ID}_desk_height"
+    )
+    assert entity_id is not None
+    return hass.states.get(entity_id)
+
+
+async def test_snapshot_is_cached_without_secrets(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    setup_integration: MockConfigEntry,
+) -> None:
+    """The last good snapshot is persisted, without access codes or policy."""
+    async_fire_time_changed(
+        hass, datetime.now(UTC) + SNAPSHOT_CACHE_SAVE_DELAY + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    cached = hass_storage[_store_key(setup_integration)]["data"]
+    assert cached["desk"]["state"]["height"] == 75
+    assert set(cached["displays"]) == {"1"}
+    assert [display["bus"] for display in cached["inventory"]] == [1]
+    assert "access_codes" not in cached
+    assert "authorization" not in cached
+
+    await async_remove_entry(hass, setup_integration)
+    assert _store_key(setup_integration) not in hass_storage
+
+
+async def test_push_updates_do_not_schedule_a_cache_save(
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Live state pushes wait for the next save; inventory changes save."""
+    coordinator = setup_integration.runtime_data
+    with patch.object(coordinator._store, "async_delay_save") as delay_save:
+        desk = netlink_client.desk.to_dict()
+        desk["state"]["height"] = 90
+        await netlink_client.emit(EVENT_DESK_STATE, desk)
+        await netlink_client.emit(
+            EVENT_DISPLAYS_LIST, [netlink_client.display_summary.to_dict()]
+        )
+        delay_save.assert_not_called()
+
+        await netlink_client.emit(EVENT_DISPLAYS_LIST, [])
+    delay_save.assert_called_once()
+
+
+async def test_cached_setup_adds_entities_before_the_device_answers(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A cached snapshot is shown at once and replaced in the background."""
+    _cache_snapshot(hass_storage, mock_config_entry, netlink_client, height=60)
+    answer = asyncio.Event()
+    connect = netlink_client.connect
+
+    async def slow_connect() -> None:
+        await answer.wait()
+        await connect()
+
+    netlink_client.connect = slow_connect
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert float(_desk_height_state(hass)) == 60
+    assert _desk_height(hass).attributes["stale"] is True
+    assert coordinator.snapshot_from_cache is True
+
+    answer.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert float(_desk_height_state(hass)) == 75
+    assert "stale" not in _desk_height(hass).attributes
+    assert coordinator.snapshot_from_cache is False
+    assert coordinator.access_codes_known is True
+
+
+async def test_cached_setup_retries_an_unreachable_device(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """An unreachable device no longer blocks setup; it is retried with backoff."""
+    _cache_snapshot(hass_storage, mock_config_entry, netlink_client, height=60)
+    netlink_client.connect_error = NetlinkConnectionError("offline")
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.netlink.scheduler.random.random", return_value=0):
+        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert mock_config_entry.state is ConfigEntryState.LOADED
+    assert _desk_height_state(hass) == STATE_UNAVAILABLE
+
+    netlink_client.connect_error = None
+    async_fire_time_changed(
+        hass, datetime.now(UTC) + RECONNECT_BACKOFF + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert float(_desk_height_state(hass)) == 75
+
+
+async def test_invalid_cache_falls_back_to_blocking_setup(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A cache that cannot be parsed is ignored."""
+    hass_storage[_store_key(mock_config_entry)] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": _store_key(mock_config_entry),
+        "data": {"device_info": {}},
+    }
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.runtime_data.snapshot_from_cache is False
+    assert float(_desk_height_state(hass)) == 75
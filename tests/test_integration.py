@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 import logging
+from unittest.mock import patch
 
 from pynetlink import (
     EVENT_ACCESS_CODES_STATE,
@@ -14,6 +17,8 @@ from pynetlink import (
     EVENT_DISPLAYS_LIST,
     Desk,
     DeskState,
+    Display,
+    DisplaySummary,
     NetlinkConnectionError,
 )
 import pytest
@@ -30,8 +35,11 @@ from homeassistant.helpers import entity_registry as er
 from custom_components.netlink.const import (
     DOMAIN,
     RECONCILIATION_INTERVAL,
+    RECONNECT_BACKOFF,
+    SNAPSHOT_CONCURRENCY,
     WEBSOCKET_DISCONNECT_GRACE,
 )
+from custom_components.netlink.scheduler import async_get_scheduler
 
 from .conftest import DEVICE_ID, TOKEN, FakeNetlinkClient
 
@@ -184,6 +192,42 @@ async def test_reconnect_restores_fresh_rest_state(
     )
 
 
+async def test_reconnect_replays_pushes_received_during_recovery(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Pushes racing the recovery snapshot are applied once it completes."""
+    await _expire_disconnect_grace(hass, netlink_client)
+    await netlink_client.emit(EVENT_BROWSER_STATE, {"url": "https://outdated.test"})
+    get_desk_status = netlink_client.get_desk_status
+
+    async def get_desk_status_racing_a_push() -> Desk:
+        desk = await get_desk_status()
+        await netlink_client.emit(
+            EVENT_DESK_STATE,
+            {
+                "capabilities": {"supports": {"height": True}},
+                "inventory": {},
+                "state": {"height": 99, "mode": "idle", "moving": False},
+            },
+        )
+        return desk
+
+    netlink_client.get_desk_status = get_desk_status_racing_a_push
+
+    await netlink_client.emit("connect")
+    await hass.async_block_till_done()
+
+    coordinator = setup_integration.runtime_data
+    assert (
+        float(_state_by_unique_id(hass, "sensor", f"{DEVICE_ID}_desk_height").state)
+        == 99
+    )
+    assert coordinator.data.browser.url == "https://example.com"
+    assert coordinator.statistics["recovery_pushes_replayed"] == 1
+
+
 async def test_lifecycle_logs_once_without_credentials(
     hass: HomeAssistant,
     setup_integration: MockConfigEntry,
@@ -227,6 +271,34 @@ async def test_failed_reconnect_refresh_keeps_entities_unavailable(
     )
 
 
+async def test_failed_reconnect_refresh_is_retried_with_backoff(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A failed recovery snapshot is retried without waiting for reconciliation."""
+    await _expire_disconnect_grace(hass, netlink_client)
+    netlink_client.rest_error = NetlinkConnectionError("REST unavailable")
+    now = datetime.now(UTC)
+
+    with patch("custom_components.netlink.scheduler.random.random", return_value=0):
+        await netlink_client.emit("connect")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, now + RECONNECT_BACKOFF + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    assert netlink_client.rest_calls["get_device_info"] == 3
+    netlink_client.rest_error = None
+
+    async_fire_time_changed(hass, now + 3 * RECONNECT_BACKOFF + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert all(
+        state.state != STATE_UNAVAILABLE
+        for state in _states_for_entry(hass, setup_integration)
+    )
+
+
 async def test_failed_display_refresh_keeps_entities_unavailable(
     hass: HomeAssistant,
     setup_integration: MockConfigEntry,
@@ -245,6 +317,99 @@ async def test_failed_display_refresh_keeps_entities_unavailable(
     )
 
 
+async def test_concurrent_refreshes_share_one_snapshot(
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Refreshes requested while a snapshot is in flight join that snapshot."""
+    coordinator = setup_integration.runtime_data
+    netlink_client.rest_calls.clear()
+
+    await asyncio.gather(*(coordinator.async_refresh() for _ in range(3)))
+
+    assert netlink_client.rest_calls["get_device_info"] == 1
+    assert coordinator.statistics["refresh_executed"] == 1
+    assert coordinator.statistics["refresh_joined"] == 2
+
+    await coordinator.async_refresh()
+
+    assert netlink_client.rest_calls["get_device_info"] == 2
+    assert coordinator.statistics["refresh_executed"] == 2
+
+
+async def test_slow_display_keeps_last_known_state_as_stale(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A display that misses its deadline does not fail or stall the snapshot."""
+    coordinator = setup_integration.runtime_data
+    coordinator.display_status_timeout = timedelta(milliseconds=10)
+    never = asyncio.Event()
+
+    async def hang(_: int | str) -> Display:
+        await never.wait()
+        raise AssertionError("unreachable")
+
+    netlink_client.get_display_status = hang
+    netlink_client.desk.state.height = 90
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert coordinator.data.desk.state.height == 90
+    assert coordinator.data.display("1").state.brightness == 40
+    assert coordinator.stale_displays == {"1"}
+    assert coordinator.statistics["display_timeouts"] == 1
+    brightness = _state_by_unique_id(
+        hass, "number", f"{DEVICE_ID}_display_1_brightness"
+    )
+    assert brightness.state == "40"
+    assert brightness.attributes["stale"] is True
+    desk_height = _state_by_unique_id(hass, "sensor", f"{DEVICE_ID}_desk_height")
+    assert desk_height.state == "90"
+    assert "stale" not in desk_height.attributes
+
+    await netlink_client.emit(EVENT_DISPLAY_STATE, netlink_client.display.to_dict())
+
+    assert coordinator.stale_displays == set()
+    assert "stale" not in (
+        _state_by_unique_id(
+            hass, "number", f"{DEVICE_ID}_display_1_brightness"
+        ).attributes
+    )
+
+
+async def test_display_status_fan_out_is_bounded(
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Display statuses are requested with a bounded number in flight."""
+    coordinator = setup_integration.runtime_data
+    coordinator.display_status_concurrency = 2
+    netlink_client.display_summaries = [
+        DisplaySummary(id=bus, bus=bus, model="Test display", type="display")
+        for bus in range(1, 7)
+    ]
+    in_flight = peak = 0
+
+    async def get_display_status(bus: int | str) -> Display:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return Display.from_dict({**netlink_client.display.to_dict(), "bus": bus})
+
+    netlink_client.get_display_status = get_display_status
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert len(coordinator.data.displays) == 6
+    assert peak == 2
+
+
 async def test_disconnected_push_cannot_publish_stale_state(
     hass: HomeAssistant,
     setup_integration: MockConfigEntry,
@@ -333,6 +498,81 @@ async def test_reconciliation_removes_absent_display_state(
     )
 
 
+async def test_reconciliation_skips_resources_confirmed_by_push(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Only resources without a recent push are fetched again."""
+    now = datetime.now(UTC)
+    netlink_client.rest_calls.clear()
+    await netlink_client.emit(EVENT_DESK_STATE, netlink_client.desk.to_dict())
+    await netlink_client.emit(EVENT_BROWSER_STATE, netlink_client.browser.to_dict())
+
+    async_fire_time_changed(hass, now + RECONCILIATION_INTERVAL + timedelta(seconds=1))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert netlink_client.rest_calls == {
+        "get_device_info": 1,
+        "get_displays": 1,
+        "get_display_status": 1,
+        "get_access_codes": 1,
+    }
+
+    netlink_client.rest_calls.clear()
+    await netlink_client.emit(EVENT_DEVICE_INFO, netlink_client.device_info.to_dict())
+    await netlink_client.emit(
+        EVENT_DISPLAYS_LIST, [netlink_client.display_summary.to_dict()]
+    )
+    await netlink_client.emit(EVENT_DESK_STATE, netlink_client.desk.to_dict())
+    await netlink_client.emit(EVENT_BROWSER_STATE, netlink_client.browser.to_dict())
+    await netlink_client.emit(EVENT_DISPLAY_STATE, netlink_client.display.to_dict())
+    await netlink_client.emit(
+        EVENT_ACCESS_CODES_STATE, netlink_client.access_codes.to_dict()
+    )
+
+    async_fire_time_changed(
+        hass, now + 2 * RECONCILIATION_INTERVAL + timedelta(seconds=2)
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert netlink_client.rest_calls == {}
+    assert setup_integration.runtime_data.statistics["reconciliations_skipped"] == 1
+
+
+async def test_reconnect_during_reconciliation_fetches_full_state(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A recovery does not settle for a scoped snapshot that was already queued."""
+    coordinator = setup_integration.runtime_data
+    scheduler = async_get_scheduler(hass)
+    await netlink_client.emit(EVENT_DESK_STATE, netlink_client.desk.to_dict())
+    netlink_client.rest_calls.clear()
+    for _ in range(SNAPSHOT_CONCURRENCY):
+        await scheduler.snapshots.acquire()
+
+    # The reconciliation skips the desk and waits for a snapshot slot ...
+    reconcile = hass.async_create_task(coordinator._async_reconcile())
+    await asyncio.sleep(0)
+    # ... while the connection drops and comes back.
+    await netlink_client.emit("disconnect")
+    netlink_client.desk = replace(
+        netlink_client.desk, state=replace(netlink_client.desk.state, height=95)
+    )
+    reconnect = hass.async_create_task(netlink_client.emit("connect"))
+    await asyncio.sleep(0)
+    for _ in range(SNAPSHOT_CONCURRENCY):
+        scheduler.snapshots.release()
+    await reconcile
+    await reconnect
+
+    assert coordinator._push_updates_allowed()
+    assert netlink_client.rest_calls["get_desk_status"] >= 1
+    assert coordinator.data.desk.state.height == 95
+
+
 async def test_periodic_reconciliation_recovers_after_temporary_rest_failure(
     hass: HomeAssistant,
     setup_integration: MockConfigEntry,
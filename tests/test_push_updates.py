@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 import logging
 from unittest.mock import patch
 
@@ -26,12 +27,15 @@ from pynetlink import (
     NetlinkNotFoundError,
 )
 import pytest
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from custom_components.netlink.const import DOMAIN
+from custom_components.netlink.const import DESK_MOTION_UPDATE_INTERVAL, DOMAIN
 from custom_components.netlink.coordinator import EXPECTED_HOME_ASSISTANT_COMMANDS
 from custom_components.netlink.sensor import (
     ACCESS_CODE_SENSORS,
@@ -173,6 +177,85 @@ async def test_push_events_update_home_assistant_state(
     assert controller.sw_version == "2.0.0"
 
 
+def _desk_payload(height: float, *, moving: bool) -> dict:
+    """Return a desk push payload."""
+    return {
+        "capabilities": {"supports": {"height": True}},
+        "inventory": {},
+        "state": {
+            "height": height,
+            "mode": "moving" if moving else "idle",
+            "moving": moving,
+            "beep": "on",
+        },
+    }
+
+
+async def test_unchanged_push_state_is_not_written(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Re-sent identical state and unrendered changes do not write entity state."""
+    coordinator = setup_integration.runtime_data
+    registry = er.async_get(hass)
+    height_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{DEVICE_ID}_desk_height"
+    )
+    mode_id = registry.async_get_entity_id("sensor", DOMAIN, f"{DEVICE_ID}_desk_mode")
+    height_updated = hass.states.get(height_id).last_updated
+
+    await netlink_client.emit(EVENT_DESK_STATE, netlink_client.desk.to_dict())
+    await netlink_client.emit(EVENT_DISPLAY_STATE, netlink_client.display.to_dict())
+    await hass.async_block_till_done()
+    assert coordinator.statistics["suppressed_updates"] == 2
+
+    desk = netlink_client.desk.to_dict()
+    desk["state"]["mode"] = "calibrating"
+    await netlink_client.emit(EVENT_DESK_STATE, desk)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(mode_id).state == "calibrating"
+    assert hass.states.get(height_id).last_updated == height_updated
+    assert coordinator.statistics["suppressed_entity_writes"] > 0
+
+
+async def test_desk_motion_frames_are_coalesced(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Frames during motion are rate limited and the resting height is immediate."""
+    registry = er.async_get(hass)
+    height_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{DEVICE_ID}_desk_height"
+    )
+
+    for height in (76, 77, 78, 79):
+        await netlink_client.emit(EVENT_DESK_STATE, _desk_payload(height, moving=True))
+    await hass.async_block_till_done()
+    assert float(hass.states.get(height_id).state) == 76
+
+    async_fire_time_changed(
+        hass,
+        datetime.now(UTC) + DESK_MOTION_UPDATE_INTERVAL + timedelta(seconds=1),
+    )
+    await hass.async_block_till_done()
+    assert float(hass.states.get(height_id).state) == 79
+
+    await netlink_client.emit(EVENT_DESK_STATE, _desk_payload(80, moving=True))
+    await netlink_client.emit(EVENT_DESK_STATE, _desk_payload(81, moving=False))
+    await hass.async_block_till_done()
+    assert float(hass.states.get(height_id).state) == 81
+
+    async_fire_time_changed(
+        hass,
+        datetime.now(UTC) + 2 * DESK_MOTION_UPDATE_INTERVAL + timedelta(seconds=2),
+    )
+    await hass.async_block_till_done()
+    assert float(hass.states.get(height_id).state) == 81
+
+
 async def test_authorization_state_updates_command_availability(
     hass: HomeAssistant,
     setup_integration: MockConfigEntry,
@@ -208,6 +291,37 @@ async def test_authorization_state_updates_command_availability(
     assert hass.states.get(refresh_id).state != "unavailable"
 
 
+async def test_authorization_state_only_updates_flipped_commands(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A policy change only re-renders entities whose command permission flipped."""
+    coordinator = setup_integration.runtime_data
+    everything = authorization_state(*EXPECTED_HOME_ASSISTANT_COMMANDS)
+    await netlink_client.emit(
+        EVENT_AUTHORIZATION_STATE, authorization_payload(everything)
+    )
+    await hass.async_block_till_done()
+    before = coordinator.statistics.copy()
+
+    await netlink_client.emit(
+        EVENT_AUTHORIZATION_STATE,
+        authorization_payload(
+            authorization_state(
+                *(EXPECTED_HOME_ASSISTANT_COMMANDS - {"command.browser.refresh"})
+            )
+        ),
+    )
+    await hass.async_block_till_done()
+
+    delta = coordinator.statistics - before
+    assert delta["entity_writes"] == 1
+    assert delta["suppressed_entity_writes"] == 0
+    assert not coordinator.command_allowed("command.browser.refresh")
+    assert coordinator.command_allowed("command.desk.stop")
+
+
 async def test_dedicated_identity_keeps_expected_commands_available(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -253,7 +367,7 @@ async def test_access_code_denial_degrades_only_sensitive_entities(
     coordinator = mock_config_entry.runtime_data
     assert netlink_client.access_codes_calls == 0
     assert coordinator.access_codes_status == "unauthorized"
-    assert "access_codes" not in coordinator.data
+    assert coordinator.data.access_codes is None
 
     access_code = NetlinkAccessCodeSensor(
         coordinator, mock_config_entry, ACCESS_CODE_SENSORS[0]
@@ -270,7 +384,7 @@ async def test_access_code_denial_degrades_only_sensitive_entities(
     await netlink_client.emit(
         EVENT_ACCESS_CODES_STATE, netlink_client.access_codes.to_dict()
     )
-    assert "access_codes" not in coordinator.data
+    assert coordinator.data.access_codes is None
 
 
 @pytest.mark.parametrize(
@@ -296,8 +410,8 @@ async def test_access_code_rest_failure_does_not_break_other_state(
 
     coordinator = mock_config_entry.runtime_data
     assert coordinator.access_codes_status == status
-    assert "desk" in coordinator.data
-    assert "access_codes" not in coordinator.data
+    assert coordinator.data.desk is not None
+    assert coordinator.data.access_codes is None
 
 
 async def test_late_access_code_denial_adds_unavailable_sensitive_entities(
@@ -0,0 +1,148 @@
+"""Tests for the fleet-wide NetLink scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.netlink.const import (
+    RECONCILIATION_INTERVAL,
+    SNAPSHOT_CONCURRENCY,
+)
+from custom_components.netlink.scheduler import async_get_scheduler
+
+from .conftest import FakeNetlinkClient
+
+
+async def test_entries_are_reconciled_round_robin(hass: HomeAssistant) -> None:
+    """Entries share the interval instead of reconciling at the same time."""
+    scheduler = async_get_scheduler(hass)
+    reconciled: list[str] = []
+
+    def reconciler(entry_id: str):
+        async def reconcile() -> None:
+            reconciled.append(entry_id)
+
+        return reconcile
+
+    with patch("custom_components.netlink.scheduler.random.random", return_value=0):
+        unregister = {
+            entry_id: scheduler.async_register(entry_id, reconciler(entry_id))
+            for entry_id in ("a", "b", "c", "d")
+        }
+        slot = RECONCILIATION_INTERVAL / 4
+        now = datetime.now(UTC)
+        for step in range(1, 6):
+            async_fire_time_changed(hass, now + step * slot + timedelta(seconds=1))
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert reconciled == ["a", "b", "c", "d", "a"]
+
+        for remove in unregister.values():
+            remove()
+        async_fire_time_changed(hass, now + 10 * RECONCILIATION_INTERVAL)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(reconciled) == 5
+    assert async_get_scheduler(hass) is scheduler
+
+
+async def test_jitter_never_stretches_a_slot(hass: HomeAssistant) -> None:
+    """A single entry is still reconciled within one interval."""
+    scheduler = async_get_scheduler(hass)
+    reconciled = asyncio.Event()
+
+    async def reconcile() -> None:
+        reconciled.set()
+
+    with patch("custom_components.netlink.scheduler.random.random", return_value=1):
+        remove = scheduler.async_register("a", reconcile)
+    async_fire_time_changed(hass, datetime.now(UTC) + RECONCILIATION_INTERVAL)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert reconciled.is_set()
+    remove()
+
+
+async def test_entry_interval_does_not_load_other_entries(
+    hass: HomeAssistant,
+) -> None:
+    """An entry with a short interval is reconciled more often on its own."""
+    scheduler = async_get_scheduler(hass)
+    reconciled: list[str] = []
+
+    def reconciler(entry_id: str):
+        async def reconcile() -> None:
+            reconciled.append(entry_id)
+
+        return reconcile
+
+    with patch("custom_components.netlink.scheduler.random.random", return_value=0):
+        unregister = [
+            scheduler.async_register("fast", reconciler("fast")),
+            scheduler.async_register("default", reconciler("default")),
+        ]
+        scheduler.async_set_interval("fast", RECONCILIATION_INTERVAL / 3)
+        scheduler.async_set_interval("unknown", RECONCILIATION_INTERVAL / 3)
+        # Together the entries need four reconciliations per interval.
+        slot = RECONCILIATION_INTERVAL / 4
+        now = datetime.now(UTC)
+        for step in range(1, 7):
+            async_fire_time_changed(hass, now + step * slot + timedelta(seconds=1))
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert reconciled == ["fast", "default", "fast", "fast", "default"]
+    for remove in unregister:
+        remove()
+
+
+async def test_snapshots_are_capped_across_entries(
+    hass: HomeAssistant,
+    setup_integration: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A refresh waits while the fleet-wide snapshot limit is reached."""
+    scheduler = async_get_scheduler(hass)
+    netlink_client.rest_calls.clear()
+    for _ in range(SNAPSHOT_CONCURRENCY):
+        await scheduler.snapshots.acquire()
+
+    refresh = hass.async_create_task(setup_integration.runtime_data.async_refresh())
+    await asyncio.sleep(0)
+    assert not netlink_client.rest_calls
+
+    scheduler.snapshots.release()
+    await refresh
+
+    assert netlink_client.rest_calls["get_device_info"] == 1
+
+
+async def test_initial_snapshots_are_capped_across_entries(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Setting up an entry waits while the fleet-wide snapshot limit is reached."""
+    scheduler = async_get_scheduler(hass)
+    for _ in range(SNAPSHOT_CONCURRENCY):
+        await scheduler.snapshots.acquire()
+    mock_config_entry.add_to_hass(hass)
+
+    setup = hass.async_create_task(
+        hass.config_entries.async_setup(mock_config_entry.entry_id)
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert not netlink_client.rest_calls
+
+    scheduler.snapshots.release()
+    assert await setup
+    assert netlink_client.rest_calls["get_device_info"] == 1
@@ -0,0 +1,219 @@
+"""Tests for the NetLink services."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+
+from pynetlink import (
+    EVENT_ACCESS_CODES_STATE,
+    EVENT_DISPLAY_STATE,
+    DisplayState,
+    NetlinkConnectionError,
+)
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.netlink.const import DOMAIN
+from custom_components.netlink.capture import read_capture
+from custom_components.netlink.services import (
+    SERVICE_BATCH_COMMAND,
+    SERVICE_CAPTURE_EVENTS,
+)
+
+from .conftest import FakeNetlinkClient
+
+DISPLAY_COUNT = 5
+
+
+@pytest.fixture
+async def room(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> MockConfigEntry:
+    """Set up a room controller with several displays."""
+    netlink_client.display_summaries = [
+        replace(netlink_client.display_summary, id=index, bus=index + 1)
+        for index in range(DISPLAY_COUNT)
+    ]
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return mock_config_entry
+
+
+async def test_batch_command_limits_parallel_commands_per_device(
+    hass: HomeAssistant,
+    room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """Every display is switched off with bounded parallelism per controller."""
+    record = netlink_client._record_command
+    in_flight = peak = 0
+
+    async def slow_command(name: str, *args: object, **kwargs: object) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        await record(name, *args, **kwargs)
+
+    netlink_client._record_command = slow_command
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BATCH_COMMAND,
+        {"command": "power", "value": "off", "max_parallel_per_device": 2},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert peak == 2
+    assert sorted(args for _, args, _ in netlink_client.commands) == [
+        (str(bus), "off") for bus in range(1, DISPLAY_COUNT + 1)
+    ]
+    assert response["succeeded"] == DISPLAY_COUNT
+    assert response["failed"] == 0
+    assert [result["display"] for result in response["results"]] == [
+        str(bus) for bus in range(1, DISPLAY_COUNT + 1)
+    ]
+    assert all(
+        result["config_entry_id"] == room.entry_id and result["latency"] >= 0.01
+        for result in response["results"]
+    )
+
+
+async def test_batch_command_reports_failures_per_target(
+    hass: HomeAssistant,
+    room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+) -> None:
+    """A failing display is reported in the summary instead of aborting."""
+    netlink_client.command_error = NetlinkConnectionError("offline")
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BATCH_COMMAND,
+        {
+            "config_entry_id": room.entry_id,
+            "displays": [1, 2, 9],
+            "command": "brightness",
+            "value": "40",
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["succeeded"] == 0
+    assert response["failed"] == 3
+    assert [(result["display"], result["error"]) for result in response["results"]] == [
+        ("1", "command_unavailable"),
+        ("2", "command_unavailable"),
+        ("9", "unknown_display"),
+    ]
+    assert response["results"][-1]["config_entry_id"] is None
+
+
+async def test_batch_command_validates_targets(
+    hass: HomeAssistant,
+    room: MockConfigEntry,
+) -> None:
+    """Unknown entries and empty selections are rejected before sending."""
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BATCH_COMMAND,
+            {"config_entry_id": "missing", "command": "power", "value": "off"},
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == "entry_not_loaded"
+
+    with pytest.raises(ServiceValidationError) as err:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_BATCH_COMMAND,
+            {"displays": ["9"], "command": "power", "value": "off"},
+            blocking=True,
+            return_response=True,
+        )
+    assert err.value.translation_key == "no_batch_targets"
+
+
+async def test_capture_events_records_received_events(
+    hass: HomeAssistant,
+    room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    tmp_path: Path,
+) -> None:
+    """Events received while capturing are written to the capture file."""
+    hass.config.config_dir = str(tmp_path)
+    await netlink_client.emit(EVENT_DISPLAY_STATE, netlink_client.display.to_dict())
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CAPTURE_EVENTS,
+        {"enabled": True},
+        blocking=True,
+        return_response=True,
+    )
+    path = Path(response["captures"][0]["path"])
+    assert path == tmp_path / DOMAIN / "capture-device-id.jsonl"
+
+    display = replace(
+        netlink_client.display,
+        state=DisplayState(power="off", source="HDMI1", brightness=10, volume=20),
+    )
+    await netlink_client.emit(EVENT_DISPLAY_STATE, display.to_dict())
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CAPTURE_EVENTS,
+        {"config_entry_id": room.entry_id, "enabled": False},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["captures"] == [
+        {"config_entry_id": room.entry_id, "path": str(path), "events": 1}
+    ]
+    captured = await hass.async_add_executor_job(read_capture, path)
+    assert [(event, data) for _, event, data in captured] == [
+        (EVENT_DISPLAY_STATE, display.to_dict())
+    ]
+    assert room.runtime_data.capture is None
+
+
+async def test_capture_events_redacts_access_codes(
+    hass: HomeAssistant,
+    room: MockConfigEntry,
+    netlink_client: FakeNetlinkClient,
+    tmp_path: Path,
+) -> None:
+    """Access codes received while capturing never reach the capture file."""
+    hass.config.config_dir = str(tmp_path)
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CAPTURE_EVENTS,
+        {"enabled": True},
+        blocking=True,
+        return_response=True,
+    )
+    await netlink_client.emit(
+        EVENT_ACCESS_CODES_STATE, netlink_client.access_codes.to_dict()
+    )
+    await hass.services.async_call(
+        DOMAIN, SERVICE_CAPTURE_EVENTS, {"enabled": False}, blocking=True
+    )
+
+    path = Path(response["captures"][0]["path"])
+    content = await hass.async_add_executor_job(path.read_text)
+    assert "123456" not in content
+    assert "654321" not in content
+    (captured,) = await hass.async_add_executor_job(read_capture, path)
+    assert captured.event == EVENT_ACCESS_CODES_STATE
+    assert captured.data["web_login"]["code"] == "**REDACTED**"
+    assert captured.data["web_login"]["timezone"] == "Europe/Amsterdam"
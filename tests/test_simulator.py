@@ -0,0 +1,129 @@
+"""Tests for the local NetLink device simulator."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp.test_utils import TestClient, TestServer
+from pynetlink import DeskState, DeviceInfo, Display, DisplaySummary
+import pytest
+import socketio
+
+from .simulator import NetlinkSimulator, SimulatorConfig
+
+TOKEN = "simulator-token"
+HEADERS = {"Authorization": f"Bearer {TOKEN}"}
+
+
+@pytest.fixture
+async def simulator_client(socket_enabled: None) -> Any:
+    """Serve two simulated controllers on a local port."""
+    simulator = NetlinkSimulator(SimulatorConfig(controllers=2, displays=3, seed=1))
+    client = TestClient(TestServer(simulator.app, host="127.0.0.1"))
+    await client.start_server()
+    yield simulator, client
+    await client.close()
+
+
+async def test_rest_state_matches_pynetlink_models(simulator_client: Any) -> None:
+    """REST responses parse with the models pynetlink uses."""
+    simulator, client = simulator_client
+    headers = {**HEADERS, "Host": "127.0.1.2"}
+
+    response = await client.get("/api/v1/device/info", headers=headers)
+    assert DeviceInfo.from_dict(await response.json()).device_id == "sim-0001"
+
+    response = await client.get("/api/v1/displays", headers=headers)
+    summaries = [DisplaySummary.from_dict(item) for item in await response.json()]
+    assert [summary.bus for summary in summaries] == [1, 2, 3]
+
+    response = await client.put(
+        "/api/v1/display/2/brightness", json={"brightness": 80}, headers=headers
+    )
+    assert response.status == 200
+    response = await client.get("/api/v1/display/2/status", headers=headers)
+    assert Display.from_dict(await response.json()).state.brightness == 80
+    # Controllers do not share state.
+    other = simulator.controllers["127.0.1.1"]
+    assert other.displays["2"]["state"]["brightness"] == 50
+
+    response = await client.get("/api/v1/desk/status", headers={"Host": "127.0.1.2"})
+    assert response.status == 401
+    assert simulator.statistics["rest_requests"] == 5
+
+
+async def test_rest_failure_injection(simulator_client: Any) -> None:
+    """Injected REST failures answer with a server error."""
+    simulator, client = simulator_client
+    simulator.config.rest_failure_rate = 1.0
+
+    response = await client.get(
+        "/api/v1/desk/status", headers={**HEADERS, "Host": "127.0.1.1"}
+    )
+    assert response.status == 503
+    assert simulator.statistics["rest_failures"] == 1
+
+
+async def test_websocket_snapshot_and_command_ack(simulator_client: Any) -> None:
+    """A client receives the current state and acknowledgements of its commands."""
+    simulator, client = simulator_client
+    sio = socketio.AsyncClient()
+    events: dict[str, list[dict[str, Any]]] = {}
+    acknowledged = asyncio.Event()
+
+    @sio.on("*")
+    async def on_event(event: str, payload: dict[str, Any]) -> None:
+        events.setdefault(event, []).append(payload["data"])
+        if event == "command_ack":
+            acknowledged.set()
+
+    await sio.connect(
+        str(client.make_url("/")),
+        headers={"Host": "127.0.1.1"},
+        auth={"token": TOKEN},
+        transports=["websocket"],
+    )
+    try:
+        await sio.emit(
+            "command",
+            {
+                "type": "command.desk.height",
+                "id": "1",
+                "data": {"height": 76.0},
+            },
+        )
+        async with asyncio.timeout(5):
+            await acknowledged.wait()
+            while DeskState.from_dict(events["desk.state"][-1]["state"]).moving:
+                await asyncio.sleep(0.05)
+    finally:
+        await sio.disconnect()
+
+    assert len(events["display.state"]) == 3
+    assert events["authorization.state"][0]["policy_version"] == 1
+    assert events["command_ack"] == [{"id": "1", "status": "ok"}]
+    assert events["desk.state"][-1]["state"]["height"] == 76.0
+    assert simulator.statistics["commands"] == 1
+
+
+async def test_desk_reaches_a_fractional_target() -> None:
+    """A target between tenths of a centimeter ends the motion."""
+    simulator = NetlinkSimulator(SimulatorConfig(controllers=1, displays=1))
+    controller = next(iter(simulator.controllers.values()))
+    heights: list[float] = []
+    sleep = asyncio.sleep
+
+    async def emit(event: str, data: dict[str, Any]) -> None:
+        heights.append(data["state"]["height"])
+
+    async def next_step(_: float) -> None:
+        await sleep(0)
+
+    with patch("tests.simulator.asyncio.sleep", next_step):
+        async with asyncio.timeout(1):
+            await controller._async_move_desk(80.25, emit)
+
+    assert heights[-1] == 80.25
+    assert controller.desk["state"]["moving"] is False
@@ -0,0 +1,71 @@
+"""Tests for the immutable NetLink coordinator snapshot."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from custom_components.netlink.snapshot import DisplayStates, NetlinkSnapshot
+
+from .conftest import FakeNetlinkClient
+
+
+def test_display_update_shares_unchanged_branches() -> None:
+    """Replacing a display keeps every other branch of the snapshot."""
+    client = FakeNetlinkClient()
+    other = replace(client.display, bus=2)
+    snapshot = NetlinkSnapshot(
+        desk=client.desk,
+        browser=client.browser,
+        displays={"1": client.display, "2": other},
+    )
+
+    updated_display = replace(client.display, model="Updated")
+    updated = snapshot.with_display("1", updated_display)
+
+    assert updated.desk is snapshot.desk
+    assert updated.browser is snapshot.browser
+    assert updated.display("1") is updated_display
+    assert updated.display("2") is other
+    assert snapshot.display("1") is client.display
+    assert updated.display("3") is None
+    assert dict(updated.displays) == {"1": updated_display, "2": other}
+
+
+def test_display_layers_are_folded() -> None:
+    """Many single-display updates stay correct after compaction."""
+    client = FakeNetlinkClient()
+    displays = DisplayStates({"1": client.display})
+    expected = {"1": client.display}
+    for index in range(25):
+        display = replace(client.display, bus=index % 3)
+        displays = displays.set(str(index % 3), display)
+        expected[str(index % 3)] = display
+
+    assert dict(displays) == expected
+    assert len(displays) == len(expected)
+
+
+def test_display_iteration_flattens_once() -> None:
+    """Iterating or sizing a layered mapping reuses its flattened view."""
+    client = FakeNetlinkClient()
+    base = DisplayStates({"1": client.display, "2": replace(client.display, bus=2)})
+    displays = base.set("3", replace(client.display, bus=3))
+    assert displays._flat is None
+
+    assert len(displays) == 3
+    flat = displays._flat
+    assert list(displays) == ["1", "2", "3"]
+    assert len(displays) == 3
+
+    assert displays._flat is flat
+    assert base._flat is base._items
+
+
+def test_snapshot_is_immutable() -> None:
+    """Snapshots cannot be mutated in place."""
+    snapshot = NetlinkSnapshot()
+    with pytest.raises(AttributeError):
+        snapshot.desk = None  # type: ignore[misc]
+    assert snapshot.replace(desk=None).displays == {}